@@ -0,0 +1,89 @@
+"""
+Benchmark room image loading and memory against dungeon size.
+
+Builds a GameRoom per room of procedural dungeons, as GameWorld does, and
+compares loading each room's image itself, as RoomVisuals did, with the
+shared AssetManager. Reports setup time, decoded surfaces and their bytes,
+on SDL's headless video driver. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_assets.py
+"""
+
+import argparse
+import logging
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from dungeon_adventure.services.dungeon_generator import (  # noqa: E402
+    DungeonGenerator,
+)
+from dungeon_adventure.views.pygame.game.resource_manager import (  # noqa: E402
+    AssetManager,
+    default_manifest,
+    surface_bytes,
+)
+from dungeon_adventure.views.pygame.room.game_room import GameRoom  # noqa: E402
+
+
+def load_per_room(dungeon):
+    surfaces = []
+    for room in dungeon.rooms.values():
+        game_room = GameRoom(room)
+        surfaces.append(pygame.image.load(game_room.image_path).convert_alpha())
+    return surfaces
+
+
+def load_shared(dungeon):
+    surfaces = []
+    for room in dungeon.rooms.values():
+        game_room = GameRoom(room)
+        game_room.initialize()
+        surfaces.append(game_room.image)
+    return surfaces
+
+
+def measure(load, dungeon):
+    start = time.perf_counter()
+    surfaces = load(dungeon)
+    elapsed = time.perf_counter() - start
+    unique = {id(surface): surface for surface in surfaces}.values()
+    return elapsed, len(unique), sum(surface_bytes(surface) for surface in unique)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 20, 40])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    pygame.display.set_mode((480, 270))
+
+    AssetManager._default = AssetManager()
+    start = time.perf_counter()
+    preloaded = AssetManager.default().preload(default_manifest())
+    print(
+        f"preloaded {preloaded} assets in {(time.perf_counter() - start) * 1000:.1f} ms"
+        f", {AssetManager.default().total_bytes // 1024} KiB"
+    )
+    print(
+        f"{'rooms':>6}{'per room (ms)':>15}{'surfaces':>10}{'KiB':>8}"
+        f"{'shared (ms)':>13}{'surfaces':>10}{'KiB':>8}"
+    )
+    for size in args.sizes:
+        dungeon = DungeonGenerator.generate_procedural(size, size, seed=args.seed)
+        before = measure(load_per_room, dungeon)
+        after = measure(load_shared, dungeon)
+        print(
+            f"{len(dungeon.rooms):>6}"
+            f"{before[0] * 1000:>15.1f}{before[1]:>10}{before[2] // 1024:>8}"
+            f"{after[0] * 1000:>13.1f}{after[1]:>10}{after[2] // 1024:>8}"
+        )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark the vectorized Monte Carlo combat simulator against the game's rules.
+
+Plays hero versus monster fights with real Hero and Monster objects looping
+attempt_attack, then many more with simulate_fights, and compares the time per
+fight and the outcome statistics with the exact distribution from fight_outcome,
+timed on the first (uncached) and a repeated query. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_combat_sim.py
+"""
+
+import argparse
+import time
+
+from dungeon_adventure.data.content import HERO_SEED, MONSTER_SEED
+from dungeon_adventure.models.characters.hero import Hero
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.simulation import (
+    CombatantStats,
+    simulate_fights,
+    simulate_fights_scalar,
+)
+from dungeon_adventure.simulation.analytic import fight_outcome
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hero", default="Warrior")
+    parser.add_argument("--monster", default="Ogre")
+    parser.add_argument("--scalar-fights", type=int, default=10_000)
+    parser.add_argument("--fights", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    hero_row = next(row for row in HERO_SEED if row[0] == args.hero)
+    monster_row = next(row for row in MONSTER_SEED if row[0] == args.monster)
+    hero = CombatantStats.from_character(Hero(*hero_row[:7]))
+    monster = CombatantStats.from_character(Monster(*monster_row))
+
+    start = time.perf_counter()
+    scalar = simulate_fights_scalar(hero, monster, args.scalar_fights, args.seed)
+    scalar_time = (time.perf_counter() - start) / args.scalar_fights
+    start = time.perf_counter()
+    vectorized = simulate_fights(hero, monster, args.fights, args.seed)
+    vectorized_time = (time.perf_counter() - start) / args.fights
+
+    print(f"{hero.name} vs {monster.name}")
+    print(f"{'':<22}{'attempt_attack':>16}{'simulate_fights':>17}")
+    print(f"{'fights':<22}{scalar.fights:>16}{vectorized.fights:>17}")
+    print(f"{'us / fight':<22}{scalar_time * 1e6:>16.2f}{vectorized_time * 1e6:>17.3f}")
+    for key, value in scalar.summary().items():
+        if key != "fights":
+            print(f"{key:<22}{value:>16.3f}{vectorized.summary()[key]:>17.3f}")
+    print(f"speedup {scalar_time / vectorized_time:.0f}x")
+
+    start = time.perf_counter()
+    outcome = fight_outcome(hero, monster)
+    first_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(1000):
+        fight_outcome(hero, monster)
+    cached_time = (time.perf_counter() - start) / 1000
+    print()
+    print(f"fight_outcome, first query   {first_time * 1000:>9.2f} ms")
+    print(f"fight_outcome, cached query  {cached_time * 1e6:>9.2f} us")
+    print(f"{'win_rate':<22}{outcome.win_probability:>16.4f}")
+    print(f"{'stalemate_rate':<22}{outcome.stalemate_probability:>16.4f}")
+    print(f"{'mean_turns_to_kill':<22}{outcome.expected_turns_to_kill:>16.3f}")
+    print(f"{'mean_hp_remaining':<22}{outcome.expected_hp_remaining:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Measure content load latency through the shared data layer.
+
+Seeds temporary monster and hero databases, then times a cold load (opening
+the connection, checking the schema and reading every row), a warm reload on
+the shared connection and single-row lookups, next to the old pattern of
+opening a connection per lookup. Loads are compared with CONTENT_LOAD_BUDGET.
+Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_content_load.py
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from dungeon_adventure.data import CONTENT_LOAD_BUDGET, close_all, load_timings
+from dungeon_adventure.data.content import (
+    find_monster_row,
+    hero_database,
+    load_hero_rows,
+    load_monster_rows,
+    monster_database,
+    seed_heroes,
+    seed_monsters,
+)
+
+
+def legacy_lookup(path: str, name: str):
+    with sqlite3.connect(path) as conn:
+        row = conn.execute(
+            "SELECT * FROM monster_factory_new WHERE name = ? LIMIT 1", (name,)
+        ).fetchone()
+    conn.close()
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        monsters = os.path.join(workdir, "monster_factory_new.db")
+        heroes = os.path.join(workdir, "hero_factory.db")
+        seed_monsters(monster_database(monsters))
+        seed_heroes(hero_database(heroes))
+        close_all()
+
+        print(f"budget per load: {CONTENT_LOAD_BUDGET * 1000:.1f} ms")
+        load_monster_rows(monsters)
+        load_hero_rows(heroes)
+        for name in ("monster templates", "hero classes"):
+            print(f"cold {name:<18} {load_timings[name] * 1000:>8.3f} ms")
+        load_monster_rows(monsters)
+        load_hero_rows(heroes)
+        for name in ("monster templates", "hero classes"):
+            print(f"warm {name:<18} {load_timings[name] * 1000:>8.3f} ms")
+
+        names = ("Skeleton", "Gremlin", "Ogre")
+        start = time.perf_counter()
+        for index in range(args.lookups):
+            find_monster_row(names[index % 3], monsters)
+        shared = (time.perf_counter() - start) / args.lookups
+
+        start = time.perf_counter()
+        for index in range(args.lookups):
+            legacy_lookup(monsters, names[index % 3])
+        legacy = (time.perf_counter() - start) / args.lookups
+        close_all()
+
+    print(f"lookup, shared connection   {shared * 1e6:>8.1f} us")
+    print(f"lookup, connect per query   {legacy * 1e6:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark MainGameController frame times with full and dirty rect rendering.
+
+Runs the pygame game loop's update and draw on SDL's headless video driver
+with the player idle, then walking, in both render modes. Needs the game's
+resources, like the game itself. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_dirty_rects.py
+"""
+
+import argparse
+import logging
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from dungeon_adventure.enums.game_state import GameState  # noqa: E402
+from dungeon_adventure.game_model import GameModel  # noqa: E402
+from dungeon_adventure.models.player.player import Player  # noqa: E402
+from dungeon_adventure.services.dungeon_generator import (  # noqa: E402
+    DungeonGenerator,
+)
+from dungeon_adventure.views.pygame.game.game_screen import GameScreen  # noqa: E402
+from dungeon_adventure.views.pygame.game.game_world import GameWorld  # noqa: E402
+from dungeon_adventure.views.pygame.game.main_game_controller import (  # noqa: E402
+    MainGameController,
+)
+from dungeon_adventure.views.pygame.game.py_game_view import PyGameView  # noqa: E402
+from dungeon_adventure.views.pygame.services.debug_manager import (  # noqa: E402
+    DebugManager,
+)
+from dungeon_adventure.views.pygame.sprites.composite_player import (  # noqa: E402
+    CompositePlayer,
+)
+from dungeon_adventure.views.pygame.sprites.py_player import PyPlayer  # noqa: E402
+
+
+def make_controller(dirty_rects):
+    dungeon = DungeonGenerator.generate_default_dungeon()
+    player = Player("Player 1")
+    player.current_room = dungeon.get_room("Room 1 - Entrance Hall")
+    game_model = GameModel(player, dungeon)
+    py_player = PyPlayer()
+    game_world = GameWorld(game_model, CompositePlayer(player, py_player))
+    game_screen = GameScreen()
+    controller = MainGameController(
+        game_world,
+        game_screen,
+        PyGameView(game_screen.width, game_screen.height, game_screen.scale_factor),
+        DebugManager(),
+        dirty_rects=dirty_rects,
+    )
+    controller.initialize()
+    game_model.game_state = GameState.EXPLORING
+    return controller, py_player
+
+
+def frame(controller):
+    controller.handle_events()
+    controller.update(1 / 60)
+    if controller.dirty_rects:
+        controller.render_dirty()
+    else:
+        controller.draw()
+        pygame.display.flip()
+
+
+def timed(controller, frames, step=None):
+    frame(controller)
+    start = time.perf_counter()
+    for i in range(frames):
+        if step:
+            step(i)
+        frame(controller)
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    # Music plays on its own thread, not part of the frame
+    MainGameController.load_and_play_music = lambda self: None
+
+    print(f"{'mode':>8}{'idle (ms)':>11}{'walking (ms)':>14}{'CPU @60 idle':>14}")
+    for dirty_rects in (False, True):
+        controller, py_player = make_controller(dirty_rects)
+
+        def walk(i):
+            # Back and forth along the floor
+            py_player.rect.x += 1 if (i // 40) % 2 == 0 else -1
+
+        idle = timed(controller, args.frames)
+        walking = timed(controller, args.frames, walk)
+        mode = "dirty" if dirty_rects else "full"
+        print(f"{mode:>8}{idle * 1000:>11.3f}{walking * 1000:>14.3f}{idle * 60:>14.1%}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark procedural dungeon generation.
+
+Reports build time and traced memory against room count. Run from the
+repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_dungeon_generation.py
+"""
+
+import argparse
+import math
+import time
+import tracemalloc
+
+from dungeon_adventure.services.dungeon_generator import DungeonGenerator
+
+DENSITY = 0.6
+
+
+def grid_side(room_count: int) -> int:
+    """Side of the square grid that holds room_count rooms at DENSITY."""
+    return math.ceil(math.sqrt(room_count / DENSITY))
+
+
+def time_build(side: int, seed: int, monster_chance: float, repeats: int) -> float:
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        DungeonGenerator.generate_procedural(
+            side, side, seed=seed, density=DENSITY, monster_chance=monster_chance
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_memory(side: int, seed: int, monster_chance: float) -> tuple[int, int]:
+    tracemalloc.start()
+    dungeon = DungeonGenerator.generate_procedural(
+        side, side, seed=seed, density=DENSITY, monster_chance=monster_chance
+    )
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del dungeon
+    return retained, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rooms",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Approximate room counts to generate",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--monster-chance",
+        type=float,
+        default=0.0,
+        help="Chance of a room holding monsters (monster creation hits SQLite)",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'rooms':>9} {'grid':>9} {'build (s)':>10} {'retained MB':>12} "
+        f"{'peak MB':>9} {'B/room':>7}"
+    )
+    for target in args.rooms:
+        side = grid_side(target)
+        rooms = int(side * side * DENSITY)
+        seconds = time_build(side, args.seed, args.monster_chance, args.repeats)
+        retained, peak = measure_memory(side, args.seed, args.monster_chance)
+        print(
+            f"{rooms:>9} {f'{side}x{side}':>9} {seconds:>10.3f} "
+            f"{retained / 2**20:>12.1f} {peak / 2**20:>9.1f} {retained // rooms:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare the plain and grid-backed Dungeon storage.
+
+Reports retained memory per room and the cost of neighbour queries for both
+backends on the same procedural layout. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_dungeon_storage.py
+"""
+
+import argparse
+import math
+import time
+import tracemalloc
+
+from dungeon_adventure.enums.room_types import Direction
+from dungeon_adventure.services.dungeon_generator import DungeonGenerator
+
+DENSITY = 0.6
+
+
+def build(side: int, seed: int, grid: bool):
+    return DungeonGenerator.generate_procedural(
+        side, side, seed=seed, density=DENSITY, monster_chance=0, grid=grid
+    )
+
+
+def bytes_per_room(side: int, seed: int, grid: bool) -> float:
+    tracemalloc.start()
+    dungeon = build(side, seed, grid)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / len(dungeon.rooms)
+
+
+def neighbour_queries_per_second(dungeon) -> tuple[float, float]:
+    """Time get_open_gates and connections[direction] over every room."""
+    rooms = dungeon.get_rooms()
+
+    start = time.perf_counter()
+    for room in rooms:
+        room.get_open_gates()
+    gates = len(rooms) / (time.perf_counter() - start)
+
+    # Grid rooms make their connections view on first use
+    for room in rooms:
+        room.connections
+
+    start = time.perf_counter()
+    for room in rooms:
+        connections = room.connections
+        for direction in Direction:
+            connections[direction]
+    lookups = 4 * len(rooms) / (time.perf_counter() - start)
+    return gates, lookups
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rooms",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="Approximate room counts to generate",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(
+        f"{'rooms':>9} {'backend':>8} {'B/room':>7} "
+        f"{'open_gates/s':>13} {'lookups/s':>11}"
+    )
+    for target in args.rooms:
+        side = math.ceil(math.sqrt(target / DENSITY))
+        for grid in (False, True):
+            per_room = bytes_per_room(side, args.seed, grid)
+            dungeon = build(side, args.seed, grid)
+            gates, lookups = neighbour_queries_per_second(dungeon)
+            print(
+                f"{len(dungeon.rooms):>9} {'grid' if grid else 'plain':>8} "
+                f"{per_room:>7.0f} {gates:>13,.0f} {lookups:>11,.0f}"
+            )
+            del dungeon
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compare fog of war storage against the per-room flags and coordinate set.
+
+Explores a fraction of a square grid of rooms and reports the pickled size of
+the old representation (a set of coordinate tuples plus two flags per room)
+next to FogOfWar's run-length encoded bitmaps, and the time taken by a percent
+explored query. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_fog_of_war.py
+"""
+
+import argparse
+import math
+import pickle
+import random
+import time
+
+from dungeon_adventure.models.dungeon.fog_of_war import FogOfWar
+
+
+def bench(room_count: int, explored_fraction: float, seed: int) -> None:
+    side = math.isqrt(room_count)
+    rng = random.Random(seed)
+    # Explore a connected-ish blob from the corner, like a real playthrough
+    explored = [
+        index
+        for index in range(side * side)
+        if (index % side) ** 2 + (index // side) ** 2
+        < explored_fraction * side * side * 4 / math.pi
+        and rng.random() < 0.95
+    ]
+
+    coordinates = {(index % side, index // side) for index in explored}
+    flags = [(False, False)] * (side * side)
+    old_size = len(pickle.dumps((coordinates, flags)))
+
+    fog = FogOfWar(side * side)
+    for index in explored:
+        fog.set_explored(index)
+    new_size = len(pickle.dumps(fog))
+
+    start = time.perf_counter()
+    for _ in range(10_000):
+        fog.explored_count / fog.size
+    query = (time.perf_counter() - start) / 10_000
+
+    print(
+        f"{side * side:>9} {len(explored):>9} {old_size / 1024:>11.1f} "
+        f"{new_size / 1024:>11.1f} {query * 1e9:>11.0f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rooms",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Approximate room counts",
+    )
+    parser.add_argument("--explored", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(
+        f"{'rooms':>9} {'explored':>9} {'old (KiB)':>11} {'fog (KiB)':>11} "
+        f"{'query (ns)':>11}"
+    )
+    for room_count in args.rooms:
+        bench(room_count, args.explored, args.seed)
+
+
+if __name__ == "__main__":
+    main()
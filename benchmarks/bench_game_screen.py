@@ -0,0 +1,104 @@
+"""
+Benchmark GameScreen frame times: background caching and the upscale pipeline.
+
+Draws the background, scales the game surface to the window and flips, as
+MainGameController.draw does outside combat, on SDL's headless video driver.
+The per-frame path decodes and scales the PNG every frame, as GameScreen did.
+The upscale table compares allocating a scaled surface every frame, as
+blit_scaled did, with scaling into a preallocated surface and with SDL's
+SCALED mode. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_game_screen.py
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from dungeon_adventure.views.pygame.game.game_screen import (  # noqa: E402
+    BACKGROUND_PATH,
+    GameScreen,
+)
+
+
+def draw_background_per_frame(screen):
+    background = pygame.image.load(BACKGROUND_PATH).convert_alpha()
+    background = pygame.transform.scale(background, (screen.width, screen.height))
+    screen.get_game_surface().blit(background, (0, 0))
+
+
+def frame_time(screen, draw_background, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw_background(screen)
+        screen.blit_scaled()
+        screen.flip()
+    return (time.perf_counter() - start) / frames
+
+
+def blit_allocating(screen):
+    scaled = pygame.transform.scale(
+        screen.get_game_surface(),
+        (screen.width * screen.scale_factor, screen.height * screen.scale_factor),
+    )
+    screen.get_screen().blit(scaled, (0, 0))
+
+
+def upscale_time(screen, blit, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        blit(screen)
+        screen.flip()
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 3])
+    args = parser.parse_args()
+
+    screen = GameScreen()
+    screen.initialize()
+    print(
+        f"{'window':>10}{'per frame (ms)':>16}{'cached (ms)':>13}"
+        f"{'speedup':>9}{'budget used @60':>17}"
+    )
+    for scale in args.scales:
+        screen.set_resolution(screen.width, screen.height, scale)
+        before = frame_time(screen, draw_background_per_frame, args.frames)
+        after = frame_time(screen, GameScreen.draw_background, args.frames)
+        window = f"{screen.width * scale}x{screen.height * scale}"
+        print(
+            f"{window:>10}{before * 1000:>16.3f}{after * 1000:>13.3f}"
+            f"{before / after:>8.1f}x{after * 60:>16.1%}"
+        )
+
+    print()
+    print(
+        f"{'window':>10}{'allocating (ms)':>17}{'pipeline (ms)':>15}{'SCALED (ms)':>13}"
+    )
+    for scale in args.scales:
+        screen = GameScreen(scale_factor=scale)
+        screen.initialize()
+        before = upscale_time(screen, blit_allocating, args.frames)
+        after = upscale_time(screen, GameScreen.blit_scaled, args.frames)
+        sdl_screen = GameScreen(scale_factor=scale, sdl_scaling=True)
+        sdl_screen.initialize()
+        if sdl_screen.sdl_scaling:
+            sdl = upscale_time(sdl_screen, GameScreen.blit_scaled, args.frames)
+            sdl = f"{sdl * 1000:.3f}"
+        else:
+            # The video driver has no renderer for SCALED
+            sdl = "n/a"
+        window = f"{screen.width * scale}x{screen.height * scale}"
+        print(f"{window:>10}{before * 1000:>17.3f}{after * 1000:>15.3f}{sdl:>13}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
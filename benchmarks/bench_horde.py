@@ -0,0 +1,97 @@
+"""
+Benchmark horde encounters: setup, monster turns and kills against monster count.
+
+Compares the per-monster code paths CombatController used (attempt_attack for
+every monster, rebuilding the monster list after each kill) with a Horde.
+Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_horde.py
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from dungeon_adventure.models.characters.hero import Hero
+from dungeon_adventure.models.characters.monster_templates import MonsterTemplate
+from dungeon_adventure.models.combat.horde import HORDE_THRESHOLD, Horde, summarize
+from dungeon_adventure.models.combat.initiative import InitiativeScheduler
+
+TEMPLATES = (
+    MonsterTemplate("Skeleton", 100, 30, 50, 3, 80, 30, 30, 50, 25),
+    MonsterTemplate("Gremlin", 70, 15, 30, 5, 80, 40, 20, 40, 20),
+    MonsterTemplate("Ogre", 175, 30, 60, 2, 60, 10, 30, 60, 50),
+)
+
+
+def spawn(count, rng):
+    return [rng.choice(TEMPLATES).create() for _ in range(count)]
+
+
+def timed(function, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 2000])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    # Monsters log every heal roll, as in the game with logging configured
+    logging.basicConfig(level=logging.WARNING)
+
+    rng = random.Random(args.seed)
+    random.seed(args.seed)
+    print(
+        f"{'monsters':>9}{'setup (ms)':>12}{'turn, per monster (ms)':>24}"
+        f"{'turn, volley (ms)':>19}{'kill, rebuild (us)':>20}"
+        f"{'kill, horde (us)':>18}{'UI rows':>9}"
+    )
+    for size in args.sizes:
+        monsters = spawn(size, rng)
+        hero = Hero(max_hp=10**9)
+
+        def setup():
+            Horde(monsters)
+            InitiativeScheduler([hero] + monsters)
+
+        def per_monster_turn():
+            for monster in monsters:
+                if monster.is_alive:
+                    monster.attempt_attack(hero)
+                    if not hero.is_alive:
+                        return
+
+        horde = Horde(monsters)
+        # Bars the combat screen draws
+        rows = len(summarize(monsters)) if size >= HORDE_THRESHOLD else size
+        setup_time = timed(setup, 5)
+        per_monster = timed(per_monster_turn, args.turns)
+        volley = timed(lambda: horde.volley(hero, rng), args.turns)
+
+        # Kill a tenth of the monsters, one attack at a time
+        victims = monsters[:: max(size // 10, 1)][:10]
+        alive = list(monsters)
+        start = time.perf_counter()
+        for victim in victims:
+            alive = [monster for monster in alive if monster is not victim]
+        rebuild = (time.perf_counter() - start) / len(victims)
+        start = time.perf_counter()
+        for victim in victims:
+            horde.remove(victim)
+        removal = (time.perf_counter() - start) / len(victims)
+
+        print(
+            f"{size:>9}{setup_time * 1000:>12.2f}{per_monster * 1000:>24.3f}"
+            f"{volley * 1000:>19.3f}{rebuild * 1e6:>20.1f}"
+            f"{removal * 1e6:>18.2f}{rows:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark turn order construction, mid-fight changes and the ATB timeline.
+
+Compares the recursive list insertion CombatController used (one recursion
+level per list position, so big encounters also hit the recursion limit) with
+the heap-based InitiativeScheduler. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_initiative.py
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from dungeon_adventure.models.characters.hero import Hero
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.models.combat.initiative import InitiativeScheduler
+
+
+def insert_recursive(turn_order, character, index: int = 0):
+    if index >= len(turn_order):
+        turn_order.append(character)
+    elif character.attack_speed > turn_order[index].attack_speed:
+        turn_order.insert(index, character)
+    else:
+        insert_recursive(turn_order, character, index + 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 2000])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * max(args.sizes)))
+    print(
+        f"{'monsters':>9}{'recursive (ms)':>16}{'scheduler (ms)':>16}"
+        f"{'add+remove (us)':>17}{'ATB action (us)':>17}"
+    )
+    for size in args.sizes:
+        characters = [Hero()] + [
+            Monster(name=f"M{i}", attack_speed=rng.randint(1, 8)) for i in range(size)
+        ]
+        start = time.perf_counter()
+        turn_order = []
+        for character in characters:
+            insert_recursive(turn_order, character)
+        recursive = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scheduler = InitiativeScheduler(characters)
+        scheduler.order()
+        built = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for character in characters[1:]:
+            scheduler.remove(character)
+            scheduler.add(character)
+        churn = (time.perf_counter() - start) / size
+
+        start = time.perf_counter()
+        for _ in range(10_000):
+            scheduler.next_actor()
+        action = (time.perf_counter() - start) / 10_000
+        print(
+            f"{size:>9}{recursive * 1000:>16.2f}{built * 1000:>16.2f}"
+            f"{churn * 1e6:>17.2f}{action * 1e6:>17.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark inventory add, remove and lookups with many distinct stacks.
+
+Compares the old scans (summing every stack for the weight check, lower-casing
+every name for a lookup, filtering every stack by type) with the running total
+and the name and type indexes the Inventory keeps now, then loots a pile of
+identical potions one at a time and with one bulk add. Run from the repository
+root:
+
+    PYTHONPATH=src:. python benchmarks/bench_inventory.py
+"""
+
+import argparse
+import random
+import time
+
+from dungeon_adventure.enums.item_types import ItemType, PotionType, WeaponType
+from dungeon_adventure.models.inventory.inventory import Inventory
+from dungeon_adventure.services.item_factory import HEALING_POTION, ItemFactory
+
+
+def scan_weight(inventory: Inventory) -> float:
+    return sum(item.weight * quantity for item, quantity in inventory.get_all_items())
+
+
+def scan_name(inventory: Inventory, name: str):
+    for item, _ in inventory.get_all_items():
+        if item.name.lower() == name.lower():
+            return item
+    return None
+
+
+def scan_type(inventory: Inventory, item_type: ItemType):
+    return [
+        (item, quantity)
+        for item, quantity in inventory.get_all_items()
+        if item.item_type == item_type
+    ]
+
+
+def per_call(function, arguments) -> float:
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    return (time.perf_counter() - start) / len(arguments)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stacks", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--loot", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    factory = ItemFactory()
+    items = []
+    for i in range(args.stacks):
+        if i % 10 == 0:
+            items.append(
+                factory.create_weapon(f"Blade {i}", WeaponType.SWORD, 5, 1, 50)
+            )
+        else:
+            items.append(
+                factory.create_potion(f"Potion {i}", PotionType.HEALING, 10, 0.5)
+            )
+
+    inventory = Inventory(weight_limit=1e9, flush_interval=None)
+    start = time.perf_counter()
+    for item in items:
+        inventory.add_item(item)
+    add_all = time.perf_counter() - start
+
+    # The old add_item summed every stack before each add
+    old_add = per_call(lambda item: scan_weight(inventory), items[: args.lookups])
+    churn = [rng.choice(items) for _ in range(args.lookups)]
+
+    def remove_and_add(item):
+        inventory.remove_item(item)
+        inventory.add_item(item)
+
+    new_churn = per_call(remove_and_add, churn) / 2
+    names = [rng.choice(items).name.upper() for _ in range(args.lookups)]
+    old_name = per_call(lambda name: scan_name(inventory, name), names)
+    new_name = per_call(inventory.get_item_by_name, names)
+    types = [ItemType.WEAPON, ItemType.PILLAR] * (args.lookups // 2)
+    old_type = per_call(lambda item_type: scan_type(inventory, item_type), types)
+    new_type = per_call(inventory.get_items_by_type, types)
+
+    print(f"{args.stacks} distinct stacks, added in {add_all * 1000:.1f} ms")
+    print(f"{'operation':<22}{'scan (us)':>12}{'indexed (us)':>14}")
+    print(f"{'add / remove':<22}{old_add * 1e6:>12.2f}{new_churn * 1e6:>14.2f}")
+    print(f"{'lookup by name':<22}{old_name * 1e6:>12.2f}{new_name * 1e6:>14.2f}")
+    print(f"{'stacks by type':<22}{old_type * 1e6:>12.2f}{new_type * 1e6:>14.2f}")
+
+    pile = [factory.create(HEALING_POTION) for _ in range(args.loot)]
+    looter = Inventory(weight_limit=1e9, flush_interval=None)
+    start = time.perf_counter()
+    for potion in pile:
+        looter.add_item(potion)
+    one_by_one = time.perf_counter() - start
+    stacks = looter.stack_count
+    looter = Inventory(weight_limit=1e9, flush_interval=None)
+    start = time.perf_counter()
+    looter.add_items(pile[0], len(pile))
+    bulk = time.perf_counter() - start
+    print(f"loot {args.loot} potions, one at a time  {one_by_one * 1000:>9.2f} ms")
+    print(f"loot {args.loot} potions, add_items      {bulk * 1000:>9.3f} ms")
+    print(f"stacks held after looting: {stacks}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark inventory persistence with write-behind batching.
+
+Times creating inventories (which used to open a SQLite connection each) and a
+burst of pickups and drops against a file database, committing every change
+as the old InventoryDatabase did versus queueing them and flushing at the
+interval. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_inventory_persistence.py
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from dungeon_adventure.data import close_all
+from dungeon_adventure.enums.item_types import PotionType
+from dungeon_adventure.models.inventory.inventory import Inventory
+from dungeon_adventure.services.item_factory import ItemFactory
+
+
+def commit_per_change(path: str, items, operations: int) -> float:
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS items "
+        "(id INTEGER PRIMARY KEY, item_name TEXT, quantity INTEGER)"
+    )
+    start = time.perf_counter()
+    for index in range(operations):
+        item = items[index % len(items)]
+        connection.execute(
+            "INSERT INTO items (item_name, quantity) VALUES (?, ?)", (item.name, 1)
+        )
+        connection.commit()
+    elapsed = time.perf_counter() - start
+    connection.close()
+    return elapsed
+
+
+def write_behind(path: str, items, operations: int, interval: float) -> float:
+    inventory = Inventory(weight_limit=1e9, database_path=path, flush_interval=interval)
+    start = time.perf_counter()
+    for index in range(operations):
+        item = items[(index // 2) % len(items)]
+        if index % 2:
+            inventory.remove_item(item)
+        else:
+            inventory.add_item(item)
+    inventory.flush()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--operations", type=int, default=5_000)
+    parser.add_argument("--players", type=int, default=1_000)
+    parser.add_argument("--interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    connections = [sqlite3.connect("") for _ in range(args.players)]
+    old_create = (time.perf_counter() - start) / args.players
+    for connection in connections:
+        connection.close()
+    start = time.perf_counter()
+    [Inventory() for _ in range(args.players)]
+    new_create = (time.perf_counter() - start) / args.players
+    print(f"create inventory, connect each   {old_create * 1e6:>9.1f} us")
+    print(f"create inventory, lazy           {new_create * 1e6:>9.1f} us")
+
+    factory = ItemFactory()
+    items = [
+        factory.create_potion(f"Potion {i}", PotionType.HEALING, 10, 1)
+        for i in range(20)
+    ]
+    with tempfile.TemporaryDirectory() as workdir:
+        old = commit_per_change(os.path.join(workdir, "old.db"), items, args.operations)
+        new = write_behind(
+            os.path.join(workdir, "new.db"), items, args.operations, args.interval
+        )
+        close_all()
+    print(f"{args.operations} changes, commit each   {old * 1000:>9.1f} ms")
+    print(f"{args.operations} changes, write-behind  {new * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark memory and creation time of items sharing flyweight definitions.
+
+Creates many healing potions and swords the old way (every item carrying its
+own name, description, weight and type in its instance dict, emulated here
+with a plain class), through the ItemFactory constructors, from a shared
+ItemDefinition, and by cloning. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_items.py
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from dungeon_adventure.enums.item_types import ItemType, PotionType, WeaponType
+from dungeon_adventure.services.item_factory import HEALING_POTION, ItemFactory
+
+
+class DictPotion:
+    """The fields the old HealingPotion stored on every instance."""
+
+    def __init__(self, item_id, name, heal_amount, weight):
+        self._id = item_id
+        self._name = name
+        self._description = f"Heals for {heal_amount} HP"
+        self._weight = weight
+        self._item_type = ItemType.POTION
+        self._potion_type = PotionType.HEALING
+        self._heal_amount = heal_amount
+
+
+def measure(create, count: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = [create(index) for index in range(count)]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50_000)
+    args = parser.parse_args()
+
+    factory = ItemFactory()
+    sword = factory.create_weapon("Rusty Sword", WeaponType.SWORD, 10, 7, 100)
+    cases = [
+        (
+            "dict per item",
+            lambda i: DictPotion(f"ITEM_{i:04d}", "Healing Potion", 300, 2),
+        ),
+        (
+            "create_potion",
+            lambda i: factory.create_potion(
+                "Healing Potion", PotionType.HEALING, 300, 2
+            ),
+        ),
+        ("create(definition)", lambda i: factory.create(HEALING_POTION)),
+        (
+            "create_weapon",
+            lambda i: factory.create_weapon(
+                "Rusty Sword", WeaponType.SWORD, 10, 7, 100
+            ),
+        ),
+        ("clone weapon", lambda i: factory.clone(sword)),
+    ]
+    print(f"{args.items} items")
+    print(f"{'method':<22}{'us / item':>11}{'bytes / item':>14}")
+    for label, create in cases:
+        elapsed, size = measure(create, args.items)
+        print(
+            f"{label:<22}{elapsed / args.items * 1e6:>11.2f}{size / args.items:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark the MapVisualizer coordinate layout pass.
+
+Times MapVisualizer.initialize on square procedural dungeons and on single
+corridors, which are the worst case for a recursive walk. Run from the
+repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_map_layout.py
+"""
+
+import argparse
+import math
+import time
+
+from dungeon_adventure.services.dungeon_generator import DungeonGenerator
+from dungeon_adventure.views.console.map_visualizer import MapVisualizer
+
+DENSITY = 0.6
+
+
+def square(room_count: int, seed: int):
+    side = math.ceil(math.sqrt(room_count / DENSITY))
+    return DungeonGenerator.generate_procedural(
+        side, side, seed=seed, density=DENSITY, monster_chance=0, pit_chance=0
+    )
+
+
+def corridor(room_count: int, seed: int):
+    return DungeonGenerator.generate_procedural(
+        room_count, 1, seed=seed, density=1, monster_chance=0, pit_chance=0
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rooms",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Approximate room counts to lay out",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(
+        f"{'shape':>9} {'rooms':>9} {'build (s)':>10} {'layout (s)':>11} {'us/room':>8}"
+    )
+    for room_count in args.rooms:
+        for shape, build in (("square", square), ("corridor", corridor)):
+            start = time.perf_counter()
+            dungeon = build(room_count, args.seed)
+            built = time.perf_counter() - start
+
+            map_visualizer = MapVisualizer(dungeon)
+            start = time.perf_counter()
+            map_visualizer.initialize()
+            layout = time.perf_counter() - start
+            assert len(map_visualizer.grid) == len(dungeon.rooms)
+
+            rooms = len(dungeon.rooms)
+            print(
+                f"{shape:>9} {rooms:>9} {built:>10.2f} {layout:>11.2f} "
+                f"{layout / rooms * 1e6:>8.2f}"
+            )
+            del dungeon, map_visualizer
+
+
+if __name__ == "__main__":
+    main()
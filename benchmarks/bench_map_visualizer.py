@@ -0,0 +1,105 @@
+"""
+Benchmark the per-move cost of the console map.
+
+Walks the player through a procedural dungeon and times what a console move
+costs the MapVisualizer: update_explored_rooms followed by generate_map. The
+old linear room lookup is timed next to the reverse index, and a full redraw of
+the map (invalidate before generate_map) next to the incremental one. Run
+from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_map_visualizer.py
+"""
+
+import argparse
+import math
+import random
+import time
+
+from dungeon_adventure.services.dungeon_generator import (
+    ENTRANCE_ROOM_NAME,
+    DungeonGenerator,
+)
+from dungeon_adventure.views.console.map_visualizer import MapVisualizer
+
+DENSITY = 0.6
+
+
+def random_walk(dungeon, moves: int, seed: int):
+    rng = random.Random(seed)
+    room = dungeon.get_room(ENTRANCE_ROOM_NAME)
+    path = [room]
+    for _ in range(moves):
+        _, room = rng.choice(room.get_open_gates())
+        path.append(room)
+    return path
+
+
+def linear_lookup(map_visualizer: MapVisualizer, current_room):
+    return next(
+        (c for c, room in map_visualizer.grid.items() if room == current_room), None
+    )
+
+
+def bench(room_count: int, moves: int, seed: int) -> None:
+    side = math.ceil(math.sqrt(room_count / DENSITY))
+    dungeon = DungeonGenerator.generate_procedural(
+        side, side, seed=seed, density=DENSITY, monster_chance=0
+    )
+    map_visualizer = MapVisualizer(dungeon)
+    map_visualizer.initialize()
+    path = random_walk(dungeon, moves, seed)
+
+    start = time.perf_counter()
+    for room in path:
+        map_visualizer.room_coordinates.get(room)
+    indexed = (time.perf_counter() - start) / len(path)
+
+    sample = path[:: max(1, len(path) // 20)]
+    start = time.perf_counter()
+    for room in sample:
+        linear_lookup(map_visualizer, room)
+    scanned = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    for room in path:
+        room.explore()
+        map_visualizer.update_explored_rooms(room)
+        map_visualizer.generate_map(room)
+    per_move = (time.perf_counter() - start) / len(path)
+
+    start = time.perf_counter()
+    for room in sample:
+        map_visualizer.invalidate()
+        map_visualizer.generate_map(room)
+    redraw = (time.perf_counter() - start) / len(sample)
+
+    print(
+        f"{len(dungeon.rooms):>9} {len(map_visualizer.explored_rooms):>9} "
+        f"{indexed * 1e6:>11.2f} {scanned * 1e6:>11.1f} {per_move * 1e6:>12.1f} "
+        f"{redraw * 1e6:>12.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rooms",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Approximate room counts to generate",
+    )
+    parser.add_argument("--moves", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(
+        f"{'rooms':>9} {'explored':>9} {'index (us)':>11} {'scan (us)':>11} "
+        f"{'move (us)':>12} {'redraw (us)':>12}"
+    )
+    for room_count in args.rooms:
+        bench(room_count, args.moves, args.seed)
+
+
+if __name__ == "__main__":
+    main()
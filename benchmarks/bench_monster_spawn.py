@@ -0,0 +1,98 @@
+"""
+Benchmark monster spawning from the template registry against the old path.
+
+The old path opened the monster database twice per spawn: once to look the row
+up and once in Monster.__init__ to create the table. The registry reads every
+row once and builds monsters in memory, one at a time with create_random or in
+bulk with spawn_batch. Runs in a temporary directory seeded with the sample
+monsters. Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_monster_spawn.py
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.data.content import (
+    MONSTER_DB_PATH,
+    MONSTER_MIGRATIONS,
+    monster_database,
+    seed_monsters,
+)
+from dungeon_adventure.models.characters.monster_templates import (
+    RANDOM_MONSTER_TYPES,
+    MonsterTemplateRegistry,
+)
+
+
+def legacy_spawn(rng: random.Random) -> Monster:
+    """What generate_random_monster did before the registry."""
+    name = rng.choice(RANDOM_MONSTER_TYPES)
+    with sqlite3.connect(MONSTER_DB_PATH) as conn:
+        row = conn.execute(
+            "SELECT * FROM monster_factory_new WHERE name = ? LIMIT 1", (name,)
+        ).fetchone()
+    conn.close()
+    monster = Monster(str(row[1]), *(int(value) for value in row[2:]))
+    # Monster.__init__ used to open the database again to create the table
+    with sqlite3.connect(MONSTER_DB_PATH) as conn:
+        conn.execute(MONSTER_MIGRATIONS[0])
+    conn.close()
+    return monster
+
+
+def bench(count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(count):
+            legacy_spawn(rng)
+        legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    registry = MonsterTemplateRegistry()
+    monsters = [registry.create_random(rng) for _ in range(count)]
+    cached = time.perf_counter() - start
+
+    del monsters
+    start = time.perf_counter()
+    registry.spawn_batch(count, rng=rng)
+    batched = time.perf_counter() - start
+
+    print(
+        f"{count:>9} {count / legacy:>14,.0f} {count / cached:>14,.0f} "
+        f"{count / batched:>14,.0f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            seed_monsters(monster_database())
+            assert os.path.exists(MONSTER_DB_PATH)
+            print(
+                f"{'monsters':>9} {'old (spawn/s)':>14} {'single (/s)':>14} "
+                f"{'batch (/s)':>14}"
+            )
+            for count in args.count:
+                bench(count, args.seed)
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
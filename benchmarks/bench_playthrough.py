@@ -0,0 +1,61 @@
+"""
+Benchmark full headless playthroughs: runs per minute against worker count.
+
+Plays ExplorerPolicy games through the game's controllers with
+simulate_playthroughs and prints the throughput and the per-seed reports.
+Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_playthrough.py
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from dungeon_adventure.simulation import simulate_playthroughs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seeds", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=250)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--height", type=int, default=15)
+    args = parser.parse_args()
+    # Simulated games log every roll at INFO
+    logging.disable(logging.INFO)
+    worker_counts = args.workers or sorted({1, os.cpu_count() or 1})
+    seeds = range(args.seeds)
+    monster_db = os.path.join(tempfile.mkdtemp(), "monsters.db")
+
+    print(f"{'workers':>8}{'runs':>7}{'time (s)':>10}{'runs/min':>10}")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        reports = simulate_playthroughs(
+            seeds,
+            args.runs,
+            workers=workers,
+            monster_db_path=monster_db,
+            width=args.width,
+            height=args.height,
+        )
+        elapsed = time.perf_counter() - start
+        runs = args.seeds * args.runs
+        print(f"{workers:>8}{runs:>7}{elapsed:>10.2f}{runs / elapsed * 60:>10.0f}")
+
+    print()
+    print(f"{'seed':>5}{'won':>7}{'died':>7}{'pit dmg':>9}  deadliest room")
+    for report in reports.values():
+        deadliest = next(iter(report.deaths_by_room.items()), ("-", 0))
+        print(
+            f"{report.dungeon_seed:>5}{report.completion_rate:>7.0%}"
+            f"{report.death_rate:>7.0%}{report.mean_pit_damage:>9.1f}"
+            f"  {deadliest[0]} ({deadliest[1]})"
+        )
+
+
+if __name__ == "__main__":
+    main()
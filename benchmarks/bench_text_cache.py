@@ -0,0 +1,128 @@
+"""
+Benchmark UI text rendering with and without the shared TextCache.
+
+Draws full frames of the pygame game, as MainGameController.draw does, with
+the panels of a few screens open, on SDL's headless video driver. Uncached
+rasterizes every label every frame, as the UI components did. Debug overlays
+change every frame and bypass the cache, so the debug screen is left out by
+default. Needs the game's resources, like the game itself. Run from the
+repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_text_cache.py
+"""
+
+import argparse
+import logging
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from dungeon_adventure.enums.game_state import GameState  # noqa: E402
+from dungeon_adventure.game_model import GameModel  # noqa: E402
+from dungeon_adventure.models.player.player import Player  # noqa: E402
+from dungeon_adventure.services.dungeon_generator import (  # noqa: E402
+    DungeonGenerator,
+)
+from dungeon_adventure.views.pygame.game.game_screen import GameScreen  # noqa: E402
+from dungeon_adventure.views.pygame.game.game_world import GameWorld  # noqa: E402
+from dungeon_adventure.views.pygame.game.main_game_controller import (  # noqa: E402
+    MainGameController,
+)
+from dungeon_adventure.views.pygame.game.py_game_view import PyGameView  # noqa: E402
+from dungeon_adventure.views.pygame.game.resource_manager import (  # noqa: E402
+    TextCache,
+)
+from dungeon_adventure.views.pygame.services.debug_manager import (  # noqa: E402
+    DebugManager,
+)
+from dungeon_adventure.views.pygame.sprites.composite_player import (  # noqa: E402
+    CompositePlayer,
+)
+from dungeon_adventure.views.pygame.sprites.py_player import PyPlayer  # noqa: E402
+
+
+class UncachedText(TextCache):
+    def render(self, font, text, antialias, color):
+        self.misses += 1
+        return font.render(text, antialias, color)
+
+
+def open_panels(controller, screen):
+    view = controller.pygame_view
+    view.player_message_visible = screen == "message"
+    view._inventory_visible = screen == "inventory"
+    controller.debug_manager.debug_mode = screen == "debug"
+
+
+def make_controller():
+    dungeon = DungeonGenerator.generate_default_dungeon()
+    player = Player("Player 1")
+    player.current_room = dungeon.get_room("Room 1 - Entrance Hall")
+    game_model = GameModel(player, dungeon)
+    game_world = GameWorld(game_model, CompositePlayer(player, PyPlayer()))
+    game_screen = GameScreen()
+    controller = MainGameController(
+        game_world,
+        game_screen,
+        PyGameView(game_screen.width, game_screen.height, game_screen.scale_factor),
+        DebugManager(),
+    )
+    controller.initialize()
+    game_model.game_state = GameState.EXPLORING
+    controller.pygame_view.player_message_display.set_message(
+        "There is a chest in the corner."
+    )
+    return controller
+
+
+def frame_time(controller, frames):
+    controller.draw()
+    start = time.perf_counter()
+    for _ in range(frames):
+        controller.update(1 / 60)
+        controller.draw()
+        pygame.display.flip()
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument(
+        "--screens", nargs="+", default=["explore", "message", "inventory"]
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    # Music plays on its own thread, not part of the frame
+    MainGameController.load_and_play_music = lambda self: None
+
+    results = {}
+    for text_cache in (UncachedText(), TextCache()):
+        # Components take their fonts from the default cache when built
+        TextCache._default = text_cache
+        controller = make_controller()
+        for screen in args.screens:
+            open_panels(controller, screen)
+            misses = text_cache.misses
+            elapsed = frame_time(controller, args.frames)
+            rendered = (text_cache.misses - misses) / (args.frames + 1)
+            results.setdefault(screen, []).append((elapsed, rendered))
+
+    print(
+        f"{'screen':>10}{'uncached (ms)':>15}{'labels/frame':>14}"
+        f"{'cached (ms)':>13}{'labels/frame':>14}{'speedup':>9}"
+    )
+    for screen, ((before, before_rendered), (after, after_rendered)) in results.items():
+        print(
+            f"{screen:>10}{before * 1000:>15.3f}{before_rendered:>14.1f}"
+            f"{after * 1000:>13.3f}{after_rendered:>14.1f}{before / after:>8.2f}x"
+        )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,34 @@
-from typing import List
+from typing import List, Optional
 
 from dungeon_adventure.enums.combat_state import CombatState
 from dungeon_adventure.enums.game_state import GameState
-from dungeon_adventure.exceptions.combat import (
-    CharacterNotInCombatError,
-    CombatError,
-    InvalidCombatStateError,
-)
+from dungeon_adventure.exceptions.combat import CombatError, InvalidCombatStateError
 from dungeon_adventure.exceptions.game_logic import GameStateError
 from dungeon_adventure.exceptions.player import InvalidPlayerActionError
 from dungeon_adventure.game_model import GameModel
 from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
 from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.models.combat.horde import Horde
+from dungeon_adventure.models.combat.initiative import InitiativeScheduler
 from dungeon_adventure.models.player.player import Player
 from dungeon_adventure.views.view import View
 
 
 class CombatController:
-    def __init__(self, game_model: GameModel, view: View):
+    def __init__(self, game_model: GameModel, view: View, timeline: bool = False):
+        """
+        :param timeline: Take turns from the scheduler's speed timeline, where
+            faster characters act more often and each monster acts on its own
+            turn. By default the player and then every monster act in rounds.
+        """
         self.game_model = game_model
         self.view = view
         self.player: Player = game_model.player
-        self.monsters: List[Monster] = []
-        self.turn_order: List[DungeonCharacter] = []
+        self.horde = Horde()
+        self.scheduler = InitiativeScheduler()
+        self.timeline = timeline
+        # The monster whose turn it is, on the timeline
+        self.acting_monster: Optional[Monster] = None
         self.combat_state: CombatState = CombatState.WAITING
 
     def initiate_combat(self):
@@ -30,34 +36,49 @@ class CombatController:
         self.check_empty_monsters()
         self.game_model.game_state = GameState.IN_COMBAT
         self.determine_turn_order()
-        self.combat_state = CombatState.PLAYER_TURN  # Start with player's turn
+        # Start with player's turn
+        self.combat_state = self.pass_turn(CombatState.PLAYER_TURN)
         self.start_combat()
 
     def check_empty_monsters(self):
         if not self.monsters:
             raise CombatError("Cannot initiate combat without monsters")
 
+    @property
+    def monsters(self) -> List[Monster]:
+        return self.horde.alive
+
+    @monsters.setter
+    def monsters(self, monsters: List[Monster]):
+        self.horde = Horde(monsters)
+
+    @property
+    def turn_order(self) -> List[DungeonCharacter]:
+        return self.scheduler.order()
+
     def determine_turn_order(self):
-        self.turn_order = []
-        all_characters = self.monsters + [self.player.hero]
-        for character in all_characters:
-            self._insert_into_turn_order(character)
-
-    def _insert_into_turn_order(self, character, index: int = 0):
-        if not isinstance(character, DungeonCharacter):
-            raise CharacterNotInCombatError(f"{character} is not a valid combat entity")
-
-        if index >= len(self.turn_order):
-            self.turn_order.append(character)
-        elif character.attack_speed > self.turn_order[index].attack_speed:
-            self.turn_order.insert(index, character)
-        else:
-            self._insert_into_turn_order(character, index + 1)
+        self.scheduler = InitiativeScheduler()
+        # The player starts the fight, so the hero acts first on the timeline too
+        self.scheduler.add(self.player.hero, ready=True)
+        for monster in self.monsters:
+            self.scheduler.add(monster)
+
+    def pass_turn(self, next_state: CombatState) -> CombatState:
+        """
+        The state of the next turn: next_state in rounds, on the timeline the
+        turn of whoever acts next.
+        """
+        if not self.timeline or self.game_model.game_state != GameState.IN_COMBAT:
+            return next_state
+        actor = self.scheduler.next_actor()
+        if actor is self.player.hero:
+            self.acting_monster = None
+            return CombatState.PLAYER_TURN
+        self.acting_monster = actor
+        return CombatState.MONSTER_TURN
 
     def add_character(self, character: DungeonCharacter):
-        if not isinstance(character, DungeonCharacter):
-            raise CharacterNotInCombatError(f"{character} is not a valid combat entity")
-        self._insert_into_turn_order(character)
+        self.scheduler.add(character)
 
     # TODO: Make this method smaller by extraction into helper methods with descriptive names
     def start_combat(self):
@@ -87,18 +108,22 @@ class CombatController:
             raise InvalidCombatStateError(f"Invalid combat state: {self.combat_state}")
 
     def check_combat_end(self, target: Monster):
-        # Remove dead monsters
-        self.monsters = [monster for monster in self.monsters if monster.is_alive]
-        if not target.is_alive:
+        if not self.horde.refresh(target):
+            self.scheduler.discard(target)
             self.view.display_message(f"{target.name} has been defeated!")
             self.player.hero.gain_xp(target.xp_reward)
             self.view.display_xp_gained(target.xp_reward)
         if not self.monsters:
+            # Leave no dead monsters behind to fight again on re-entry
+            self.player.current_room.monsters = []
             self.end_combat("All monsters defeated!")
         elif not self.player.hero.is_alive:
-            self.end_combat("Player has been defeated!")
-            self.game_model.set_game_over(True)
-        self.combat_state = CombatState.MONSTER_TURN
+            self.player_defeated()
+        self.combat_state = self.pass_turn(CombatState.MONSTER_TURN)
+
+    def player_defeated(self):
+        self.end_combat("Player has been defeated!")
+        self.game_model.set_game_over(True)
 
     def end_combat(self, message):
         self.view.display_message(message)
@@ -138,19 +163,41 @@ class CombatController:
         self.view.display_xp_gained(xp_amount)
 
     def monster_turn(self):
-        for monster in self.monsters:
+        if self.timeline:
+            monsters = [self.acting_monster]
+        elif self.horde.is_horde:
+            self.horde_turn()
+            return
+        else:
+            monsters = self.monsters
+        for monster in monsters:
             if monster.is_alive:
                 damage = monster.attempt_attack(self.player.hero)
+                self.horde.refresh(monster)  # It may have healed
                 self.view.display_message(
                     f"{monster.name} deals {damage} damage to you!"
                 )
                 if not self.player.hero.is_alive:
-                    return  # End the monster turn if the player is defeated
-        self.combat_state = CombatState.PLAYER_TURN
+                    # End the monster turn, and the fight, if the player is defeated
+                    self.player_defeated()
+                    return
+        self.combat_state = self.pass_turn(CombatState.PLAYER_TURN)
+
+    def horde_turn(self):
+        volley = self.horde.volley(self.player.hero)
+        self.view.display_message(
+            f"{volley.hits} of {volley.attacks} monsters hit you "
+            f"for {volley.damage} damage!"
+        )
+        if self.player.hero.is_alive:
+            self.combat_state = CombatState.PLAYER_TURN
+        else:
+            self.player_defeated()
 
     def reset_combat(self):
         self.combat_state = CombatState.WAITING
         self.game_model.game_state = GameState.EXPLORING
-        self.monsters = []
-        self.turn_order = []
+        self.horde.clear()
+        self.scheduler.clear()
+        self.acting_monster = None
         self.view.display_message("Combat has been reset.")
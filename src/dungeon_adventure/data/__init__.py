@@ -0,0 +1,17 @@
+from dungeon_adventure.data.database import (
+    CONTENT_LOAD_BUDGET,
+    Database,
+    close_all,
+    content_load,
+    get_database,
+    load_timings,
+)
+
+__all__ = [
+    "CONTENT_LOAD_BUDGET",
+    "Database",
+    "close_all",
+    "content_load",
+    "get_database",
+    "load_timings",
+]
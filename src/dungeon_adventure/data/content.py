@@ -0,0 +1,165 @@
+from typing import List, Optional, Sequence
+
+from dungeon_adventure.data.database import Database, content_load, get_database
+
+MONSTER_DB_PATH = "monster_factory_new.db"
+HERO_DB_PATH = "hero_factory.db"
+
+MONSTER_COLUMNS = (
+    "name",
+    "max_hp",
+    "base_min_damage",
+    "base_max_damage",
+    "attack_speed",
+    "base_hit_chance",
+    "heal_chance",
+    "min_heal",
+    "max_heal",
+    "xp_reward",
+)
+
+HERO_COLUMNS = (
+    "name",
+    "max_hp",
+    "base_min_damage",
+    "base_max_damage",
+    "attack_speed",
+    "base_hit_chance",
+    "block_chance",
+    "level",
+    "xp",
+    "xp_to_next_level",
+)
+
+# migrations[i] takes a database from schema version i to i + 1. Tables made
+# before versioning already match version 1, hence IF NOT EXISTS.
+MONSTER_MIGRATIONS = (
+    """
+    CREATE TABLE IF NOT EXISTS monster_factory_new (
+        id INTEGER PRIMARY KEY,
+        name TEXT,
+        max_hp INTEGER,
+        base_min_damage INTEGER,
+        base_max_damage INTEGER,
+        attack_speed INTEGER,
+        base_hit_chance INTEGER,
+        heal_chance INTEGER,
+        min_heal INTEGER,
+        max_heal INTEGER,
+        xp_reward INTEGER
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS monster_factory_new_name ON monster_factory_new (name)",
+)
+
+HERO_MIGRATIONS = (
+    """
+    CREATE TABLE IF NOT EXISTS hero_factory (
+        name TEXT,
+        max_hp INTEGER,
+        base_min_damage INTEGER,
+        base_max_damage INTEGER,
+        attack_speed INTEGER,
+        base_hit_chance INTEGER,
+        block_chance INTEGER,
+        level INTEGER,
+        xp INTEGER,
+        xp_to_next_level INTEGER
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS hero_factory_name ON hero_factory (name)",
+)
+
+MONSTER_SEED = (
+    ("Skeleton", 100, 30, 50, 3, 80, 30, 30, 50, 25),
+    ("Gremlin", 70, 15, 30, 5, 80, 40, 20, 40, 20),
+    ("Ogre", 175, 30, 60, 2, 60, 10, 30, 60, 50),
+)
+
+HERO_SEED = (
+    ("Warrior", 125, 35, 60, 4, 80, 20, 1, 0, 100),
+    ("Priestess", 75, 25, 45, 5, 70, 30, 1, 0, 100),
+    ("Thief", 75, 20, 40, 6, 80, 40, 1, 0, 100),
+)
+
+
+def _select_sql(table: str, columns: Sequence[str]) -> str:
+    return f"SELECT {', '.join(columns)} FROM {table} ORDER BY rowid"
+
+
+def _seed_sql(table: str, columns: Sequence[str]) -> str:
+    # Insert a row only if no row with that name exists yet
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"SELECT {', '.join('?' * len(columns))} "
+        f"WHERE NOT EXISTS (SELECT 1 FROM {table} WHERE name = ?)"
+    )
+
+
+_SELECT_MONSTERS = _select_sql("monster_factory_new", MONSTER_COLUMNS)
+_SELECT_MONSTER = (
+    f"SELECT rowid, {', '.join(MONSTER_COLUMNS)} FROM monster_factory_new "
+    "WHERE name = ? ORDER BY rowid LIMIT 1"
+)
+_SEED_MONSTER = _seed_sql("monster_factory_new", MONSTER_COLUMNS)
+_SELECT_HEROES = _select_sql("hero_factory", HERO_COLUMNS)
+_SELECT_HERO = f"SELECT {', '.join(HERO_COLUMNS)} FROM hero_factory WHERE name = ?"
+_SEED_HERO = _seed_sql("hero_factory", HERO_COLUMNS)
+
+
+def monster_database(path: str = MONSTER_DB_PATH) -> Database:
+    """Shared connection to the monster database, with its schema up to date."""
+    database = get_database(path)
+    database.migrate(MONSTER_MIGRATIONS)
+    return database
+
+
+def hero_database(path: str = HERO_DB_PATH) -> Database:
+    """Shared connection to the hero database, with its schema up to date."""
+    database = get_database(path)
+    database.migrate(HERO_MIGRATIONS)
+    return database
+
+
+def seed_monsters(database: Database, rows: Sequence[tuple] = MONSTER_SEED) -> int:
+    """
+    Insert the monsters that are not in the database yet.
+
+    Running it again does nothing, so it is safe to call on every start.
+
+    :return: Number of rows inserted
+    """
+    with database.transaction() as connection:
+        before = connection.total_changes
+        connection.executemany(_SEED_MONSTER, [(*row, row[0]) for row in rows])
+        return connection.total_changes - before
+
+
+def seed_heroes(database: Database, rows: Sequence[tuple] = HERO_SEED) -> int:
+    """Insert the hero classes that are not in the database yet. Idempotent."""
+    with database.transaction() as connection:
+        before = connection.total_changes
+        connection.executemany(_SEED_HERO, [(*row, row[0]) for row in rows])
+        return connection.total_changes - before
+
+
+def load_monster_rows(path: str = MONSTER_DB_PATH) -> List[tuple]:
+    """Every monster row, in MONSTER_COLUMNS order, timed as "monster templates"."""
+    with content_load("monster templates"):
+        return monster_database(path).query_all(_SELECT_MONSTERS)
+
+
+def find_monster_row(name: str, path: str = MONSTER_DB_PATH) -> Optional[tuple]:
+    """The first monster row with the given name as (id, *MONSTER_COLUMNS), or None."""
+    return monster_database(path).query_one(_SELECT_MONSTER, (name,))
+
+
+def load_hero_rows(path: str = HERO_DB_PATH) -> List[tuple]:
+    """Every hero class row, in HERO_COLUMNS order, timed as "hero classes"."""
+    with content_load("hero classes"):
+        return hero_database(path).query_all(_SELECT_HEROES)
+
+
+def find_hero_rows(name: str, path: str = HERO_DB_PATH) -> List[tuple]:
+    """All hero class rows with the given name."""
+    return hero_database(path).query_all(_SELECT_HERO, (name,))
@@ -0,0 +1,140 @@
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# How long loading one kind of game content (all monster templates, all hero
+# classes, ...) may take before a warning is logged
+CONTENT_LOAD_BUDGET = 0.05
+
+# Prepared statements kept per connection, keyed by SQL text
+STATEMENT_CACHE_SIZE = 256
+
+# Seconds taken by the most recent load of each kind of content
+load_timings: Dict[str, float] = {}
+
+_databases: Dict[str, "Database"] = {}
+
+logger = logging.getLogger(__name__)
+
+
+class Database:
+    """
+    One SQLite connection shared by everything that reads a database file.
+
+    File databases are switched to WAL mode so readers do not block the writer.
+    sqlite3 keeps prepared statements per connection keyed by their SQL text, so
+    queries should use constant SQL with ? parameters to reuse them. Use
+    get_database instead of creating instances directly.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pid = os.getpid()
+        self.connection = sqlite3.connect(path, cached_statements=STATEMENT_CACHE_SIZE)
+        # Last schema version seen through this connection, see migrate
+        self._schema_version: Optional[int] = None
+        if path not in ("", ":memory:"):
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            # WAL makes NORMAL durable against application crashes, which is all
+            # game content and saves need
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> sqlite3.Cursor:
+        return self.connection.execute(sql, parameters)
+
+    def executemany(self, sql: str, rows: Sequence[Sequence[Any]]) -> sqlite3.Cursor:
+        return self.connection.executemany(sql, rows)
+
+    def query_all(self, sql: str, parameters: Sequence[Any] = ()) -> List[tuple]:
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def query_one(self, sql: str, parameters: Sequence[Any] = ()) -> Optional[tuple]:
+        return self.connection.execute(sql, parameters).fetchone()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Commit everything run inside the block together, or roll it back."""
+        with self.connection:
+            yield self.connection
+
+    @property
+    def schema_version(self) -> int:
+        return self.connection.execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate(self, migrations: Sequence[str]) -> int:
+        """
+        Bring the schema up to date.
+
+        migrations[i] upgrades the schema from version i to i + 1. The version is
+        stored in the database's user_version, so only the steps a database has
+        not seen yet run, each in its own transaction.
+
+        :param migrations: SQL scripts, in version order
+        :return: The schema version after migrating
+        """
+        if self._schema_version is not None and self._schema_version >= len(migrations):
+            return self._schema_version
+        version = self.schema_version
+        for target, script in enumerate(migrations[version:], start=version + 1):
+            with self.transaction() as connection:
+                for statement in script.split(";"):
+                    if statement.strip():
+                        connection.execute(statement)
+                # PRAGMA does not take parameters; target is always an int
+                connection.execute(f"PRAGMA user_version = {int(target)}")
+            logger.info(f"Migrated {self.path or 'memory'} to schema {target}")
+        self._schema_version = max(version, len(migrations))
+        return self._schema_version
+
+    def close(self) -> None:
+        self.connection.close()
+        if _databases.get(os.path.abspath(self.path)) is self:
+            del _databases[os.path.abspath(self.path)]
+
+
+def get_database(path: str) -> Database:
+    """
+    Return the shared connection for a database file, opening it if needed.
+
+    Relative paths are resolved against the working directory, like the rest of
+    the game's database paths. A process forked after opening a database gets
+    its own connection instead of reusing the parent's.
+    """
+    key = os.path.abspath(path)
+    database = _databases.get(key)
+    if database is None or database.pid != os.getpid():
+        database = Database(path)
+        _databases[key] = database
+    return database
+
+
+def close_all() -> None:
+    """Close every shared connection, e.g. on shutdown or between tests."""
+    for database in list(_databases.values()):
+        if database.pid == os.getpid():
+            database.connection.close()
+    _databases.clear()
+
+
+@contextmanager
+def content_load(name: str, budget: float = CONTENT_LOAD_BUDGET) -> Iterator[None]:
+    """
+    Time a content load against its latency budget.
+
+    The duration is stored in load_timings[name] and a warning is logged when it
+    goes over budget.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        load_timings[name] = elapsed
+        if elapsed > budget:
+            logger.warning(
+                f"Loading {name} took {elapsed * 1000:.1f} ms, "
+                f"over the {budget * 1000:.0f} ms budget"
+            )
@@ -20,6 +20,10 @@ class Direction(Enum):
     SOUTH = "S"
     WEST = "W"
 
+    # Position in declaration order, set below. Lets per-direction tables be
+    # tuples, which avoids hashing the member on every lookup
+    ordinal: int
+
     def get_coordinate_change(self) -> Tuple[int, int]:
         changes = {
             Direction.NORTH: (0, -1),
@@ -35,3 +39,8 @@ class Direction(Enum):
             return cls[direction_str.upper()]
         except KeyError:
             raise ValueError(f"'{direction_str}' is not a valid direction.")
+
+
+for _ordinal, _direction in enumerate(Direction):
+    _direction.ordinal = _ordinal
+del _ordinal, _direction
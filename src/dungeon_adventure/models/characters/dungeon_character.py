@@ -1,5 +1,15 @@
-import random
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional
+
+from dungeon_adventure.services.rng import combat_stream
+
+
+class EffectiveStats(NamedTuple):
+    """Base stats with every modifier applied, as the combat rolls use them."""
+
+    min_damage: int
+    max_damage: int
+    hit_chance: int
 
 
 # TODO: Make this class ABSTRACT lmao
@@ -30,6 +40,22 @@ class DungeonCharacter:
         self._attack_speed: int = attack_speed
         self._base_hit_chance: int = base_hit_chance
         self._stat_modifiers: Dict[str, int] = {}
+        # Read-only live view handed out by stat_modifiers
+        self._modifier_view = MappingProxyType(self._stat_modifiers)
+        # None when a base stat or modifier changed since the last compile
+        self._effective_stats: Optional[EffectiveStats] = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Views cannot be pickled; both are rebuilt on load
+        state.pop("_modifier_view", None)
+        state.pop("_effective_stats", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._modifier_view = MappingProxyType(self._stat_modifiers)
+        self._effective_stats = None
 
     @property
     def name(self) -> str:
@@ -73,6 +99,7 @@ class DungeonCharacter:
                 "Base maximum damage cannot be less than base minimum damage"
             )
         self._base_max_damage = value
+        self._effective_stats = None
 
     @base_min_damage.setter
     def base_min_damage(self, value: int):
@@ -83,6 +110,7 @@ class DungeonCharacter:
                 "Base minimum damage cannot be greater than base maximum damage"
             )
         self._base_min_damage = value
+        self._effective_stats = None
 
     @property
     def attack_speed(self) -> int:
@@ -93,10 +121,30 @@ class DungeonCharacter:
         return self._base_hit_chance
 
     @property
-    def stat_modifiers(self) -> Dict[str, int]:
-        return (
-            self._stat_modifiers.copy()
-        )  # Return a copy to prevent direct modification
+    def stat_modifiers(self) -> Mapping[str, int]:
+        """Read-only view of the modifiers, use add_stat_modifier to change them."""
+        return self._modifier_view
+
+    @property
+    def effective_stats(self) -> EffectiveStats:
+        """
+        Base stats plus modifiers, compiled once and cached until a base stat
+        or a modifier changes.
+        """
+        stats = self._effective_stats
+        if stats is None:
+            stats = self._effective_stats = self._compile_stats()
+        return stats
+
+    def _compile_stats(self) -> EffectiveStats:
+        modifiers = self._stat_modifiers
+        min_damage = max(0, self._base_min_damage + modifiers.get("min_damage", 0))
+        max_damage = self._base_max_damage + modifiers.get("max_damage", 0)
+        return EffectiveStats(
+            min_damage,
+            max(min_damage, max_damage),
+            self._base_hit_chance + modifiers.get("hit_chance", 0),
+        )
 
     @property
     def is_alive(self) -> bool:
@@ -119,17 +167,18 @@ class DungeonCharacter:
 
     def _attack_hits(self) -> bool:
         """Determine if an attack hits based on hit chance."""
-        return random.randint(1, 100) <= self.get_total_hit_chance()
+        stats = self._effective_stats or self.effective_stats
+        return combat_stream().randint(1, 100) <= stats.hit_chance
 
     def _calculate_damage(self) -> int:
-        """Calculate the damage for a successful attack."""
-        min_damage = self._base_min_damage # + self._stat_modifiers.get("min_damage", 0)
-        max_damage = self._base_max_damage # + self._stat_modifiers.get("max_damage", 0)
-        return random.randint(min_damage, max_damage)
+        """Calculate the damage for a successful attack, including modifiers."""
+        stats = self._effective_stats or self.effective_stats
+        return combat_stream().randint(stats.min_damage, stats.max_damage)
 
     def get_total_hit_chance(self) -> int:
-        """Calculate total hit chance including modifiers."""
-        return self._base_hit_chance + self._stat_modifiers.get("hit_chance", 0)
+        """Total hit chance including modifiers."""
+        # Skips the property call while the cache is valid
+        return (self._effective_stats or self.effective_stats).hit_chance
 
     def take_damage(self, damage: int) -> None:
         """
@@ -139,6 +188,23 @@ class DungeonCharacter:
         mitigated_damage = self._mitigate_damage(damage)
         self.current_hp -= mitigated_damage
 
+    def take_hits(self, damages: Iterable[int]) -> int:
+        """
+        Apply several hits in order, e.g. a horde's volley, stopping at death.
+        Subclasses whose take_damage does more than mitigate must override it.
+        :param damages: Damage of each hit
+        :return: Number of hits taken
+        """
+        hp = self._current_hp
+        taken = 0
+        for damage in damages:
+            if hp <= 0:
+                break
+            hp -= self._mitigate_damage(damage)
+            taken += 1
+        self.current_hp = hp
+        return taken
+
     def _mitigate_damage(self, damage: int) -> int:
         """
         Calculate mitigated damage. Can be overridden by subclasses.
@@ -168,6 +234,7 @@ class DungeonCharacter:
         :param value: Value to add to the stat
         """
         self._stat_modifiers[stat] = self._stat_modifiers.get(stat, 0) + value
+        self._effective_stats = None
 
     def remove_stat_modifier(self, stat: str) -> None:
         """
@@ -175,12 +242,13 @@ class DungeonCharacter:
         :param stat: Stat to remove modifier from
         """
         self._stat_modifiers.pop(stat, None)
+        self._effective_stats = None
 
     def simulate_attack_roll(self) -> tuple[int, bool]:
         """
         Simulate a D20 roll for attack visualization.
         :return: Tuple of (roll result, whether the attack would hit)
         """
-        roll = random.randint(1, 20)
+        roll = combat_stream().randint(1, 20)
         would_hit = roll >= (20 * (1 - self.get_total_hit_chance() / 100))
         return roll, would_hit
@@ -1,9 +1,10 @@
-import random
 import sqlite3
-from typing import Optional, List
+from typing import Iterable, Optional, List
 
+from dungeon_adventure.data.content import find_hero_rows
 from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
 from dungeon_adventure.models.items import Weapon
+from dungeon_adventure.services.rng import combat_stream
 
 
 class Hero(DungeonCharacter):
@@ -39,11 +40,28 @@ class Hero(DungeonCharacter):
 
     def _mitigate_damage(self, damage: int) -> int:
         """Attempt to block incoming damage."""
-        if random.randint(1, 100) <= self.block_chance:
+        if combat_stream().randint(1, 100) <= self.block_chance:
             blocked_damage = int(damage * 0.5)  # Block 50% of incoming damage
             return damage - blocked_damage
         return damage
 
+    def take_hits(self, damages: Iterable[int]) -> int:
+        """take_hits with the block roll of _mitigate_damage inlined."""
+        draw = combat_stream().random
+        block_chance = self.block_chance
+        hp = self._current_hp
+        taken = 0
+        for damage in damages:
+            if hp <= 0:
+                break
+            # Same odds as randint(1, 100) <= block_chance
+            if draw() * 100 < block_chance:
+                damage -= int(damage * 0.5)
+            hp -= damage
+            taken += 1
+        self.current_hp = hp
+        return taken
+
     def equip_weapon(self, weapon: Weapon) -> None:
         """Equip a weapon and apply its stat modifiers."""
         if self.equipped_weapon:
@@ -101,6 +119,7 @@ class Hero(DungeonCharacter):
             # Do Sneak Attack
 
     def __str__(self) -> str:
+        stats = self.effective_stats
         weapon_info = (
             f"Equipped: {self.equipped_weapon.name}"
             if self.equipped_weapon
@@ -111,30 +130,18 @@ class Hero(DungeonCharacter):
             f"Level: {self.level}\n"
             f"HP: {self.current_hp}/{self.max_hp}\n"
             f"XP: {self.xp}/{self.xp_to_next_level}\n"
-            f"Damage: {self.base_min_damage}-{self.base_max_damage}\n"
-            f"Hit Chance: {self.base_hit_chance}%\n"
+            f"Damage: {stats.min_damage}-{stats.max_damage}\n"
+            f"Hit Chance: {stats.hit_chance}%\n"
             f"Block Chance: {self.block_chance}%\n"
             f"{weapon_info}"
         )
 
     def get_SQL_hero_info(self, name: str) -> List[any]:
         try:
-            sqliteConnection = sqlite3.connect("hero_factory.db")
-            cursor = sqliteConnection.cursor()
-            print("Connected to SQLite")
-
-            sqlite_select_query = """select * from hero_factory where name = ?"""
-            cursor.execute(sqlite_select_query, (name,))
-            records = cursor.fetchall()
-            cursor.close()
+            return find_hero_rows(name)
         except sqlite3.Error as error:
             print("Failed to read data from sqlite", error)
-        finally:
-            if sqliteConnection:
-                sqliteConnection.close()
-                print("SQLite connection is closed")
-
-        return records
+            return []
 
 
 if __name__ == "__main__":
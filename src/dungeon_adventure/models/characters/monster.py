@@ -1,10 +1,16 @@
 import logging
 import random
 import sqlite3
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
+from dungeon_adventure.data.content import (
+    find_monster_row,
+    monster_database,
+    seed_monsters,
+)
 from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
 from dungeon_adventure.models.items import Item
+from dungeon_adventure.services.rng import combat_stream
 
 
 class Monster(DungeonCharacter):
@@ -36,7 +42,7 @@ class Monster(DungeonCharacter):
         self.xp_reward: int = xp_reward
         self.loot: List[Item] = loot if loot is not None else []
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.initialize_database()
+        # The database is read once by MonsterTemplateRegistry, not per monster
         # self.insert_sample_data()
 
     def take_damage(self, damage: int) -> None:
@@ -48,37 +54,23 @@ class Monster(DungeonCharacter):
         super().take_damage(damage)
         self.attempt_heal()
 
-    def generate_random_monster(self):
-        monster_types = ["Skeleton", "Gremlin", "Ogre"]
-        monster_name = random.choice(monster_types)
-        print(f"Attempting to generate a {monster_name}")
-
-        monster_data = self.get_SQL_monster_info(monster_name)
-        print(f"Data returned from get_SQL_monster_info: {monster_data}")
-        print(f"Type of monster_data: {type(monster_data)}")
-
-        if monster_data and isinstance(monster_data, tuple):
-            try:
-                return Monster(
-                    name=str(monster_data[1]),
-                    max_hp=int(monster_data[2]),
-                    base_min_damage=int(monster_data[3]),
-                    base_max_damage=int(monster_data[4]),
-                    attack_speed=int(monster_data[5]),
-                    base_hit_chance=int(monster_data[6]),
-                    heal_chance=int(monster_data[7]),
-                    min_heal=int(monster_data[8]),
-                    max_heal=int(monster_data[9]),
-                    xp_reward=int(monster_data[10]),
-                )
-            except Exception as e:
-                print(f"Error creating monster from data: {e}")
-                print(f"monster_data: {monster_data}")
-        else:
-            print(f"Invalid data returned for monster: {monster_name}")
-
-        # Fallback to default monster creation
-        return Monster(name=monster_name)
+    def take_hits(self, damages: Iterable[int]) -> int:
+        """Apply several hits in order, each followed by a heal attempt."""
+        taken = 0
+        for damage in damages:
+            if not self.is_alive:
+                break
+            self.take_damage(damage)
+            taken += 1
+        return taken
+
+    def generate_random_monster(self, rng: Optional[random.Random] = None):
+        """Create a random monster from the shared MonsterTemplateRegistry."""
+        from dungeon_adventure.models.characters.monster_templates import (
+            MonsterTemplateRegistry,
+        )
+
+        return MonsterTemplateRegistry.default().create_random(rng)
 
     def attempt_heal(self) -> int:
         """
@@ -86,11 +78,12 @@ class Monster(DungeonCharacter):
 
         :return: Amount healed (0 if healing didn't occur)
         """
-        if random.randint(1, 100) <= self.heal_chance:
+        rolls = combat_stream()
+        if rolls.randint(1, 100) <= self.heal_chance:
             self.logger.info(
                 f"Monster heal chance successful, healing for {self.heal_chance}"
             )
-            heal_amount = random.randint(self.min_heal, self.max_heal)
+            heal_amount = rolls.randint(self.min_heal, self.max_heal)
             self.heal(heal_amount)
             return heal_amount
         self.logger.info(f"Healing failed for {self.name}")
@@ -129,70 +122,34 @@ class Monster(DungeonCharacter):
 
     def initialize_database(self):
         try:
-            with sqlite3.connect("monster_factory_new.db") as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS monster_factory_new (
-                        id INTEGER PRIMARY KEY,
-                        name TEXT,
-                        max_hp INTEGER,
-                        base_min_damage INTEGER,
-                        base_max_damage INTEGER,
-                        attack_speed INTEGER,
-                        base_hit_chance INTEGER,
-                        heal_chance INTEGER,
-                        min_heal INTEGER,
-                        max_heal INTEGER,
-                        xp_reward INTEGER
-                    )
-                """
-                )
-                conn.commit()
+            monster_database()
             print("Database initialized successfully")
         except sqlite3.Error as e:
             print(f"Error initializing database: {e}")
 
     def insert_sample_data(self):
         try:
-            with sqlite3.connect("monster_factory_new.db") as conn:
-                cursor = conn.cursor()
-
-                # Check if the table is empty
-                cursor.execute("SELECT COUNT(*) FROM monster_factory_new")
-                count = cursor.fetchone()[0]
-
-                if count == 0:
-                    cursor.executemany(
-                        """
-                        INSERT INTO monster_factory_new 
-                        (name, max_hp, base_min_damage, base_max_damage, attack_speed, base_hit_chance, heal_chance, min_heal, max_heal, xp_reward)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        [
-                            ("Skeleton", 45, 15, 25, 3, 80, 30, 10, 20, 25),
-                            ("Gremlin", 35, 7, 15, 5, 80, 40, 10, 20, 20),
-                            ("Ogre", 100, 15, 30, 2, 60, 10, 30, 60, 100),
-                        ],
-                    )
-                    conn.commit()
-                    print("Sample data inserted successfully")
-                else:
-                    print("Table already contains data, skipping insertion")
+            inserted = seed_monsters(
+                monster_database(),
+                [
+                    ("Skeleton", 45, 15, 25, 3, 80, 30, 10, 20, 25),
+                    ("Gremlin", 35, 7, 15, 5, 80, 40, 10, 20, 20),
+                    ("Ogre", 100, 15, 30, 2, 60, 10, 30, 60, 100),
+                ],
+            )
+            if inserted:
+                print("Sample data inserted successfully")
+            else:
+                print("Table already contains data, skipping insertion")
         except sqlite3.Error as e:
             print(f"Error inserting sample data: {e}")
 
     def get_SQL_monster_info(self, name: str) -> Optional[tuple]:
         try:
-            with sqlite3.connect("monster_factory_new.db") as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT * FROM monster_factory_new WHERE name = ? LIMIT 1", (name,)
-                )
-                record = cursor.fetchone()
-                if not record:
-                    print(f"No data found for monster: {name}")
-                return record
+            record = find_monster_row(name)
+            if not record:
+                print(f"No data found for monster: {name}")
+            return record
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return None
@@ -0,0 +1,197 @@
+import logging
+import random
+import sqlite3
+from typing import Dict, List, Mapping, NamedTuple, Optional
+
+from dungeon_adventure.data.content import MONSTER_DB_PATH, load_monster_rows
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.services.rng import generation_stream
+from dungeon_adventure.utils.gc_utils import paused_gc
+
+# Monsters the game spawns when nothing more specific is asked for
+RANDOM_MONSTER_TYPES = ("Skeleton", "Gremlin", "Ogre")
+
+
+class MonsterTemplate(NamedTuple):
+    """Stats of one monster type, as stored in the monster database."""
+
+    name: str
+    max_hp: int
+    base_min_damage: int
+    base_max_damage: int
+    attack_speed: int
+    base_hit_chance: int
+    heal_chance: int
+    min_heal: int
+    max_heal: int
+    xp_reward: int
+
+    def create(self) -> Monster:
+        """Create a fresh monster with this template's stats."""
+        return Monster(*self)
+
+
+class SpawnTable:
+    """
+    Weighted table of monster types, sampled in O(1) with the alias method.
+
+    Building the table is linear in the number of types. Each draw picks a
+    column uniformly and then either the column's own type or its alias, so the
+    cost does not depend on the number of types or their weights.
+    """
+
+    def __init__(self, weights: Mapping[str, float]):
+        """
+        Build the alias tables.
+
+        :param weights: Relative spawn weight of each monster type
+        :raises ValueError: If a weight is negative or no weight is positive
+        """
+        names = [name for name, weight in weights.items() if weight > 0]
+        if any(weight < 0 for weight in weights.values()):
+            raise ValueError("Spawn weights cannot be negative")
+        if not names:
+            raise ValueError("A spawn table needs at least one positive weight")
+        total = sum(weights[name] for name in names)
+        count = len(names)
+        scaled = [weights[name] * count / total for name in names]
+        self.names: List[str] = names
+        self._probability: List[float] = [1.0] * count
+        self._alias: List[int] = list(range(count))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1.0 up to rounding and keeps its own column
+
+    @classmethod
+    def uniform(cls, names) -> "SpawnTable":
+        return cls({name: 1 for name in names})
+
+    def sample(self, rng: Optional[random.Random] = None) -> str:
+        """Draw one monster type."""
+        column = (rng or generation_stream()).random() * len(self.names)
+        index = int(column)
+        if column - index >= self._probability[index]:
+            index = self._alias[index]
+        return self.names[index]
+
+    def sample_many(self, n: int, rng: Optional[random.Random] = None) -> List[str]:
+        """Draw n monster types, one random number per draw."""
+        draw = (rng or generation_stream()).random
+        names, probability, alias = self.names, self._probability, self._alias
+        count = len(names)
+        picked = []
+        append = picked.append
+        for _ in range(n):
+            column = draw() * count
+            index = int(column)
+            if column - index >= probability[index]:
+                index = alias[index]
+            append(names[index])
+        return picked
+
+
+# Spawn table used when nothing more specific is asked for
+DEFAULT_SPAWN_TABLE = SpawnTable.uniform(RANDOM_MONSTER_TYPES)
+
+
+class MonsterTemplateRegistry:
+    """
+    In-memory copy of the monster database.
+
+    All rows are read through the shared data layer connection the first time a
+    template is needed, after that creating monsters never touches the disk.
+    """
+
+    _default: Optional["MonsterTemplateRegistry"] = None
+
+    def __init__(self, db_path: str = MONSTER_DB_PATH):
+        self.db_path = db_path
+        self._templates: Optional[Dict[str, MonsterTemplate]] = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def default(cls) -> "MonsterTemplateRegistry":
+        """The registry shared by the game, reading the default database."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def load(self) -> None:
+        """
+        Read every monster row from the database, replacing any loaded templates.
+
+        The schema is created or upgraded if needed. When a name appears more
+        than once, the first row wins.
+        """
+        templates: Dict[str, MonsterTemplate] = {}
+        try:
+            rows = load_monster_rows(self.db_path)
+        except sqlite3.Error as e:
+            self.logger.error(f"Error loading monster templates: {e}")
+            rows = []
+        for row in rows:
+            try:
+                template = MonsterTemplate(str(row[0]), *(int(v) for v in row[1:]))
+            except (TypeError, ValueError) as e:
+                self.logger.error(f"Skipping invalid monster row {row}: {e}")
+                continue
+            templates.setdefault(template.name, template)
+        self._templates = templates
+
+    @property
+    def templates(self) -> Dict[str, MonsterTemplate]:
+        if self._templates is None:
+            self.load()
+        return self._templates
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.templates)
+
+    def get(self, name: str) -> Optional[MonsterTemplate]:
+        return self.templates.get(name)
+
+    def create(self, name: str) -> Monster:
+        """
+        Create a monster of the given type.
+
+        Falls back to a default Monster with that name if the type is unknown.
+        """
+        template = self.templates.get(name)
+        if template is None:
+            self.logger.warning(f"No template found for monster: {name}")
+            return Monster(name=name)
+        return template.create()
+
+    def spawn_batch(
+        self,
+        n: int,
+        table: Optional[SpawnTable] = None,
+        rng: Optional[random.Random] = None,
+    ) -> List[Monster]:
+        """
+        Create n monsters with types drawn from a spawn table.
+
+        :param n: Number of monsters to create
+        :param table: Weighted monster types, DEFAULT_SPAWN_TABLE if not given
+        :param rng: Random generator for the draws, the generation stream if not given
+        :return: The new monsters, in draw order
+        """
+        names = (table or DEFAULT_SPAWN_TABLE).sample_many(n, rng)
+        templates = self.templates
+        monsters = []
+        with paused_gc():
+            for name in names:
+                template = templates.get(name)
+                monsters.append(template.create() if template else self.create(name))
+        return monsters
+
+    def create_random(self, rng: Optional[random.Random] = None) -> Monster:
+        """Create one monster drawn from DEFAULT_SPAWN_TABLE."""
+        return self.create(DEFAULT_SPAWN_TABLE.sample(rng))
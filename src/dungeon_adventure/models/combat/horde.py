@@ -0,0 +1,209 @@
+import random
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from dungeon_adventure.exceptions.combat import CharacterNotInCombatError
+from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.services.rng import combat_stream
+
+# Encounters with at least this many monsters are fought as a horde: monsters
+# attack in one volley and the UI shows a bar per monster type
+HORDE_THRESHOLD = 10
+
+# (hit chance, min damage, max damage) shared by monsters that attack alike
+_Profile = Tuple[int, int, int]
+
+
+class MonsterGroup(NamedTuple):
+    """The alive monsters of one name, summarized for display."""
+
+    name: str
+    count: int
+    hp: int
+    max_hp: int
+    # Index of the group's first monster in the summarized list, to target it
+    first: int
+
+    @property
+    def hp_ratio(self) -> float:
+        return self.hp / self.max_hp if self.max_hp else 0
+
+
+class Volley(NamedTuple):
+    """What happened during one horde monster turn."""
+
+    attacks: int
+    hits: int
+    # HP the hero lost, after blocking
+    damage: int
+    healed: int
+
+
+def summarize(monsters: Iterable[Monster]) -> List[MonsterGroup]:
+    """Group alive monsters by name, in the order each name first appears."""
+    groups: Dict[str, list] = {}
+    for index, monster in enumerate(monsters):
+        if not monster.is_alive:
+            continue
+        group = groups.get(monster.name)
+        if group is None:
+            groups[monster.name] = [1, monster.current_hp, monster.max_hp, index]
+        else:
+            group[0] += 1
+            group[1] += monster.current_hp
+            group[2] += monster.max_hp
+    return [MonsterGroup(name, *group) for name, group in groups.items()]
+
+
+def _profile(monster: Monster) -> _Profile:
+    stats = monster.effective_stats
+    return stats.hit_chance, stats.min_damage, stats.max_damage
+
+
+class Horde:
+    """
+    The alive monsters of an encounter, built for hundreds of monsters.
+
+    Alive monsters are kept in a list with each one's position in a dict, so a
+    dead monster is removed in O(1) by moving the last monster into its slot;
+    the order of the list is therefore not the order monsters joined. Monsters
+    with the same hit chance and damage range are counted together, and
+    wounded monsters are tracked, so a volley costs one roll per attack and
+    per wounded monster rather than a full attempt_attack per monster.
+
+    Stats are read when a monster joins; monsters do not change stats mid-fight.
+    """
+
+    def __init__(self, monsters: Iterable[Monster] = ()):
+        self._alive: List[Monster] = []
+        self._positions: Dict[Monster, int] = {}
+        self._profiles: Dict[Monster, _Profile] = {}
+        # Alive monsters per profile, in the order profiles first joined
+        self._profile_counts: Dict[_Profile, int] = {}
+        # Alive monsters below full HP, the only ones a heal can change
+        self._wounded: Dict[Monster, None] = {}
+        for monster in monsters:
+            self.add(monster)
+
+    def __len__(self) -> int:
+        return len(self._alive)
+
+    def __bool__(self) -> bool:
+        return bool(self._alive)
+
+    def __iter__(self) -> Iterator[Monster]:
+        return iter(self._alive)
+
+    def __contains__(self, monster) -> bool:
+        return monster in self._positions
+
+    @property
+    def alive(self) -> List[Monster]:
+        """The alive monsters. The list is live; copy it to keep a snapshot."""
+        return self._alive
+
+    @property
+    def is_horde(self) -> bool:
+        return len(self._alive) >= HORDE_THRESHOLD
+
+    def add(self, monster: Monster) -> None:
+        """Join the horde. Dead monsters and monsters already in it are ignored."""
+        if monster in self._positions or not monster.is_alive:
+            return
+        self._positions[monster] = len(self._alive)
+        self._alive.append(monster)
+        profile = _profile(monster)
+        self._profiles[monster] = profile
+        self._profile_counts[profile] = self._profile_counts.get(profile, 0) + 1
+        if monster.current_hp < monster.max_hp:
+            self._wounded[monster] = None
+
+    def remove(self, monster: Monster) -> None:
+        """
+        Leave the horde in O(1), e.g. when defeated.
+
+        :raises CharacterNotInCombatError: If the monster is not in the horde
+        """
+        position = self._positions.pop(monster, None)
+        if position is None:
+            raise CharacterNotInCombatError(f"{monster} is not in this fight")
+        last = self._alive.pop()
+        if last is not monster:
+            self._alive[position] = last
+            self._positions[last] = position
+        profile = self._profiles.pop(monster)
+        self._profile_counts[profile] -= 1
+        if not self._profile_counts[profile]:
+            del self._profile_counts[profile]
+        self._wounded.pop(monster, None)
+
+    def refresh(self, monster: Monster) -> bool:
+        """
+        Update the horde after a monster's HP changed outside a volley, such as
+        when the hero attacks it.
+
+        :return: Whether the monster is still alive
+        """
+        if monster not in self._positions:
+            return monster.is_alive
+        if not monster.is_alive:
+            self.remove(monster)
+            return False
+        if monster.current_hp < monster.max_hp:
+            self._wounded[monster] = None
+        else:
+            self._wounded.pop(monster, None)
+        return True
+
+    def counts(self) -> Dict[str, int]:
+        """Alive monsters per name."""
+        counts: Dict[str, int] = {}
+        for monster in self._alive:
+            counts[monster.name] = counts.get(monster.name, 0) + 1
+        return counts
+
+    def volley(
+        self, target: DungeonCharacter, rng: Optional[random.Random] = None
+    ) -> Volley:
+        """
+        Every alive monster attacks the target at once, then tries to heal.
+
+        Follows Monster.attempt_attack: an attack hits on randint(1, 100) <=
+        hit chance and deals randint(min, max) damage through the target's
+        take_hits, so a hero still blocks each hit. Hit and damage rolls are
+        drawn per profile in one batch. Hits stop landing once the target is
+        dead. Only wounded monsters roll to heal, since a heal cannot change a
+        monster at full HP.
+
+        :param rng: Random generator for the rolls, the combat stream if not given
+        """
+        rng = rng or combat_stream()
+        draw = rng.random
+        start_hp = target.current_hp
+        attacks = hits = 0
+        for (hit_chance, min_damage, max_damage), count in self._profile_counts.items():
+            attacks += count
+            # randint(1, 100) <= hit_chance, i.e. a uniform draw below the chance
+            threshold = hit_chance / 100
+            group_hits = sum(1 for _ in repeat(None, count) if draw() < threshold)
+            if not group_hits or not target.is_alive:
+                continue
+            damages = rng.choices(range(min_damage, max_damage + 1), k=group_hits)
+            hits += target.take_hits(damages)
+        healed = 0
+        for monster in list(self._wounded):
+            if draw() * 100 < monster.heal_chance:
+                before = monster.current_hp
+                monster.heal(rng.randint(monster.min_heal, monster.max_heal))
+                healed += monster.current_hp - before
+                if monster.current_hp >= monster.max_hp:
+                    del self._wounded[monster]
+        return Volley(attacks, hits, start_hp - target.current_hp, healed)
+
+    def clear(self) -> None:
+        self._alive.clear()
+        self._positions.clear()
+        self._profiles.clear()
+        self._profile_counts.clear()
+        self._wounded.clear()
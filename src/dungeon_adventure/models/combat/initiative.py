@@ -0,0 +1,154 @@
+import bisect
+import heapq
+import itertools
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional
+
+from dungeon_adventure.exceptions.combat import CharacterNotInCombatError
+from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
+
+# Characters slower than this still act, just as rarely as a speed 1 character
+MIN_SPEED = 1
+
+
+class _Entry:
+    __slots__ = ("time", "speed", "sequence", "character")
+
+    def __init__(
+        self, time: Fraction, speed: int, sequence: int, character: DungeonCharacter
+    ):
+        self.time = time
+        self.speed = speed
+        self.sequence = sequence
+        # None once the character has left the fight
+        self.character: Optional[DungeonCharacter] = character
+
+    def __lt__(self, other: "_Entry") -> bool:
+        return (self.time, -self.speed, self.sequence) < (
+            other.time,
+            -other.speed,
+            other.sequence,
+        )
+
+
+def _initiative(entry: _Entry):
+    return -entry.speed, entry.sequence
+
+
+class InitiativeScheduler:
+    """
+    Turn order shared by every combat controller, kept in a heap.
+
+    Initiative order is highest attack speed first, ties in the order the
+    characters joined. On top of that runs an ATB style timeline: a character
+    of speed s acts every 1/s time units, so a speed 6 character acts twice for
+    each action of a speed 3 one. Times are exact fractions, so simultaneous
+    actions are resolved by initiative, never by rounding.
+
+    Adding a character is O(log n). Removing one marks its entry and leaves it
+    in the heap until it reaches the top, so it is O(1) plus amortized
+    O(log n) for the later pop. The initiative order is kept sorted as
+    characters join and leave, found by binary search, so order() never
+    sorts.
+    """
+
+    def __init__(self, characters: Iterable[DungeonCharacter] = ()):
+        self._heap: List[_Entry] = []
+        self._entries: Dict[DungeonCharacter, _Entry] = {}
+        # Entries in initiative order, for order()
+        self._order: List[_Entry] = []
+        self._sequence = itertools.count()
+        self._time = Fraction(0)
+        for character in characters:
+            self.add(character)
+
+    @property
+    def time(self) -> Fraction:
+        """Time of the last action taken from the timeline."""
+        return self._time
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, character) -> bool:
+        return character in self._entries
+
+    @staticmethod
+    def _speed(character: DungeonCharacter) -> int:
+        return max(character.attack_speed, MIN_SPEED)
+
+    def add(self, character: DungeonCharacter, ready: bool = False) -> None:
+        """
+        Join the fight. On the timeline the character first acts once its
+        gauge has filled, 1/speed after now.
+
+        :param ready: Start with a full gauge and act now instead, e.g. the
+            character that starts the fight
+        :raises CharacterNotInCombatError: If character is not a DungeonCharacter
+        """
+        if not isinstance(character, DungeonCharacter):
+            raise CharacterNotInCombatError(f"{character} is not a valid combat entity")
+        if character in self._entries:
+            return
+        speed = self._speed(character)
+        delay = Fraction(0) if ready else Fraction(1, speed)
+        entry = _Entry(self._time + delay, speed, next(self._sequence), character)
+        self._entries[character] = entry
+        heapq.heappush(self._heap, entry)
+        bisect.insort(self._order, entry, key=_initiative)
+
+    def remove(self, character: DungeonCharacter) -> None:
+        """
+        Leave the fight, e.g. when defeated.
+
+        :raises CharacterNotInCombatError: If the character is not scheduled
+        """
+        entry = self._entries.pop(character, None)
+        if entry is None:
+            raise CharacterNotInCombatError(f"{character} is not in this fight")
+        entry.character = None
+        index = bisect.bisect_left(self._order, _initiative(entry), key=_initiative)
+        del self._order[index]
+        # Keep dead entries from piling up when many characters leave at once
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = [entry for entry in self._heap if entry.character]
+            heapq.heapify(self._heap)
+
+    def discard(self, character: DungeonCharacter) -> None:
+        """remove, but doing nothing for characters not in the fight."""
+        if character in self._entries:
+            self.remove(character)
+
+    def order(self) -> List[DungeonCharacter]:
+        """Everyone in the fight in initiative order, for round based turns."""
+        return [entry.character for entry in self._order]
+
+    def _top(self) -> _Entry:
+        heap = self._heap
+        while heap and heap[0].character is None:
+            heapq.heappop(heap)
+        if not heap:
+            raise CharacterNotInCombatError("Nobody is left in the fight")
+        return heap[0]
+
+    def peek(self) -> DungeonCharacter:
+        """The character that acts next on the timeline, without advancing it."""
+        return self._top().character
+
+    def next_actor(self) -> DungeonCharacter:
+        """
+        Advance the timeline to the next action and return who takes it.
+
+        :raises CharacterNotInCombatError: If nobody is left in the fight
+        """
+        entry = self._top()
+        self._time = entry.time
+        entry.time += Fraction(1, entry.speed)
+        heapq.heapreplace(self._heap, entry)
+        return entry.character
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._entries.clear()
+        self._order.clear()
+        self._time = Fraction(0)
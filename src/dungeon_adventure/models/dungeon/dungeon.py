@@ -1,5 +1,6 @@
 from typing import Dict, TYPE_CHECKING
 
+from dungeon_adventure.models.dungeon.fog_of_war import FogOfWar
 from dungeon_adventure.models.dungeon.room import Room
 from dungeon_adventure.enums.room_types import Direction
 
@@ -17,6 +18,25 @@ if TYPE_CHECKING:
 class Dungeon:
     def __init__(self):
         self.rooms: Dict[str, "Room"] = {}
+        # Explored/visible flags of every room, indexed by Room.fog_index
+        self.fog: FogOfWar = FogOfWar()
+        self._next_fog_index: int = 0
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Saves made before FogOfWar kept the flags on each room
+        if "fog" not in state:
+            self.fog = FogOfWar(len(self.rooms))
+            self._next_fog_index = 0
+            for room in self.rooms.values():
+                room.attach_fog(self.fog, self._next_fog_index)
+                self._next_fog_index += 1
+
+    def percent_explored(self) -> float:
+        """Percentage of the dungeon's rooms the player has entered."""
+        if not self.rooms:
+            return 0.0
+        return 100.0 * self.fog.explored_count / len(self.rooms)
 
     def get_rooms(self):
         return list(self.rooms.values())
@@ -34,6 +54,8 @@ class Dungeon:
         if self.room_exists(name):
             raise DungeonError(f"Room '{name}' already exists in the dungeon.")
         room = Room(name)
+        room.attach_fog(self.fog, self._next_fog_index)
+        self._next_fog_index += 1
         self.rooms[name] = room
         return room
 
@@ -42,6 +64,7 @@ class Dungeon:
             raise DungeonError(f"Room '{name}' does not exist in the dungeon.")
         room_to_remove = self.rooms[name]
         self.disconnect_rooms(room_to_remove)
+        self.fog.clear(room_to_remove.fog_index)
         removed_room = self.rooms.pop(name)
         return removed_room
 
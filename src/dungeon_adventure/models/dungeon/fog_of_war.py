@@ -0,0 +1,223 @@
+from typing import Iterator, List
+
+
+def encode_runs(bits: bytes, size: int) -> bytes:
+    """
+    Run-length encode the first size bits of a bitmap.
+
+    The result is the lengths of alternating runs of clear and set bits, starting
+    with a (possibly empty) run of clear bits, each written as a LEB128 varint.
+    A mostly unexplored or fully explored map encodes to a handful of bytes.
+
+    :param bits: Bitmap with bit i stored in byte i // 8, least significant first
+    :param size: Number of bits to encode
+    :return: The encoded runs
+    """
+    runs: List[int] = []
+    current, length = 0, 0
+    full_bytes = size // 8
+    for byte in bits[:full_bytes]:
+        if byte == 0x00 or byte == 0xFF:
+            value = byte & 1
+            if value == current:
+                length += 8
+            else:
+                runs.append(length)
+                current, length = value, 8
+            continue
+        for shift in range(8):
+            value = (byte >> shift) & 1
+            if value == current:
+                length += 1
+            else:
+                runs.append(length)
+                current, length = value, 1
+    for index in range(full_bytes * 8, size):
+        value = (bits[index >> 3] >> (index & 7)) & 1
+        if value == current:
+            length += 1
+        else:
+            runs.append(length)
+            current, length = value, 1
+    runs.append(length)
+
+    encoded = bytearray()
+    for run in runs:
+        while run >= 0x80:
+            encoded.append((run & 0x7F) | 0x80)
+            run >>= 7
+        encoded.append(run)
+    return bytes(encoded)
+
+
+def decode_runs(encoded: bytes, size: int) -> bytearray:
+    """
+    Rebuild a bitmap of size bits from encode_runs output.
+
+    :raises ValueError: If the runs do not add up to size bits
+    """
+    bits = bytearray((size + 7) // 8)
+    position, value = 0, 0
+    for run in _read_varints(encoded):
+        if position + run > size:
+            raise ValueError(f"Encoded runs exceed the bitmap size of {size} bits")
+        if value:
+            _set_range(bits, position, position + run)
+        position += run
+        value ^= 1
+    if position != size:
+        raise ValueError(f"Encoded runs cover {position} of {size} bits")
+    return bits
+
+
+def _read_varints(encoded: bytes) -> Iterator[int]:
+    number, shift = 0, 0
+    for byte in encoded:
+        number |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield number
+            number, shift = 0, 0
+
+
+def _set_range(bits: bytearray, start: int, stop: int) -> None:
+    while start < stop and start & 7:
+        bits[start >> 3] |= 1 << (start & 7)
+        start += 1
+    full_bytes = (stop - start) >> 3
+    if full_bytes:
+        bits[start >> 3 : (start >> 3) + full_bytes] = b"\xff" * full_bytes
+        start += full_bytes << 3
+    while start < stop:
+        bits[start >> 3] |= 1 << (start & 7)
+        start += 1
+
+
+def _popcount(bits: bytes) -> int:
+    return int.from_bytes(bits, "little").bit_count()
+
+
+class FogOfWar:
+    """
+    Explored and visible flags for every room of a dungeon, one bit per room.
+
+    Rooms are addressed by the index their dungeon gives them (the cell index for
+    a GridDungeon). A room is explored once the player has entered it and visible
+    once it shows up on the maps; exploring a room also makes it visible. The
+    number of set bits is tracked as bits change, so counts are O(1).
+    """
+
+    __slots__ = ("_size", "_explored", "_visible", "_explored_count", "_visible_count")
+
+    def __init__(self, size: int = 0) -> None:
+        self._size: int = 0
+        self._explored: bytearray = bytearray()
+        self._visible: bytearray = bytearray()
+        self._explored_count: int = 0
+        self._visible_count: int = 0
+        self.resize(size)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def explored_count(self) -> int:
+        return self._explored_count
+
+    @property
+    def visible_count(self) -> int:
+        return self._visible_count
+
+    def resize(self, size: int) -> None:
+        """Grow the bitmaps to hold at least size rooms. Never shrinks."""
+        if size <= self._size:
+            return
+        extra = (size + 7) // 8 - len(self._explored)
+        if extra > 0:
+            self._explored.extend(bytes(extra))
+            self._visible.extend(bytes(extra))
+        self._size = size
+
+    def is_explored(self, index: int) -> bool:
+        return bool(self._explored[index >> 3] & (1 << (index & 7)))
+
+    def is_visible(self, index: int) -> bool:
+        return bool(self._visible[index >> 3] & (1 << (index & 7)))
+
+    def set_explored(self, index: int, value: bool = True) -> None:
+        """Set or clear the explored bit of a room. Exploring also reveals it."""
+        if value:
+            self.set_visible(index)
+        byte, mask = index >> 3, 1 << (index & 7)
+        if bool(self._explored[byte] & mask) is not bool(value):
+            self._explored[byte] ^= mask
+            self._explored_count += 1 if value else -1
+
+    def set_visible(self, index: int, value: bool = True) -> None:
+        byte, mask = index >> 3, 1 << (index & 7)
+        if bool(self._visible[byte] & mask) is not bool(value):
+            self._visible[byte] ^= mask
+            self._visible_count += 1 if value else -1
+
+    def clear(self, index: int) -> None:
+        """Forget everything about a room, e.g. when it is removed."""
+        self.set_explored(index, False)
+        self.set_visible(index, False)
+
+    def explored_indices(self) -> Iterator[int]:
+        return _iter_set_bits(self._explored, self._size)
+
+    def visible_indices(self) -> Iterator[int]:
+        return _iter_set_bits(self._visible, self._size)
+
+    def union(self, other: "FogOfWar") -> "FogOfWar":
+        """Return a map explored wherever either map is, e.g. to merge co-op runs."""
+        merged = FogOfWar(max(self._size, other._size))
+        merged._explored = _or_bytes(self._explored, other._explored)
+        merged._visible = _or_bytes(self._visible, other._visible)
+        merged._recount()
+        return merged
+
+    def __or__(self, other: "FogOfWar") -> "FogOfWar":
+        return self.union(other)
+
+    def _recount(self) -> None:
+        self._explored_count = _popcount(self._explored)
+        self._visible_count = _popcount(self._visible)
+
+    def __getstate__(self):
+        return {
+            "size": self._size,
+            "explored": encode_runs(self._explored, self._size),
+            "visible": encode_runs(self._visible, self._size),
+        }
+
+    def __setstate__(self, state):
+        self._size = state["size"]
+        self._explored = decode_runs(state["explored"], self._size)
+        self._visible = decode_runs(state["visible"], self._size)
+        self._recount()
+
+    def __repr__(self) -> str:
+        return (
+            f"FogOfWar(size={self._size}, explored={self._explored_count}, "
+            f"visible={self._visible_count})"
+        )
+
+
+def _or_bytes(first: bytearray, second: bytearray) -> bytearray:
+    length = max(len(first), len(second))
+    merged = int.from_bytes(first, "little") | int.from_bytes(second, "little")
+    return bytearray(merged.to_bytes(length, "little"))
+
+
+def _iter_set_bits(bits: bytearray, size: int) -> Iterator[int]:
+    for byte_index, byte in enumerate(bits):
+        if not byte:
+            continue
+        base = byte_index << 3
+        for shift in range(8):
+            if byte & (1 << shift) and base + shift < size:
+                yield base + shift
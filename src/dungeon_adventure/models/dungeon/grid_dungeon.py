@@ -0,0 +1,263 @@
+from collections.abc import MutableMapping
+from typing import Iterator, List, Optional, Tuple
+
+from dungeon_adventure.enums.room_types import Direction
+from dungeon_adventure.models.dungeon.dungeon import Dungeon, DungeonError
+from dungeon_adventure.models.dungeon.room import Room
+
+# One bit per door in a cell's door mask
+DOOR_NORTH, DOOR_EAST, DOOR_SOUTH, DOOR_WEST = 1, 2, 4, 8
+
+# (direction, door bit, opposite door bit, dx, dy) in Direction order, so the
+# entry for a direction is _DOORS[direction.ordinal]
+_DOORS: Tuple[Tuple[Direction, int, int, int, int], ...] = (
+    (Direction.NORTH, DOOR_NORTH, DOOR_SOUTH, 0, -1),
+    (Direction.EAST, DOOR_EAST, DOOR_WEST, 1, 0),
+    (Direction.SOUTH, DOOR_SOUTH, DOOR_NORTH, 0, 1),
+    (Direction.WEST, DOOR_WEST, DOOR_EAST, -1, 0),
+)
+
+
+class GridConnections(MutableMapping):
+    """
+    Direction -> Room view over one cell of a GridDungeon.
+
+    Behaves like the connections dict of a plain Room, but reads and writes the
+    cell's door mask instead of storing room references.
+    """
+
+    __slots__ = ("_grid", "_cell")
+
+    def __init__(self, grid: "GridDungeon", cell: int) -> None:
+        self._grid = grid
+        self._cell = cell
+
+    def __getitem__(self, direction: Direction) -> Optional[Room]:
+        grid = self._grid
+        bit, offset = grid._steps[direction.ordinal]
+        if grid._doors[self._cell] & bit:
+            return grid._cells[self._cell + offset]
+        return None
+
+    def __setitem__(self, direction: Direction, room: Optional[Room]) -> None:
+        if room is None:
+            self._grid.close_door(self._cell, direction)
+        else:
+            self._grid.open_door(self._cell, direction, room)
+
+    def __delitem__(self, direction: Direction) -> None:
+        self._grid.close_door(self._cell, direction)
+
+    def __iter__(self) -> Iterator[Direction]:
+        return iter(Direction)
+
+    def __len__(self) -> int:
+        return len(_DOORS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class GridRoom(Room):
+    """A room whose position and doors are stored in a GridDungeon."""
+
+    # Doors live in the grid's door masks, so no connections dict is allocated
+    _stores_connections = False
+    _connections: Optional[GridConnections] = None
+
+    def __init__(self, name: str, grid: "GridDungeon", cell: int) -> None:
+        """
+        Initialize a room at a cell of the grid.
+
+        :param name: The name of room
+        :param grid: The dungeon that owns the room
+        :param cell: Flat index of the room's cell (y * width + x)
+        """
+        super().__init__(name)
+        self.cell: int = cell
+        self._grid = grid
+
+    @property
+    def connections(self) -> GridConnections:
+        """Direction -> Room view over the room's doors, made on first use."""
+        if self._connections is None:
+            self._connections = GridConnections(self._grid, self.cell)
+        return self._connections
+
+    @property
+    def coordinates(self) -> Tuple[int, int]:
+        """(x, y) position of the room in the grid."""
+        return self._grid.cell_coordinates(self.cell)
+
+    def connect(self, direction: Direction, other_room: Room) -> bool:
+        """
+        Open the door towards the neighbouring room in the specified direction.
+
+        :param direction: The direction of the connection
+        :param other_room: The room to connect to, must be the grid neighbour
+        :return: True if the connection was made, False if the door was open
+        """
+        return self._grid.open_door(self.cell, direction, other_room)
+
+    def get_open_gates(self) -> List[Tuple[Direction, Room]]:
+        """
+        Get a list of open connections from this room.
+
+        :return: A list of tuples containing the direction and connected room
+        """
+        grid = self._grid
+        cells = grid._cells
+        cell = self.cell
+        return [
+            (direction, cells[cell + offset])
+            for direction, offset in grid._gates_by_mask[grid._doors[cell]]
+        ]
+
+
+class GridDungeon(Dungeon):
+    """
+    Dungeon backed by a flat width x height grid of cells.
+
+    Each cell holds at most one room and a 4-bit door mask, so rooms do not keep
+    references to their neighbours and neighbour lookups are index arithmetic.
+    Rooms are still registered by name, so get_room and connect_rooms work the
+    same as on a plain Dungeon.
+    """
+
+    def __init__(self, width: int, height: int, doors: Optional[bytearray] = None):
+        """
+        Create an empty grid.
+
+        :param width: Number of grid columns
+        :param height: Number of grid rows
+        :param doors: Door masks for every cell in row-major order. The masks must
+            be symmetric, i.e. a door recorded on one side is recorded on the other.
+        """
+        super().__init__()
+        if width < 1 or height < 1:
+            raise DungeonError("Grid width and height must be at least 1")
+        size = width * height
+        if doors is not None and len(doors) != size:
+            raise DungeonError(f"Expected {size} door masks, got {len(doors)}")
+        self._width: int = width
+        self._height: int = height
+        self._cells: List[Optional[GridRoom]] = [None] * size
+        # Rooms use their cell index as their fog of war bit
+        self.fog.resize(size)
+        self._doors: bytearray = (
+            bytearray(doors) if doors is not None else bytearray(size)
+        )
+        # Cell offsets only depend on the width, so precompute them per direction
+        # (indexed by Direction.ordinal) and, for open_gates, per door mask.
+        self._steps: Tuple[Tuple[int, int], ...] = tuple(
+            (bit, dy * width + dx) for _, bit, _, dx, dy in _DOORS
+        )
+        self._gates_by_mask: List[Tuple[Tuple[Direction, int], ...]] = [
+            tuple(
+                (direction, dy * width + dx)
+                for direction, bit, _, dx, dy in _DOORS
+                if mask & bit
+            )
+            for mask in range(16)
+        ]
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    def cell_coordinates(self, cell: int) -> Tuple[int, int]:
+        return cell % self._width, cell // self._width
+
+    def room_at(self, x: int, y: int) -> Optional[GridRoom]:
+        """Return the room at (x, y), or None for an empty or out of bounds cell."""
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return self._cells[y * self._width + x]
+        return None
+
+    def door_mask(self, x: int, y: int) -> int:
+        return self._doors[y * self._width + x]
+
+    def add_room(
+        self, name: str, x: Optional[int] = None, y: Optional[int] = None
+    ) -> GridRoom:
+        """Creates a room at (x, y), then returns the newly created room"""
+        if x is None or y is None:
+            raise DungeonError(f"Room '{name}' needs grid coordinates.")
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise DungeonError(f"({x}, {y}) is outside the dungeon grid.")
+        if self.room_exists(name):
+            raise DungeonError(f"Room '{name}' already exists in the dungeon.")
+        cell = y * self._width + x
+        if self._cells[cell] is not None:
+            raise DungeonError(
+                f"({x}, {y}) is already taken by '{self._cells[cell].name}'."
+            )
+        room = GridRoom(name, self, cell)
+        room.attach_fog(self.fog, cell)
+        self._cells[cell] = room
+        self.rooms[name] = room
+        return room
+
+    def remove_room(self, name: str) -> GridRoom:
+        room = super().remove_room(name)
+        self._cells[room.cell] = None
+        return room
+
+    def disconnect_rooms(self, room_to_disconnect: GridRoom) -> None:
+        """Close every door of the provided room"""
+        for direction, _ in room_to_disconnect.get_open_gates():
+            self.close_door(room_to_disconnect.cell, direction)
+
+    def add_and_connect_room(
+        self, new_room_name: str, existing_room_name: str, direction: Direction
+    ) -> GridRoom:
+        """Add a new room next to an existing room and connect the two"""
+        existing_room = self.get_room(existing_room_name)
+        x, y = existing_room.coordinates
+        _, _, _, dx, dy = _DOORS[direction.ordinal]
+        new_room = self.add_room(new_room_name, x + dx, y + dy)
+        existing_room.connect(direction, new_room)
+        return new_room
+
+    def neighbour(self, cell: int, direction: Direction) -> Optional[GridRoom]:
+        """Return the room behind the door of a cell, or None if it is closed."""
+        bit, offset = self._steps[direction.ordinal]
+        if self._doors[cell] & bit:
+            return self._cells[cell + offset]
+        return None
+
+    def open_gates(self, cell: int) -> List[Tuple[Direction, GridRoom]]:
+        cells = self._cells
+        return [
+            (direction, cells[cell + offset])
+            for direction, offset in self._gates_by_mask[self._doors[cell]]
+        ]
+
+    def open_door(self, cell: int, direction: Direction, other_room: Room) -> bool:
+        """
+        Open the door between a cell and its neighbour.
+
+        :return: True if the door was opened, False if it was already open
+        """
+        _, bit, opposite, dx, dy = _DOORS[direction.ordinal]
+        x, y = self.cell_coordinates(cell)
+        if self.room_at(x + dx, y + dy) is not other_room:
+            raise DungeonError(
+                f"'{other_room.name}' is not the {direction.name.lower()} neighbour "
+                f"of the room at ({x}, {y})."
+            )
+        if self._doors[cell] & bit:
+            return False
+        self._doors[cell] |= bit
+        self._doors[cell + dy * self._width + dx] |= opposite
+        return True
+
+    def close_door(self, cell: int, direction: Direction) -> None:
+        _, bit, opposite, dx, dy = _DOORS[direction.ordinal]
+        if self._doors[cell] & bit:
+            self._doors[cell] &= ~bit
+            self._doors[cell + dy * self._width + dx] &= ~opposite
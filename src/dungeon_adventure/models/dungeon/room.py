@@ -1,6 +1,7 @@
 from typing import Dict, List, Optional, TYPE_CHECKING, Tuple
 
 from dungeon_adventure.enums.room_types import Direction, RoomType
+from dungeon_adventure.models.dungeon.fog_of_war import FogOfWar
 from dungeon_adventure.models.characters.monster import Monster
 from dungeon_adventure.models.items.item import Item
 
@@ -8,8 +9,21 @@ if TYPE_CHECKING:
     from src.dungeon_adventure.models.characters.monster import Monster
     from src.dungeon_adventure.models.items import Item
 
+_NO_CONNECTIONS: Dict[Direction, Optional["Room"]] = {d: None for d in Direction}
+
+_OPPOSITES: Dict[Direction, Direction] = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.EAST: Direction.WEST,
+    Direction.WEST: Direction.EAST,
+}
+
 
 class Room:
+    # False for rooms whose doors are stored elsewhere, like GridRoom, which
+    # provide connections themselves
+    _stores_connections: bool = True
+
     def __init__(self, name: str, detailed_description: str = "") -> None:
         """
         Initialize a new room.
@@ -18,14 +32,19 @@ class Room:
         """
         self._room_type = RoomType.NORMAL
         self.name: str = name
-        self.is_visible: bool = False
-        self.is_explored: bool = False  # This is for fog of war
+        # Fog of war flags live in the dungeon's FogOfWar bitmap. A room that is
+        # not in a dungeon yet gets a one-room map the first time a flag is set.
+        self._fog: Optional[FogOfWar] = None
+        # This room's bit in the fog of war, assigned by the dungeon
+        self.fog_index: int = 0
         self.detailed_description: str = detailed_description
         self.items: List["Item"] = []
         self._monsters: List["Monster"] = []
-        self.connections: Dict[Direction, Optional["Room"]] = {
-            d: None for d in Direction
-        }  # Creating a map in Python is goated
+        if self._stores_connections:
+            # Copying the template skips re-hashing every Direction for each new room
+            self.connections: Dict[Direction, Optional["Room"]] = (
+                _NO_CONNECTIONS.copy()
+            )  # Creating a map in Python is goated
 
     @property
     def monsters(self) -> List[Monster]:
@@ -35,13 +54,54 @@ class Room:
     def monsters(self, value):
         self._monsters = value
 
+    def __setstate__(self, state):
+        # Saves made before FogOfWar stored the flags on the room
+        is_explored = state.pop("is_explored", False)
+        is_visible = state.pop("_is_visible", False)
+        self.__dict__.update(state)
+        if "_fog" not in state:
+            self._fog = None
+            self.fog_index = 0
+            self.is_visible = is_visible
+            self.is_explored = is_explored
+
+    def attach_fog(self, fog: FogOfWar, index: int) -> None:
+        """
+        Move the room's fog of war flags into a dungeon's map.
+
+        :param fog: The dungeon's FogOfWar
+        :param index: The room's bit in fog
+        """
+        is_visible, is_explored = self.is_visible, self.is_explored
+        fog.resize(index + 1)
+        fog.clear(index)
+        fog.set_visible(index, is_visible)
+        fog.set_explored(index, is_explored)
+        self._fog = fog
+        self.fog_index = index
+
+    def _writable_fog(self) -> FogOfWar:
+        if self._fog is None:
+            self._fog = FogOfWar(1)
+        return self._fog
+
     @property
     def is_visible(self) -> bool:
-        return self._is_visible
+        fog = self._fog
+        return fog is not None and fog.is_visible(self.fog_index)
 
     @is_visible.setter
     def is_visible(self, value):
-        self._is_visible = value
+        self._writable_fog().set_visible(self.fog_index, value)
+
+    @property
+    def is_explored(self) -> bool:
+        fog = self._fog
+        return fog is not None and fog.is_explored(self.fog_index)
+
+    @is_explored.setter
+    def is_explored(self, value):
+        self._writable_fog().set_explored(self.fog_index, value)
 
     def add_monster(self, monster: Monster) -> None:
         self.monsters.append(monster)
@@ -194,10 +254,4 @@ class Room:
         :param direction: The direction to find the opposite of
         :return: The opposite direction
         """
-        opposites = {
-            Direction.NORTH: Direction.SOUTH,
-            Direction.SOUTH: Direction.NORTH,
-            Direction.EAST: Direction.WEST,
-            Direction.WEST: Direction.EAST,
-        }
-        return opposites[direction]
+        return _OPPOSITES[direction]
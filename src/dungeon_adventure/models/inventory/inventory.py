@@ -1,69 +1,225 @@
-from typing import Dict, List, Optional, Tuple
+import uuid
+from typing import Dict, Hashable, List, Optional, Tuple
 
+from dungeon_adventure.enums.item_types import ItemType
 from dungeon_adventure.exceptions.player import InventoryFullError, ItemNotFoundError
-from dungeon_adventure.models.inventory.inventory_db import InventoryDatabase
+from dungeon_adventure.models.inventory.inventory_db import (
+    DEFAULT_FLUSH_INTERVAL,
+    INVENTORY_DB_PATH,
+    InventoryDatabase,
+)
 from dungeon_adventure.models.items import Item
 
 
+# An item's stack_key: its ItemDefinition, or its id if it has its own state
+StackKey = Hashable
+
+
 class Inventory:
-    def __init__(self, weight_limit: float = 50.0):
-        self._items: Dict[str, Tuple[Item, int]] = {}
+    """
+    Stacks of items with a weight limit.
+
+    Items without state of their own stack by definition, so ten healing
+    potions are one stack of ten whatever their ids; the first item added
+    stands for the stack. Items with state, such as weapons and their
+    durability, get a stack per item. The total weight and the name and item
+    type indexes are kept up to date as stacks change, so weight checks and
+    lookups do not scan the inventory. The indexes hold stack keys in insertion
+    order, in dicts used as ordered sets.
+    """
+
+    def __init__(
+        self,
+        weight_limit: float = 50.0,
+        database_path: str = INVENTORY_DB_PATH,
+        flush_interval: Optional[float] = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self._items: Dict[StackKey, Tuple[Item, int]] = {}
+        # Id of the item standing for each stack -> its stack key
+        self._keys_by_id: Dict[str, StackKey] = {}
         self._weight_limit: float = weight_limit
-        self._db = InventoryDatabase("")
+        self._total_weight: float = 0.0
+        self._keys_by_name: Dict[str, Dict[StackKey, None]] = {}
+        self._keys_by_type: Dict[ItemType, Dict[StackKey, None]] = {}
+        # Opens no connection until the first flush
+        self._db = InventoryDatabase(uuid.uuid4().hex, database_path, flush_interval)
 
     # pickle methods to exclude database since sqlite3 not serializable
     def __getstate__(self):
-        return self._items, self._weight_limit
+        return {
+            "items": list(self._items.values()),
+            "weight_limit": self._weight_limit,
+            "inventory_id": self._db.inventory_id,
+            "database_path": self._db.database_path,
+            "flush_interval": self._db.flush_interval,
+        }
 
     def __setstate__(self, state):
-        self._items, self._weight_limit = state
+        if isinstance(state, tuple):
+            # Saves made before write-behind persistence
+            items, weight_limit = state
+            state = {"items": items, "weight_limit": weight_limit}
+        stacks = state["items"]
+        if isinstance(stacks, dict):
+            # Saves made before stacking by definition were keyed by item id
+            stacks = list(stacks.values())
+        self._weight_limit = state["weight_limit"]
+        self._db = InventoryDatabase(
+            state.get("inventory_id", uuid.uuid4().hex),
+            state.get("database_path", INVENTORY_DB_PATH),
+            state.get("flush_interval", DEFAULT_FLUSH_INTERVAL),
+        )
+        self._items = {}
+        self._keys_by_id = {}
+        self._total_weight = 0.0
+        self._keys_by_name = {}
+        self._keys_by_type = {}
+        for item, quantity in stacks:
+            self._total_weight += item.weight * quantity
+            key = item.stack_key
+            if key in self._items:
+                # Merged into an earlier stack, drop its own row
+                self._db.record_quantity(item.id, item.name, 0)
+                item, quantity = self._items[key][0], self._items[key][1] + quantity
+            else:
+                self._index_stack(key, item)
+            self._items[key] = (item, quantity)
+        # The database may not have seen these yet, queue them for the next flush
+        for item, quantity in self._items.values():
+            self._db.record_quantity(item.id, item.name, quantity)
+
+    def _index_stack(self, key: StackKey, item: Item) -> None:
+        self._keys_by_id[item.id] = key
+        self._keys_by_name.setdefault(item.name.casefold(), {})[key] = None
+        self._keys_by_type.setdefault(item.item_type, {})[key] = None
+
+    def _unindex_stack(self, key: StackKey, item: Item) -> None:
+        del self._keys_by_id[item.id]
+        for index, index_key in (
+            (self._keys_by_name, item.name.casefold()),
+            (self._keys_by_type, item.item_type),
+        ):
+            keys = index[index_key]
+            del keys[key]
+            if not keys:
+                del index[index_key]
+
+    def flush(self) -> int:
+        """Write queued changes to the database. Called at save points."""
+        return self._db.flush()
 
     def get_all_items(self) -> List[Tuple[Item, int]]:
-        return [(item, quantity) for item, quantity in self._items.values()]
+        return list(self._items.values())
 
     def add_item(self, item: Item) -> None:
-        self.validate_weight(item)
-        if item.id in self._items:
-            self._items[item.id] = (item, self._items[item.id][1] + 1)
+        self.add_items(item, 1)
+
+    def add_items(self, item: Item, quantity: int) -> None:
+        """
+        Add quantity units of an item in one step.
+
+        :raises ValueError: If quantity is not positive, or is more than one for
+            an item with its own state, which cannot be copied this way
+        :raises InventoryFullError: If the units would exceed the weight limit
+        """
+        if quantity < 1:
+            raise ValueError(f"Cannot add {quantity} of {item.name}")
+        if quantity > 1 and not item.stackable:
+            raise ValueError(f"{item.name} has its own state and does not stack")
+        self.validate_weight(item, quantity)
+        key = item.stack_key
+        stack = self._items.get(key)
+        if stack is None:
+            self._index_stack(key, item)
+            held = 0
         else:
-            self._items[item.id] = (item, 1)
+            item, held = stack
+        self._items[key] = (item, held + quantity)
+        self._total_weight += item.weight * quantity
+        self._db.record_quantity(item.id, item.name, held + quantity)
 
-    def validate_weight(self, item: Item) -> None:
-        current_weight = self.get_total_weight()
-        if current_weight + item.weight > self._weight_limit:
+    def validate_weight(self, item: Item, quantity: int = 1) -> None:
+        if self._total_weight + item.weight * quantity > self._weight_limit:
             raise InventoryFullError(
                 "Adding this item would exceed the inventory weight limit"
             )
 
     def remove_item_by_id(self, item_id: str) -> Item:
-        if item_id in self._items:
-            item, quantity = self._items[item_id]
-            if quantity > 1:
-                self._items[item_id] = (item, quantity - 1)
-            else:
-                del self._items[item_id]
-            return item
-        raise ItemNotFoundError(f"Item with id {item_id} not found in inventory")
+        """Remove one unit of the stack an item id stands for."""
+        key = self._keys_by_id.get(item_id)
+        if key is None:
+            raise ItemNotFoundError(f"Item with id {item_id} not found in inventory")
+        return self._remove_units(key, 1)
 
     def remove_item(self, item: Item) -> bool:
-        return self.remove_item_by_id(item.id) is not None
+        """Remove one unit of the item's stack, e.g. any one healing potion."""
+        return self.remove_items(item, 1) is not None
+
+    def remove_items(self, item: Item, quantity: int) -> Item:
+        """
+        Remove quantity units of an item's stack in one step.
+
+        :return: The item standing for the stack
+        :raises ItemNotFoundError: If the inventory holds fewer than quantity
+        """
+        key = item.stack_key
+        if self._items.get(key, (None, 0))[1] < quantity:
+            raise ItemNotFoundError(
+                f"Inventory does not hold {quantity} of {item.name}"
+            )
+        return self._remove_units(key, quantity)
+
+    def _remove_units(self, key: StackKey, quantity: int) -> Item:
+        if quantity < 1:
+            raise ValueError(f"Cannot remove {quantity} items")
+        item, held = self._items[key]
+        if held > quantity:
+            self._items[key] = (item, held - quantity)
+        else:
+            del self._items[key]
+            self._unindex_stack(key, item)
+        # Reset when empty so float rounding does not build up over a game
+        self._total_weight = (
+            self._total_weight - item.weight * quantity if self._items else 0.0
+        )
+        self._db.record_quantity(item.id, item.name, held - quantity)
+        return item
 
     def get_item_by_id(self, item_id: str) -> Optional[Item]:
-        if item_id in self._items:
-            return self._items[item_id][0]
-        return None
+        """The item standing for a stack, looked up by its id."""
+        key = self._keys_by_id.get(item_id)
+        return None if key is None else self._items[key][0]
 
     def get_item_by_name(self, name: str) -> Optional[Item]:
-        for item, _ in self._items.values():
-            if item.name.lower() == name.lower():
-                return item
-        return None
+        """The first item added with this name, ignoring case, or None."""
+        keys = self._keys_by_name.get(name.casefold())
+        if not keys:
+            return None
+        return self._items[next(iter(keys))][0]
+
+    def get_items_by_type(self, item_type: ItemType) -> List[Tuple[Item, int]]:
+        """Every (item, quantity) stack of one item type, in the order added."""
+        keys = self._keys_by_type.get(item_type, ())
+        return [self._items[key] for key in keys]
+
+    def has_item_type(self, item_type: ItemType) -> bool:
+        return item_type in self._keys_by_type
 
     def get_total_weight(self) -> float:
-        return sum(item.weight * quantity for item, quantity in self._items.values())
+        return self._total_weight
 
     def get_item_quantity(self, item_id: str) -> int:
-        return self._items[item_id][1] if item_id in self._items else 0
+        """Size of the stack an item id stands for, 0 if it stands for none."""
+        key = self._keys_by_id.get(item_id)
+        return 0 if key is None else self._items[key][1]
+
+    def count(self, item: Item) -> int:
+        """How many units of the item's stack the inventory holds."""
+        return self._items.get(item.stack_key, (None, 0))[1]
+
+    @property
+    def stack_count(self) -> int:
+        return len(self._items)
 
     @property
     def weight_limit(self) -> float:
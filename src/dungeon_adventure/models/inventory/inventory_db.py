@@ -1,35 +1,116 @@
-import sqlite3
-from typing import List, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 
-from src.dungeon_adventure.models.items.item import Item
+from dungeon_adventure.data import Database, get_database
+
+# An empty path is a private temporary database, removed when the game exits
+INVENTORY_DB_PATH = ""
+
+# Seconds between write-behind flushes, None to only flush at save points
+DEFAULT_FLUSH_INTERVAL: Optional[float] = 5.0
+
+INVENTORY_MIGRATIONS = (
+    """
+    CREATE TABLE IF NOT EXISTS inventory_items (
+        inventory_id TEXT NOT NULL,
+        item_id TEXT NOT NULL,
+        item_name TEXT NOT NULL,
+        quantity INTEGER NOT NULL,
+        PRIMARY KEY (inventory_id, item_id)
+    )
+    """,
+)
+
+_UPSERT_ITEM = (
+    "INSERT INTO inventory_items (inventory_id, item_id, item_name, quantity) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (inventory_id, item_id) DO UPDATE SET "
+    "item_name = excluded.item_name, quantity = excluded.quantity"
+)
+_DELETE_ITEM = "DELETE FROM inventory_items WHERE inventory_id = ? AND item_id = ?"
+_SELECT_ITEMS = (
+    "SELECT item_id, item_name, quantity FROM inventory_items "
+    "WHERE inventory_id = ? ORDER BY item_id"
+)
 
 
 class InventoryDatabase:
-    def __init__(self, database_path: str):
-        self.connection = sqlite3.connect(database_path)
-        self.cursor = self.connection.cursor()
-
-    def add_item(self, item: Item, quantity: int) -> int:
-        self.cursor.execute(
-            "INSERT INTO items (item_name, quantity) VALUES (?, ?)",
-            (item.name, quantity),
-        )
-        self.connection.commit()
-        return self.cursor.lastrowid
-
-    def get_all_items(self) -> List[Tuple[int, str, int]]:
-        self.cursor.execute("SELECT * FROM items")
-        return self.cursor.fetchall()
-
-    def get_item_by_id(self, item_id: int) -> Tuple[int, str, int]:
-        self.cursor.execute("SELECT * FROM items WHERE id = ?", (item_id,))
-        return self.cursor.fetchone()
-
-    def update_item_quantity(self, item_id: int, new_quantity: int) -> None:
-        self.cursor.execute(
-            "UPDATE items SET quantity = ? WHERE id = ?", (new_quantity, item_id)
-        )
-        self.connection.commit()
-
-    def close(self):
-        self.connection.close()
+    """
+    Write-behind persistence for one inventory.
+
+    Changes are queued in memory, keeping only the latest quantity of each
+    item, and written in a single transaction when flush_interval has passed
+    since the last flush or when flush() is called at a save point. The
+    connection is only opened by the first flush or read, so creating an
+    inventory costs nothing.
+    """
+
+    def __init__(
+        self,
+        inventory_id: str,
+        database_path: str = INVENTORY_DB_PATH,
+        flush_interval: Optional[float] = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.inventory_id = inventory_id
+        self.database_path = database_path
+        self.flush_interval = flush_interval
+        # item_id -> (item_name, quantity), quantity 0 deletes the row
+        self._pending: Dict[str, Tuple[str, int]] = {}
+        self._last_flush: float = time.monotonic()
+
+    @property
+    def database(self) -> Database:
+        database = get_database(self.database_path)
+        database.migrate(INVENTORY_MIGRATIONS)
+        return database
+
+    @property
+    def pending_writes(self) -> int:
+        return len(self._pending)
+
+    def record_quantity(self, item_id: str, item_name: str, quantity: int) -> None:
+        """Queue the new quantity of an item, flushing if the interval has passed."""
+        self._pending[item_id] = (item_name, quantity)
+        if (
+            self.flush_interval is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write every queued change in one transaction.
+
+        :return: Number of items written
+        """
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        upserts = []
+        deletes = []
+        for item_id, (item_name, quantity) in pending.items():
+            if quantity > 0:
+                upserts.append((self.inventory_id, item_id, item_name, quantity))
+            else:
+                deletes.append((self.inventory_id, item_id))
+        try:
+            with self.database.transaction() as connection:
+                connection.executemany(_UPSERT_ITEM, upserts)
+                connection.executemany(_DELETE_ITEM, deletes)
+        except Exception:
+            # Queue the writes again for the next flush, unless a newer
+            # quantity for the same item was queued meanwhile
+            for item_id, change in pending.items():
+                self._pending.setdefault(item_id, change)
+            raise
+        return len(pending)
+
+    def get_all_items(self) -> List[Tuple[str, str, int]]:
+        """Stored (item_id, item_name, quantity) rows, after flushing."""
+        self.flush()
+        return self.database.query_all(_SELECT_ITEMS, (self.inventory_id,))
+
+    def close(self) -> None:
+        """Flush outstanding writes. The shared connection stays open."""
+        self.flush()
@@ -1,4 +1,5 @@
 from .item import Item
+from .item_definition import ItemDefinition
 from .pillar import (
     AbstractionPillar,
     EncapsulationPillar,
@@ -12,6 +13,7 @@ from .weapon import Bow, Sword, Weapon
 
 __all__ = [
     "Item",
+    "ItemDefinition",
     "Pillar",
     "AbstractionPillar",
     "EncapsulationPillar",
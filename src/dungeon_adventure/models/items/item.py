@@ -1,9 +1,31 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Tuple
 
 from dungeon_adventure.enums.item_types import ItemType
+from dungeon_adventure.models.items.item_definition import ItemDefinition
+
+
+@lru_cache(maxsize=None)
+def _slots(cls: type) -> Tuple[str, ...]:
+    return tuple(
+        slot
+        for klass in reversed(cls.__mro__)
+        for slot in klass.__dict__.get("__slots__", ())
+    )
 
 
 class Item(ABC):
+    """
+    An item in the game.
+
+    The name, description, weight and other fixed data live in a shared
+    ItemDefinition; an item itself only holds its id and, for subclasses that
+    declare them in __slots__, its mutable state.
+    """
+
+    __slots__ = ("_id", "_definition")
+
     def __init__(
         self,
         item_id: str,
@@ -11,32 +33,86 @@ class Item(ABC):
         description: str,
         weight: float,
         item_type: ItemType,
+        **details: Any,
     ):
+        """
+        :param details: Kind-specific ItemDefinition fields, e.g. heal_amount
+        """
         self._id = item_id
-        self._name = name
-        self._description = description
-        self._weight = weight
-        self._item_type = item_type
+        self._definition = ItemDefinition(
+            type(self), name, description, weight, item_type, **details
+        ).intern()
+
+    @classmethod
+    def from_definition(cls, definition: ItemDefinition, item_id: str) -> "Item":
+        item = cls.__new__(cls)
+        item._id = item_id
+        item._definition = definition
+        return item
+
+    def clone(self, item_id: str) -> "Item":
+        """Copy this item, sharing its definition, under a new id."""
+        item = self.__class__.__new__(self.__class__)
+        for slot in _slots(self.__class__):
+            setattr(item, slot, getattr(self, slot))
+        item._id = item_id
+        return item
 
     @property
     def id(self) -> str:
         return self._id
 
+    @property
+    def definition(self) -> ItemDefinition:
+        return self._definition
+
+    @property
+    def stackable(self) -> bool:
+        """Whether the item has no state of its own, so equal items can stack."""
+        return len(_slots(self.__class__)) == len(Item.__slots__)
+
+    @property
+    def stack_key(self):
+        """
+        What an inventory stacks this item under: its definition, or its id for
+        items with their own state such as durability.
+        """
+        return self._definition if self.stackable else self._id
+
     @property
     def name(self) -> str:
-        return self._name
+        return self._definition.name
 
     @property
     def description(self) -> str:
-        return self._description
+        return self._definition.description
 
     @property
     def weight(self) -> float:
-        return self._weight
+        return self._definition.weight
 
     @property
     def item_type(self) -> ItemType:
-        return self._item_type
+        return self._definition.item_type
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in _slots(self.__class__)}
+
+    def __setstate__(self, state):
+        if "_definition" not in state:
+            # Saves made before items shared their definitions kept every field
+            # in the instance dict, e.g. "_name" and "_durability"
+            fields = {
+                field: state.pop(f"_{field}")
+                for field in ItemDefinition._fields[1:]
+                if f"_{field}" in state
+            }
+            state["_definition"] = ItemDefinition(self.__class__, **fields)
+        for slot in _slots(self.__class__):
+            if slot in state:
+                setattr(self, slot, state[slot])
+        # Unpickled definitions are copies, share them again
+        self._definition = self._definition.intern()
 
     @abstractmethod
     def use(self, user):
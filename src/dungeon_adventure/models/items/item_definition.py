@@ -0,0 +1,50 @@
+from typing import Any, Dict, NamedTuple, Optional
+
+from dungeon_adventure.enums.item_types import (
+    ItemType,
+    PillarType,
+    PotionType,
+    WeaponType,
+)
+
+
+class ItemDefinition(NamedTuple):
+    """
+    Immutable data shared by every item of one kind.
+
+    Items only store their id, their definition and any state that changes
+    while playing, such as a weapon's durability. Fields that do not apply to
+    an item's kind are None. Definitions are interned, so every "Healing
+    Potion" in a dungeon points at the same tuple and the same strings.
+    """
+
+    item_class: type
+    name: str
+    description: str
+    weight: float
+    item_type: ItemType
+    potion_type: Optional[PotionType] = None
+    heal_amount: Optional[int] = None
+    weapon_type: Optional[WeaponType] = None
+    min_damage: Optional[int] = None
+    max_damage: Optional[int] = None
+    pillar_type: Optional[PillarType] = None
+    use_type: Optional[str] = None
+    auto_use: Optional[bool] = None
+
+    def intern(self) -> "ItemDefinition":
+        """Return the shared definition equal to this one."""
+        return _definitions.setdefault(self, self)
+
+    def create(self, item_id: str, **state: Any):
+        """
+        Create an item of this definition without running its constructor.
+
+        :param item_id: Id of the new item
+        :param state: Per-item state the item class needs, e.g. durability
+        """
+        return self.item_class.from_definition(self.intern(), item_id, **state)
+
+
+# Every definition in use, see ItemDefinition.intern
+_definitions: Dict[ItemDefinition, ItemDefinition] = {}
@@ -7,6 +7,8 @@ from dungeon_adventure.models.items import Item
 class Pillar(Item, ABC):
     """Represents a pillar of OO in the game."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         item_id: str,
@@ -22,16 +24,19 @@ class Pillar(Item, ABC):
         :param PillarType pillar_type: Type of pillar
         :param float weight: Weight of the pillar. Defaults to 1
         """
-        super().__init__(item_id, name, description, weight, ItemType.PILLAR)
-        self._pillar_type = pillar_type
+        super().__init__(
+            item_id, name, description, weight, ItemType.PILLAR, pillar_type=pillar_type
+        )
 
     @property
     def pillar_type(self) -> PillarType:
         """Type of pillar, e.g. Abstraction, Encapsulation"""
-        return self._pillar_type
+        return self._definition.pillar_type
 
 
 class AbstractionPillar(Pillar):
+    __slots__ = ()
+
     def __init__(
         self,
         item_id: str,
@@ -47,6 +52,8 @@ class AbstractionPillar(Pillar):
 
 
 class EncapsulationPillar(Pillar):
+    __slots__ = ()
+
     def __init__(
         self,
         item_id: str,
@@ -62,6 +69,8 @@ class EncapsulationPillar(Pillar):
 
 
 class InheritancePillar(Pillar):
+    __slots__ = ()
+
     def __init__(
         self,
         item_id: str,
@@ -77,6 +86,8 @@ class InheritancePillar(Pillar):
 
 
 class PolymorphismPillar(Pillar):
+    __slots__ = ()
+
     def __init__(
         self,
         item_id: str,
@@ -3,6 +3,8 @@ from dungeon_adventure.models.items import Item
 
 
 class Potion(Item):
+    __slots__ = ()
+
     def __init__(
         self,
         item_id: str,
@@ -10,13 +12,21 @@ class Potion(Item):
         description: str,
         weight: float,
         potion_type: PotionType,
+        **details,
     ):
-        super().__init__(item_id, name, description, weight, ItemType.POTION)
-        self._potion_type = potion_type
+        super().__init__(
+            item_id,
+            name,
+            description,
+            weight,
+            ItemType.POTION,
+            potion_type=potion_type,
+            **details,
+        )
 
     @property
     def potion_type(self) -> PotionType:
-        return self._potion_type
+        return self._definition.potion_type
 
     def use(self, user):
         # TODO: Implement general potion using logic
@@ -24,18 +34,30 @@ class Potion(Item):
 
 
 class HealingPotion(Potion):
+    __slots__ = ()
+
     def __init__(self, item_id: str, name: str, heal_amount: int, weight: float):
         super().__init__(
-            item_id, name, f"Heals for {heal_amount} HP", weight, PotionType.HEALING
+            item_id,
+            name,
+            f"Heals for {heal_amount} HP",
+            weight,
+            PotionType.HEALING,
+            heal_amount=heal_amount,
         )
-        self._heal_amount = heal_amount
+
+    @property
+    def heal_amount(self) -> int:
+        return self._definition.heal_amount
 
     def use(self, user):
-        user.heal(self._heal_amount)
+        user.heal(self._definition.heal_amount)
         return True
 
 
 class VisionPotion(Potion):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str = "Vision Potion",
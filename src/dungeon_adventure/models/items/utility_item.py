@@ -1,8 +1,11 @@
 from dungeon_adventure.enums.item_types import ItemType
 from dungeon_adventure.models.items import Item
+from dungeon_adventure.models.items.item_definition import ItemDefinition
 
 
 class UtilityItem(Item):
+    __slots__ = ("_durability",)
+
     def __init__(
         self,
         item_id: str,
@@ -13,14 +16,28 @@ class UtilityItem(Item):
         durability: int,
         auto_use: bool = True,
     ):
-        super().__init__(item_id, name, description, weight, ItemType.UTILITY)
-        self._use_type = use_type
+        super().__init__(
+            item_id,
+            name,
+            description,
+            weight,
+            ItemType.UTILITY,
+            use_type=use_type,
+            auto_use=auto_use,
+        )
         self._durability = durability
-        self._auto_use = auto_use
+
+    @classmethod
+    def from_definition(
+        cls, definition: ItemDefinition, item_id: str, durability: int
+    ) -> "UtilityItem":
+        item = super().from_definition(definition, item_id)
+        item._durability = durability
+        return item
 
     @property
     def use_type(self) -> str:
-        return self._use_type
+        return self._definition.use_type
 
     @property
     def durability(self) -> int:
@@ -28,7 +45,7 @@ class UtilityItem(Item):
 
     @property
     def auto_use(self) -> bool:
-        return self._auto_use
+        return self._definition.auto_use
 
     def use(self, user):
         if self._durability > 0:
@@ -41,5 +58,5 @@ class UtilityItem(Item):
 
     def __str__(self):
         return (
-            f"{self.name} (Utility - {self._use_type}, Durability: {self._durability})"
+            f"{self.name} (Utility - {self.use_type}, Durability: {self._durability})"
         )
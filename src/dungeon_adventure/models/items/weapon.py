@@ -1,8 +1,11 @@
 from dungeon_adventure.enums.item_types import ItemType, WeaponType
 from dungeon_adventure.models.items import Item
+from dungeon_adventure.models.items.item_definition import ItemDefinition
 
 
 class Weapon(Item):
+    __slots__ = ("_durability",)
+
     def __init__(
         self,
         item_id: str,
@@ -14,23 +17,37 @@ class Weapon(Item):
         max_damage: int,
         durability: int,
     ):
-        super().__init__(item_id, name, description, weight, ItemType.WEAPON)
-        self._weapon_type = weapon_type
-        self._min_damage = min_damage
-        self._max_damage = max_damage
+        super().__init__(
+            item_id,
+            name,
+            description,
+            weight,
+            ItemType.WEAPON,
+            weapon_type=weapon_type,
+            min_damage=min_damage,
+            max_damage=max_damage,
+        )
         self._durability = durability
 
+    @classmethod
+    def from_definition(
+        cls, definition: ItemDefinition, item_id: str, durability: int
+    ) -> "Weapon":
+        weapon = super().from_definition(definition, item_id)
+        weapon._durability = durability
+        return weapon
+
     @property
     def weapon_type(self) -> WeaponType:
-        return self._weapon_type
+        return self._definition.weapon_type
 
     @property
     def min_damage(self) -> int:
-        return self._min_damage
+        return self._definition.min_damage
 
     @property
     def max_damage(self) -> int:
-        return self._max_damage
+        return self._definition.max_damage
 
     @property
     def durability(self) -> int:
@@ -45,6 +62,8 @@ class Weapon(Item):
 
 
 class Sword(Weapon):
+    __slots__ = ()
+
     def __init__(
         self, item_id: str, name: str, damage: int, weight: float, durability: int
     ):
@@ -61,6 +80,8 @@ class Sword(Weapon):
 
 
 class Bow(Weapon):
+    __slots__ = ()
+
     def __init__(
         self, item_id: str, name: str, damage: int, weight: float, durability: int
     ):
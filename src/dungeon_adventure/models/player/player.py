@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from dungeon_adventure.enums.item_types import PotionType
+from dungeon_adventure.enums.item_types import ItemType, PillarType, PotionType
 from dungeon_adventure.models.characters.hero import Hero
 from dungeon_adventure.models.dungeon.room import Room
 from dungeon_adventure.models.inventory.inventory import Inventory
@@ -37,9 +37,14 @@ class Player:
     def inventory(self) -> Inventory:
         return self._inventory
 
-    def use_item(self, item: Item, minimap) -> bool:
+    def has_all_pillars(self) -> bool:
+        """Whether the inventory holds a pillar of every type, to win at the exit."""
+        pillars = self._inventory.get_items_by_type(ItemType.PILLAR)
+        return len({item.pillar_type for item, _ in pillars}) == len(PillarType)
+
+    def use_item(self, item: Item, minimap=None) -> bool:
         self.logger.info(f"Item used: {item.name}")
-        if item.name == "Vision Potion":
+        if item.name == "Vision Potion" and minimap is not None:
             self.logger.info("Activating vision potion")
             minimap.activate_vision_potion()
         if self._inventory.remove_item(item):
@@ -1,10 +1,47 @@
 import random
+from typing import Dict, List, Optional, Tuple
+
 from dungeon_adventure.enums.item_types import PillarType, PotionType, WeaponType
 from dungeon_adventure.enums.room_types import Direction, RoomType
+from dungeon_adventure.models.characters.monster_templates import (
+    MonsterTemplateRegistry,
+    SpawnTable,
+)
 from dungeon_adventure.models.dungeon.dungeon import Dungeon
-from dungeon_adventure.services.item_factory import ItemFactory
+from dungeon_adventure.models.dungeon.grid_dungeon import (
+    DOOR_EAST,
+    DOOR_NORTH,
+    DOOR_SOUTH,
+    DOOR_WEST,
+    GridDungeon,
+)
+from dungeon_adventure.models.dungeon.room import Room
+from dungeon_adventure.services.item_factory import HEALING_POTION, ItemFactory
+from dungeon_adventure.services.rng import RandomStreams, streams
+from dungeon_adventure.utils.gc_utils import paused_gc
 from src.dungeon_adventure.models.characters.monster import Monster
 
+# (door bit, opposite door bit, dx, dy), matching Direction.get_coordinate_change
+_STEPS: Tuple[Tuple[int, int, int, int], ...] = (
+    (DOOR_NORTH, DOOR_SOUTH, 0, -1),
+    (DOOR_EAST, DOOR_WEST, 1, 0),
+    (DOOR_SOUTH, DOOR_NORTH, 0, 1),
+    (DOOR_WEST, DOOR_EAST, -1, 0),
+)
+
+_PILLARS: Tuple[Tuple[PillarType, str, str], ...] = (
+    (
+        PillarType.ABSTRACTION,
+        "Abstraction Pillar",
+        "A pillar that is a bit abstract.",
+    ),
+    (PillarType.ENCAPSULATION, "Encapsulation Pillar", "A encapsulated pillar"),
+    (PillarType.INHERITANCE, "Inheritance Pillar", "An inheritance pillar"),
+    (PillarType.POLYMORPHISM, "Polymorphism Pillar", "A polymorphism pillar"),
+)
+
+ENTRANCE_ROOM_NAME = "Room 1 - Entrance Hall"
+
 
 class DungeonGenerator:
     @staticmethod
@@ -90,9 +127,7 @@ class DungeonGenerator:
                 10,
             )
         )
-        room2.add_item(
-            item_factory.create_potion("Healing Potion", PotionType.HEALING, 300, 2)
-        )
+        room2.add_item(item_factory.create(HEALING_POTION))
 
         room3 = dungeon.get_room("Room 3")
         room3.add_item(item_factory.create_rope())
@@ -105,9 +140,7 @@ class DungeonGenerator:
         random_monster_6 = monster_instance.generate_random_monster()
         room7.add_monster(random_monster_5)
         room7.add_monster(random_monster_6)
-        room7.add_item(
-            item_factory.create_potion("Healing Potion", PotionType.HEALING, 300, 2)
-        )
+        room7.add_item(item_factory.create(HEALING_POTION))
         room7.add_item(
             item_factory.create_pillar(
                 PillarType.INHERITANCE,
@@ -120,9 +153,7 @@ class DungeonGenerator:
         room8 = dungeon.get_room("Room 8")
         random_monster_12 = monster_instance.generate_random_monster()
         room8.add_monster(random_monster_12)
-        room8.add_item(
-            item_factory.create_potion("Healing Potion", PotionType.HEALING, 300, 2)
-        )
+        room8.add_item(item_factory.create(HEALING_POTION))
 
         room9 = dungeon.get_room("Room 9")
         random_monster_7 = monster_instance.generate_random_monster()
@@ -148,9 +179,7 @@ class DungeonGenerator:
         room11.add_monster(random_monster_13)
 
         room12 = dungeon.get_room("Room 12")
-        room12.add_item(
-            item_factory.create_potion("Healing Potion", PotionType.HEALING, 300, 2)
-        )
+        room12.add_item(item_factory.create(HEALING_POTION))
         room12.add_item(
             item_factory.create_weapon("Rusty Sword", WeaponType.SWORD, 10, 7, 100)
         )
@@ -161,9 +190,7 @@ class DungeonGenerator:
         room13.add_monster(random_monster_3)
         room13.add_monster(random_monster_4)
         room13.add_item(item_factory.create_rope())
-        room13.add_item(
-            item_factory.create_potion("Healing Potion", PotionType.HEALING, 300, 2)
-        )
+        room13.add_item(item_factory.create(HEALING_POTION))
         room13.add_item(
             item_factory.create_pillar(
                 PillarType.ABSTRACTION,
@@ -186,3 +213,265 @@ class DungeonGenerator:
         room15.add_monster(random_monster_11)
 
         return dungeon
+
+    @staticmethod
+    def generate_procedural(
+        width: int,
+        height: int,
+        seed: Optional[int] = None,
+        density: float = 0.6,
+        loop_chance: float = 0.1,
+        pit_chance: float = 0.05,
+        monster_chance: float = 0.1,
+        max_monsters_per_room: int = 2,
+        potion_chance: float = 0.05,
+        grid: bool = False,
+        spawn_table: Optional[SpawnTable] = None,
+    ) -> Dungeon:
+        """
+        Generate a connected dungeon laid out on a width x height grid.
+
+        Rooms are carved outward from the entrance one cell at a time, so every
+        room is reachable. The exit goes in the room furthest from the entrance
+        along the carved paths, and the four pillars go in distinct normal rooms.
+        The same seed and arguments always produce the same dungeon layout.
+        Layout and monsters come from the generation stream and potions from the
+        loot stream, so changing potion_chance does not move the rooms.
+
+        :param width: Number of grid columns
+        :param height: Number of grid rows
+        :param seed: Seed for the layout, None to draw from the current session
+        :param density: Fraction of grid cells that become rooms (0 < density <= 1)
+        :param loop_chance: Chance of an extra door between two adjacent rooms
+        :param pit_chance: Chance of a normal room becoming a pit
+        :param monster_chance: Chance of a normal room holding monsters
+        :param max_monsters_per_room: Upper bound of monsters in a single room
+        :param potion_chance: Chance of a normal room holding a healing potion
+        :param grid: Store the rooms in a GridDungeon instead of a plain Dungeon
+        :param spawn_table: Weighted monster types, DEFAULT_SPAWN_TABLE if not given
+        :return: The generated dungeon
+        """
+        if width < 1 or height < 1:
+            raise ValueError("Dungeon width and height must be at least 1")
+        if not 0 < density <= 1:
+            raise ValueError("Dungeon density must be between 0 and 1")
+        room_count = int(width * height * density)
+        if room_count < 2 + len(_PILLARS):
+            raise ValueError(
+                f"A {width}x{height} grid at density {density} is too small to "
+                f"hold an entrance, an exit and {len(_PILLARS)} pillars"
+            )
+
+        session = RandomStreams(seed) if seed is not None else streams()
+        rng = session.generation
+        with paused_gc():
+            cells, doors, depths = DungeonGenerator._carve_layout(
+                width, height, room_count, rng
+            )
+            DungeonGenerator._add_loops(width, height, cells, doors, loop_chance, rng)
+            exit_index = max(range(room_count), key=depths.__getitem__)
+
+            dungeon = GridDungeon(width, height, doors) if grid else Dungeon()
+            rooms = DungeonGenerator._build_rooms(
+                dungeon, width, cells, doors, exit_index
+            )
+            DungeonGenerator._populate_rooms(
+                rooms,
+                exit_index,
+                rng,
+                session.loot,
+                pit_chance,
+                monster_chance,
+                max_monsters_per_room,
+                potion_chance,
+                spawn_table,
+            )
+        return dungeon
+
+    @staticmethod
+    def _carve_layout(
+        width: int, height: int, room_count: int, rng: random.Random
+    ) -> Tuple[List[int], bytearray, List[int]]:
+        """
+        Grow a spanning tree of room_count cells from a random starting cell.
+
+        :return: The carved cells in carve order, the door mask of every grid cell
+            and the carve depth of every room
+        """
+        size = width * height
+        doors = bytearray(size)
+        # 0 = untouched, 1 = on the frontier, 2 = carved
+        state = bytearray(size)
+        depth_of = [0] * size
+        cells: List[int] = []
+        depths: List[int] = []
+        frontier = [rng.randrange(size)]
+        random_float = rng.random
+
+        while len(cells) < room_count:
+            # Swap-remove a random frontier cell so each pick is O(1)
+            pick = int(random_float() * len(frontier))
+            cell = frontier[pick]
+            frontier[pick] = frontier[-1]
+            frontier.pop()
+
+            # One pass over the neighbours finds the carved cells to attach to
+            # and the untouched cells that join the frontier
+            x, y = cell % width, cell // width
+            carved = []
+            for bit, opposite, dx, dy in _STEPS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    neighbour = ny * width + nx
+                    neighbour_state = state[neighbour]
+                    if neighbour_state == 2:
+                        carved.append((bit, opposite, neighbour))
+                    elif not neighbour_state:
+                        state[neighbour] = 1
+                        frontier.append(neighbour)
+
+            if carved:
+                bit, opposite, parent = carved[int(random_float() * len(carved))]
+                doors[cell] |= bit
+                doors[parent] |= opposite
+                depth_of[cell] = depth_of[parent] + 1
+            state[cell] = 2
+            cells.append(cell)
+            depths.append(depth_of[cell])
+
+        return cells, doors, depths
+
+    @staticmethod
+    def _add_loops(
+        width: int,
+        height: int,
+        cells: List[int],
+        doors: bytearray,
+        loop_chance: float,
+        rng: random.Random,
+    ) -> None:
+        """Open extra east/south doors between adjacent carved cells."""
+        if loop_chance <= 0:
+            return
+        carved = bytearray(width * height)
+        for cell in cells:
+            carved[cell] = 1
+        for cell in cells:
+            x, y = cell % width, cell // width
+            east, south = cell + 1, cell + width
+            if (
+                x + 1 < width
+                and carved[east]
+                and not doors[cell] & DOOR_EAST
+                and rng.random() < loop_chance
+            ):
+                doors[cell] |= DOOR_EAST
+                doors[east] |= DOOR_WEST
+            if (
+                y + 1 < height
+                and carved[south]
+                and not doors[cell] & DOOR_SOUTH
+                and rng.random() < loop_chance
+            ):
+                doors[cell] |= DOOR_SOUTH
+                doors[south] |= DOOR_NORTH
+
+    @staticmethod
+    def _build_rooms(
+        dungeon: Dungeon,
+        width: int,
+        cells: List[int],
+        doors: bytearray,
+        exit_index: int,
+    ) -> List[Room]:
+        """Create a room for every carved cell and link them through the door masks."""
+        grid = isinstance(dungeon, GridDungeon)
+        rooms = []
+        room_at = {}
+        for index, cell in enumerate(cells):
+            if index == 0:
+                name = ENTRANCE_ROOM_NAME
+            elif index == exit_index:
+                name = f"Room {index + 1} - Exit Chamber"
+            else:
+                name = f"Room {index + 1}"
+            if grid:
+                room = dungeon.add_room(name, cell % width, cell // width)
+            else:
+                room = dungeon.add_room(name)
+            rooms.append(room)
+            room_at[cell] = room
+
+        # A grid dungeon was handed the door masks directly
+        if not grid:
+            DungeonGenerator._link_rooms(room_at, width, doors)
+
+        rooms[0].room_type = RoomType.ENTRANCE
+        rooms[exit_index].room_type = RoomType.EXIT
+        return rooms
+
+    @staticmethod
+    def _link_rooms(room_at: Dict[int, Room], width: int, doors: bytearray) -> None:
+        """Write the door masks into the connections of plain rooms."""
+        # Every door is recorded on both cells, so walking east and south covers
+        # each one once. The rooms are brand new, so the links can be written
+        # directly instead of going through the checks in Room.connect.
+        north, east, south, west = (
+            Direction.NORTH,
+            Direction.EAST,
+            Direction.SOUTH,
+            Direction.WEST,
+        )
+        for cell, room in room_at.items():
+            mask = doors[cell]
+            if mask & DOOR_EAST:
+                neighbour = room_at[cell + 1]
+                room.connections[east] = neighbour
+                neighbour.connections[west] = room
+            if mask & DOOR_SOUTH:
+                neighbour = room_at[cell + width]
+                room.connections[south] = neighbour
+                neighbour.connections[north] = room
+
+    @staticmethod
+    def _populate_rooms(
+        rooms: List[Room],
+        exit_index: int,
+        rng: random.Random,
+        loot_rng: random.Random,
+        pit_chance: float,
+        monster_chance: float,
+        max_monsters_per_room: int,
+        potion_chance: float,
+        spawn_table: Optional[SpawnTable],
+    ) -> None:
+        """Place the pillars, pits, monsters and potions into the normal rooms."""
+        item_factory = ItemFactory()
+        normal_indices = [i for i in range(1, len(rooms)) if i != exit_index]
+        pillar_indices = rng.sample(normal_indices, len(_PILLARS))
+        for index, (pillar_type, name, description) in zip(pillar_indices, _PILLARS):
+            rooms[index].add_item(
+                item_factory.create_pillar(pillar_type, name, description, 10)
+            )
+
+        pillar_rooms = set(pillar_indices)
+        # Rooms get their monster counts first so the whole level is spawned in
+        # one batch afterwards
+        monster_rooms: List[Room] = []
+        for index in normal_indices:
+            room = rooms[index]
+            if index not in pillar_rooms and rng.random() < pit_chance:
+                room.room_type = RoomType.PIT
+                continue
+            if rng.random() < monster_chance:
+                monster_rooms.extend([room] * rng.randint(1, max_monsters_per_room))
+            if loot_rng.random() < potion_chance:
+                room.add_item(item_factory.create(HEALING_POTION))
+
+        # Only read the monster database if monsters can spawn
+        if monster_rooms:
+            monsters = MonsterTemplateRegistry.default().spawn_batch(
+                len(monster_rooms), spawn_table, rng
+            )
+            for room, monster in zip(monster_rooms, monsters):
+                room.add_monster(monster)
@@ -1,10 +1,19 @@
-from dungeon_adventure.enums.item_types import PillarType, PotionType, WeaponType
+from typing import Callable, Dict
+
+from dungeon_adventure.enums.item_types import (
+    ItemType,
+    PillarType,
+    PotionType,
+    WeaponType,
+)
 from dungeon_adventure.models.items import (
     AbstractionPillar,
     Bow,
     EncapsulationPillar,
     HealingPotion,
     InheritancePillar,
+    Item,
+    ItemDefinition,
     Pillar,
     PolymorphismPillar,
     Potion,
@@ -13,6 +22,22 @@ from dungeon_adventure.models.items import (
     Weapon,
 )
 
+# The potion placed around every dungeon, equal to
+# create_potion("Healing Potion", PotionType.HEALING, 300, 2)
+HEALING_POTION = ItemDefinition(
+    HealingPotion,
+    "Healing Potion",
+    "Heals for 300 HP",
+    2,
+    ItemType.POTION,
+    potion_type=PotionType.HEALING,
+    heal_amount=300,
+).intern()
+
+# Definition made by each distinct set of create_* arguments, so repeated calls
+# skip the item constructors
+_definitions_by_arguments: Dict[tuple, ItemDefinition] = {}
+
 
 class ItemFactory:
     def __init__(self):
@@ -22,6 +47,29 @@ class ItemFactory:
         self._item_counter += 1
         return f"ITEM_{self._item_counter:04d}"
 
+    def create(self, definition: ItemDefinition, **state) -> Item:
+        """
+        Create an item from a shared definition, skipping the item constructors.
+
+        :param state: Per-item state the item class needs, e.g. durability
+        """
+        return definition.create(self._generate_item_id(), **state)
+
+    def clone(self, item: Item) -> Item:
+        """Copy an item, including its state, under a new id."""
+        return item.clone(self._generate_item_id())
+
+    def _create_cached(
+        self, arguments: tuple, construct: Callable[[str], Item], **state
+    ) -> Item:
+        item_id = self._generate_item_id()
+        definition = _definitions_by_arguments.get(arguments)
+        if definition is not None:
+            return definition.item_class.from_definition(definition, item_id, **state)
+        item = construct(item_id)
+        _definitions_by_arguments[arguments] = item.definition
+        return item
+
     def create_weapon(
         self,
         name: str,
@@ -30,39 +78,47 @@ class ItemFactory:
         weight: float,
         durability: int,
     ) -> Weapon:
-        item_id = self._generate_item_id()
+        def construct(item_id: str) -> Weapon:
+            if weapon_type == WeaponType.SWORD:
+                return Sword(item_id, name, damage, weight, durability)
+            elif weapon_type == WeaponType.BOW:
+                return Bow(item_id, name, damage, weight, durability)
+            else:
+                return Weapon(
+                    item_id,
+                    name,
+                    f"A {weapon_type.name.lower()}",
+                    weight,
+                    weapon_type,
+                    damage,
+                    damage + 2,
+                    durability,
+                )
 
-        if weapon_type == WeaponType.SWORD:
-            return Sword(item_id, name, damage, weight, durability)
-        elif weapon_type == WeaponType.BOW:
-            return Bow(item_id, name, damage, weight, durability)
-        else:
-            return Weapon(
-                item_id,
-                name,
-                f"A {weapon_type.name.lower()}",
-                weight,
-                weapon_type,
-                damage,
-                damage + 2,
-                durability,
-            )
+        return self._create_cached(
+            ("weapon", name, weapon_type, damage, weight),
+            construct,
+            durability=durability,
+        )
 
     def create_potion(
         self, name: str, potion_type: PotionType, effect_value: int, weight: float
     ) -> Potion:
-        item_id = self._generate_item_id()
+        def construct(item_id: str) -> Potion:
+            if potion_type == PotionType.HEALING:
+                return HealingPotion(item_id, name, effect_value, weight)
+            else:
+                return Potion(
+                    item_id,
+                    name,
+                    f"A {potion_type.name.lower()} potion",
+                    weight,
+                    potion_type,
+                )
 
-        if potion_type == PotionType.HEALING:
-            return HealingPotion(item_id, name, effect_value, weight)
-        else:
-            return Potion(
-                item_id,
-                name,
-                f"A {potion_type.name.lower()} potion",
-                weight,
-                potion_type,
-            )
+        return self._create_cached(
+            ("potion", name, potion_type, effect_value, weight), construct
+        )
 
     def create_pillar(
         self,
@@ -71,17 +127,21 @@ class ItemFactory:
         description: str,
         weight: float = 1.0,
     ) -> Pillar:
-        item_id = self._generate_item_id()
-        if pillar_type == PillarType.ABSTRACTION:
-            return AbstractionPillar(item_id, name, description, weight)
-        elif pillar_type == PillarType.ENCAPSULATION:
-            return EncapsulationPillar(item_id, name, description, weight)
-        elif pillar_type == PillarType.INHERITANCE:
-            return InheritancePillar(item_id, name, description, weight)
-        elif pillar_type == PillarType.POLYMORPHISM:
-            return PolymorphismPillar(item_id, name, description, weight)
-        else:
-            raise ValueError(f"Unknown pillar type: {pillar_type}")
+        def construct(item_id: str) -> Pillar:
+            if pillar_type == PillarType.ABSTRACTION:
+                return AbstractionPillar(item_id, name, description, weight)
+            elif pillar_type == PillarType.ENCAPSULATION:
+                return EncapsulationPillar(item_id, name, description, weight)
+            elif pillar_type == PillarType.INHERITANCE:
+                return InheritancePillar(item_id, name, description, weight)
+            elif pillar_type == PillarType.POLYMORPHISM:
+                return PolymorphismPillar(item_id, name, description, weight)
+            else:
+                raise ValueError(f"Unknown pillar type: {pillar_type}")
+
+        return self._create_cached(
+            ("pillar", pillar_type, name, description, weight), construct
+        )
 
     def create_utility_item(
         self,
@@ -92,9 +152,12 @@ class ItemFactory:
         durability: int,
         auto_use: bool = True,
     ) -> UtilityItem:
-        item_id = self._generate_item_id()
-        return UtilityItem(
-            item_id, name, description, weight, use_type, durability, auto_use
+        return self._create_cached(
+            ("utility", name, description, weight, use_type, auto_use),
+            lambda item_id: UtilityItem(
+                item_id, name, description, weight, use_type, durability, auto_use
+            ),
+            durability=durability,
         )
 
     def create_rope(self) -> UtilityItem:
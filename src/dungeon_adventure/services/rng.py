@@ -0,0 +1,143 @@
+import hashlib
+import random
+import secrets
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Well known stream names
+COMBAT = "combat"
+LOOT = "loot"
+GENERATION = "generation"
+
+
+def derive_seed(seed: int, *path) -> int:
+    """
+    128-bit seed for the stream at path under a session seed.
+
+    Derived with a hash rather than hash(), so it is the same in every run and
+    every process.
+    """
+    digest = hashlib.blake2b(repr((seed, *path)).encode(), digest_size=16)
+    return int.from_bytes(digest.digest(), "little")
+
+
+class RandomStream(random.Random):
+    """
+    One named stream of random numbers, e.g. the combat rolls of a session.
+
+    The stream is keyed by (session seed, name, index): index n of a name is
+    always the same sequence, whatever other streams were drawn from before,
+    so a simulation can give fight n stream n and replay any fight alone.
+    """
+
+    def __init__(self, session_seed: int = 0, name: str = "", index: int = 0):
+        self.session_seed = session_seed
+        self.name = name
+        self.index = index
+        self._numpy_generator = None
+        super().__init__(derive_seed(session_seed, name, index))
+
+    def __reduce__(self):
+        return self.__class__, self.key, self.getstate()
+
+    @property
+    def key(self) -> Tuple[int, str, int]:
+        return self.session_seed, self.name, self.index
+
+    def spawn(self, index: int) -> "RandomStream":
+        """Stream number index of the same name, independent of this one."""
+        return RandomStream(self.session_seed, self.name, index)
+
+    def randints(self, low: int, high: int, n: int) -> List[int]:
+        """n draws with the odds of randint(low, high), in one call."""
+        draw = self.random
+        span = high - low + 1
+        return [low + int(draw() * span) for _ in range(n)]
+
+    def integers(self, low: int, high: int, size):
+        """
+        Draws with the odds of randint(low, high) as a NumPy array.
+
+        Uses a Philox generator, which is counter based, keyed like this
+        stream. NumPy is only imported on the first call.
+        """
+        if self._numpy_generator is None:
+            import numpy as np
+
+            self._numpy_generator = np.random.Generator(
+                np.random.Philox(key=derive_seed(*self.key))
+            )
+        return self._numpy_generator.integers(low, high, size, endpoint=True)
+
+
+class RandomStreams:
+    """
+    The random streams of one session: a game, a replay or a simulation run.
+
+    Every stream is derived from the session seed, so the seed alone replays
+    the session. Streams are independent, so drawing more loot does not shift
+    the combat rolls.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed: int = secrets.randbits(64) if seed is None else seed
+        self._streams: Dict[Tuple[str, int], RandomStream] = {}
+        self.combat = self.stream(COMBAT)
+        self.loot = self.stream(LOOT)
+        self.generation = self.stream(GENERATION)
+
+    def stream(self, name: str, index: int = 0) -> RandomStream:
+        """The session's stream with this name and index, created on first use."""
+        stream = self._streams.get((name, index))
+        if stream is None:
+            stream = self._streams[(name, index)] = RandomStream(self.seed, name, index)
+        return stream
+
+    def spawn(self, index: int) -> "RandomStreams":
+        """
+        Child session number index, e.g. for one worker process of a
+        simulation. The same seed and index always give the same child.
+        """
+        return RandomStreams(derive_seed(self.seed, "session", index))
+
+
+_session = RandomStreams()
+
+
+def streams() -> RandomStreams:
+    """The current session's streams."""
+    return _session
+
+
+def seed_session(seed: Optional[int] = None) -> RandomStreams:
+    """Start a new session, with a fresh seed if none is given."""
+    global _session
+    _session = RandomStreams(seed)
+    return _session
+
+
+@contextmanager
+def session(seed: Optional[int] = None) -> Iterator[RandomStreams]:
+    """Run the block in a new session, then restore the previous one."""
+    global _session
+    previous = _session
+    _session = RandomStreams(seed)
+    try:
+        yield _session
+    finally:
+        _session = previous
+
+
+def combat_stream() -> RandomStream:
+    """Hit, damage, block and heal rolls."""
+    return _session.combat
+
+
+def loot_stream() -> RandomStream:
+    """Item placement and drops."""
+    return _session.loot
+
+
+def generation_stream() -> RandomStream:
+    """Dungeon layouts and monster spawns."""
+    return _session.generation
@@ -0,0 +1,40 @@
+"""
+Headless combat and playthrough tools for balancing. Needs NumPy, which the game
+itself does not.
+"""
+
+from dungeon_adventure.simulation.analytic import (
+    FightOutcome,
+    damage_per_attack,
+    expected_outcome,
+    fight_outcome,
+)
+from dungeon_adventure.simulation.monte_carlo import (
+    FightResults,
+    simulate_fights,
+    simulate_fights_scalar,
+)
+from dungeon_adventure.simulation.playthrough import (
+    ExplorerPolicy,
+    PlaythroughResult,
+    SeedReport,
+    play_dungeon,
+    simulate_playthroughs,
+)
+from dungeon_adventure.simulation.stats import CombatantStats
+
+__all__ = [
+    "CombatantStats",
+    "ExplorerPolicy",
+    "FightOutcome",
+    "FightResults",
+    "PlaythroughResult",
+    "SeedReport",
+    "damage_per_attack",
+    "expected_outcome",
+    "fight_outcome",
+    "play_dungeon",
+    "simulate_fights",
+    "simulate_fights_scalar",
+    "simulate_playthroughs",
+]
@@ -0,0 +1,192 @@
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
+from dungeon_adventure.simulation.monte_carlo import DEFAULT_MAX_TURNS
+from dungeon_adventure.simulation.stats import CombatantStats
+
+# Probability left in unfinished fights below which a fight is treated as over
+DEFAULT_TOLERANCE = 1e-12
+
+# Distinct stat pairs whose results are kept
+CACHE_SIZE = 1024
+
+
+class FightOutcome(NamedTuple):
+    """
+    Exact outcome probabilities of a hero versus monster fight.
+
+    turns_to_kill[t] is the probability the hero wins in round t, turns_to_die[t]
+    the probability the hero dies in round t and hp_remaining[h] the probability
+    of winning with h HP left. The arrays are read only; they are shared between
+    everyone asking about the same stats.
+    """
+
+    win_probability: float
+    loss_probability: float
+    stalemate_probability: float
+    turns_to_kill: np.ndarray
+    turns_to_die: np.ndarray
+    hp_remaining: np.ndarray
+
+    @property
+    def expected_turns_to_kill(self) -> float:
+        """Mean round of victory, over the fights the hero wins."""
+        if not self.win_probability:
+            return 0.0
+        rounds = np.arange(self.turns_to_kill.size)
+        return float(rounds @ self.turns_to_kill / self.win_probability)
+
+    @property
+    def expected_hp_remaining(self) -> float:
+        """Mean HP left, over the fights the hero wins."""
+        if not self.win_probability:
+            return 0.0
+        hp = np.arange(self.hp_remaining.size)
+        return float(hp @ self.hp_remaining / self.win_probability)
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _key(stats: CombatantStats) -> CombatantStats:
+    # Names do not change the rules, so monsters with equal stats share results
+    return stats._replace(name="")
+
+
+def damage_per_attack(attacker: CombatantStats, defender: CombatantStats) -> np.ndarray:
+    """
+    Distribution of the HP one attack takes off, before any heal.
+
+    :return: Read only array where entry d is the probability of d damage,
+        including misses as 0
+    """
+    return _damage_per_attack(_key(attacker), _key(defender))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _damage_per_attack(attacker: CombatantStats, defender: CombatantStats):
+    pmf = np.zeros(attacker.max_damage + 1)
+    hit = attacker.hit_chance / 100
+    block = defender.block_chance / 100
+    each = hit / (attacker.max_damage - attacker.min_damage + 1)
+    for damage in range(attacker.min_damage, attacker.max_damage + 1):
+        # Hero._mitigate_damage blocks int(damage * 0.5)
+        pmf[damage] += each * (1 - block)
+        pmf[damage - damage // 2] += each * block
+    pmf[0] += 1 - hit
+    return _read_only(pmf)
+
+
+def _heal_matrix(character: CombatantStats) -> np.ndarray:
+    """Transition of HP through Monster.attempt_heal, from row to column."""
+    size = character.max_hp + 1
+    chance = character.heal_chance / 100
+    matrix = np.eye(size) * (1 - chance)
+    if chance:
+        amounts = range(character.min_heal, character.max_heal + 1)
+        each = chance / len(amounts)
+        for hp in range(size):
+            for amount in amounts:
+                matrix[hp, min(hp + amount, character.max_hp)] += each
+    return matrix
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _attack_matrix(attacker: CombatantStats, defender: CombatantStats) -> np.ndarray:
+    """
+    Transition of the defender's HP through one attempt_attack, including the
+    heal a monster tries after taking a hit.
+    """
+    size = defender.max_hp + 1
+    pmf = _damage_per_attack(attacker, defender)
+    miss = 1 - attacker.hit_chance / 100
+    # Damage rolls that hit, including a block that halves a hit to 0
+    hit_pmf = pmf.copy()
+    hit_pmf[0] -= miss
+    hits = np.zeros((size, size))
+    for hp in range(1, size):
+        for damage in np.flatnonzero(hit_pmf):
+            hits[hp, max(hp - damage, 0)] += hit_pmf[damage]
+    matrix = np.diag(np.full(size, miss)) + hits @ _heal_matrix(defender)
+    matrix[0] = 0
+    return _read_only(matrix)
+
+
+def fight_outcome(
+    hero: CombatantStats,
+    monster: CombatantStats,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> FightOutcome:
+    """
+    Exact outcome distribution of a one on one fight, cached by the stats.
+
+    Follows the same rules as simulate_fights. The joint distribution of both
+    characters' HP is carried from round to round; within a round the hero's
+    and the monster's HP change independently, so each attack is one matrix
+    product on its side of the distribution instead of a sampled fight.
+
+    :param max_turns: Rounds after which a fight counts as a stalemate
+    :param tolerance: Stop once less than this probability is still fighting
+    """
+    return _fight_outcome(_key(hero), _key(monster), max_turns, tolerance)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _fight_outcome(
+    hero: CombatantStats,
+    monster: CombatantStats,
+    max_turns: int,
+    tolerance: float,
+) -> FightOutcome:
+    hero_hit = _attack_matrix(hero, monster)
+    monster_hit = _attack_matrix(monster, hero)
+    hero_heal = _heal_matrix(hero)
+    monster_heal = _heal_matrix(monster)
+
+    # state[h, m]: probability both are alive with h and m HP at a round start
+    state = np.zeros((hero.max_hp + 1, monster.max_hp + 1))
+    state[min(hero.hp, hero.max_hp), min(monster.hp, monster.max_hp)] = 1.0
+    turns_to_kill = [0.0]
+    turns_to_die = [0.0]
+    hp_remaining = np.zeros(hero.max_hp + 1)
+    for _ in range(max_turns):
+        if state.sum() < tolerance:
+            break
+        state = hero_heal.T @ (state @ hero_hit)
+        won = state[:, 0].copy()
+        state[:, 0] = 0
+        hp_remaining += won
+        turns_to_kill.append(won.sum())
+        # Monster.attempt_attack tries to heal after every attack
+        state = monster_hit.T @ state @ monster_heal
+        turns_to_die.append(state[0].sum())
+        state[0] = 0
+
+    win, loss = sum(turns_to_kill), sum(turns_to_die)
+    return FightOutcome(
+        win,
+        loss,
+        max(0.0, 1.0 - win - loss),
+        _read_only(np.array(turns_to_kill)),
+        _read_only(np.array(turns_to_die)),
+        _read_only(hp_remaining),
+    )
+
+
+def expected_outcome(hero: DungeonCharacter, monster: DungeonCharacter) -> FightOutcome:
+    """fight_outcome for two characters as they are now, e.g. for a UI hint."""
+    return fight_outcome(
+        CombatantStats.from_character(hero), CombatantStats.from_character(monster)
+    )
+
+
+def clear_cache() -> None:
+    """Forget every cached distribution, e.g. after editing the rules."""
+    for function in (_damage_per_attack, _attack_matrix, _fight_outcome):
+        function.cache_clear()
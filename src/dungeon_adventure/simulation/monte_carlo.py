@@ -0,0 +1,254 @@
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+
+from dungeon_adventure.models.characters.hero import Hero
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.services.rng import session
+from dungeon_adventure.simulation.stats import CombatantStats
+
+# Rounds after which a fight is given up as a stalemate, e.g. when a monster
+# heals faster than the hero can hurt it
+DEFAULT_MAX_TURNS = 1000
+
+# Fights simulated together; bounds memory to a few arrays of this length
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class FightResults(NamedTuple):
+    """
+    Outcome of many hero versus monster fights, one array entry per fight.
+
+    turns is the round the fight ended in, or max_turns for fights that never
+    ended. A round is the hero's attack followed by the monster's.
+    """
+
+    hero_won: np.ndarray
+    finished: np.ndarray
+    turns: np.ndarray
+    hero_hp: np.ndarray
+    monster_hp: np.ndarray
+
+    @property
+    def fights(self) -> int:
+        return int(self.hero_won.size)
+
+    @property
+    def win_rate(self) -> float:
+        return float(self.hero_won.mean()) if self.fights else 0.0
+
+    @property
+    def stalemate_rate(self) -> float:
+        return float(1.0 - self.finished.mean()) if self.fights else 0.0
+
+    def turns_to_kill(self) -> np.ndarray:
+        """Probability of winning in exactly t rounds, indexed by t, over all fights."""
+        return np.bincount(self.turns[self.hero_won]) / max(self.fights, 1)
+
+    def hp_remaining(self) -> np.ndarray:
+        """
+        Probability of winning with exactly h HP left, indexed by h, over all
+        fights.
+        """
+        return np.bincount(self.hero_hp[self.hero_won]) / max(self.fights, 1)
+
+    def summary(self) -> Dict[str, float]:
+        won = self.hero_won
+        return {
+            "fights": self.fights,
+            "win_rate": self.win_rate,
+            "stalemate_rate": self.stalemate_rate,
+            "mean_turns_to_kill": float(self.turns[won].mean()) if won.any() else 0.0,
+            "mean_hp_remaining": float(self.hero_hp[won].mean()) if won.any() else 0.0,
+        }
+
+
+def _roll_percent(rng: np.random.Generator, size: int) -> np.ndarray:
+    """random.randint(1, 100) for every fight. int16 draws are the fastest."""
+    return rng.integers(1, 101, size, dtype=np.int16)
+
+
+def _roll_range(rng: np.random.Generator, low: int, high: int, size: int) -> np.ndarray:
+    """random.randint(low, high) for every fight."""
+    dtype = np.int16 if high < np.iinfo(np.int16).max else np.int64
+    return rng.integers(low, high + 1, size, dtype=dtype)
+
+
+def _attempt_heal(
+    rng: np.random.Generator,
+    character: CombatantStats,
+    hp: np.ndarray,
+    trying: Optional[np.ndarray],
+) -> np.ndarray:
+    """Monster.attempt_heal for every fight in the trying mask, or all if None."""
+    if character.heal_chance <= 0:
+        return hp
+    heals = _roll_percent(rng, hp.size) <= character.heal_chance
+    if trying is not None:
+        heals &= trying
+    amount = _roll_range(rng, character.min_heal, character.max_heal, hp.size)
+    return np.minimum(hp + np.where(heals, amount, 0), character.max_hp)
+
+
+def _attack(
+    rng: np.random.Generator,
+    attacker: CombatantStats,
+    defender: CombatantStats,
+    defender_hp: np.ndarray,
+    attacking: Optional[np.ndarray],
+) -> np.ndarray:
+    """DungeonCharacter.attempt_attack for every fight in the attacking mask."""
+    size = defender_hp.size
+    hits = _roll_percent(rng, size) <= attacker.hit_chance
+    if attacking is not None:
+        hits &= attacking
+    damage = _roll_range(rng, attacker.min_damage, attacker.max_damage, size)
+    if defender.block_chance > 0:
+        # Hero._mitigate_damage blocks int(damage * 0.5)
+        blocked = _roll_percent(rng, size) <= defender.block_chance
+        damage = np.where(blocked, damage - damage // 2, damage)
+    defender_hp = np.maximum(defender_hp - np.where(hits, damage, 0), 0)
+    # Monster.take_damage tries to heal after every hit, even a killing one
+    return _attempt_heal(rng, defender, defender_hp, hits)
+
+
+def _simulate_chunk(
+    rng: np.random.Generator,
+    hero: CombatantStats,
+    monster: CombatantStats,
+    size: int,
+    max_turns: int,
+) -> FightResults:
+    hero_won = np.zeros(size, dtype=bool)
+    finished = np.zeros(size, dtype=bool)
+    turns = np.full(size, max_turns, dtype=np.int32)
+    final_hero_hp = np.empty(size, dtype=np.int32)
+    final_monster_hp = np.empty(size, dtype=np.int32)
+    # State of the fights still going, compacted after every round
+    active = np.arange(size)
+    hero_hp = np.full(size, hero.hp, dtype=np.int32)
+    monster_hp = np.full(size, monster.hp, dtype=np.int32)
+    for turn in range(1, max_turns + 1):
+        if not active.size:
+            break
+        monster_hp = _attack(rng, hero, monster, monster_hp, None)
+        hero_hp = _attempt_heal(rng, hero, hero_hp, None)
+        won = monster_hp <= 0
+        fighting = ~won
+        hero_hp = _attack(rng, monster, hero, hero_hp, fighting)
+        # Monster.attempt_attack tries to heal after every attack
+        monster_hp = _attempt_heal(rng, monster, monster_hp, fighting)
+        done = won | (hero_hp <= 0)
+
+        if done.any():
+            ended = active[done]
+            hero_won[active[won]] = True
+            finished[ended] = True
+            turns[ended] = turn
+            final_hero_hp[ended] = hero_hp[done]
+            final_monster_hp[ended] = monster_hp[done]
+            going = ~done
+            active, hero_hp, monster_hp = (
+                active[going],
+                hero_hp[going],
+                monster_hp[going],
+            )
+    final_hero_hp[active] = hero_hp
+    final_monster_hp[active] = monster_hp
+    return FightResults(hero_won, finished, turns, final_hero_hp, final_monster_hp)
+
+
+def simulate_fights(
+    hero: CombatantStats,
+    monster: CombatantStats,
+    fights: int,
+    seed: Optional[int] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> FightResults:
+    """
+    Simulate many one on one fights at once with NumPy arrays.
+
+    Follows the rules of the combat screen: the hero attacks first, then the
+    monster attacks while it is alive. Hit rolls use get_total_hit_chance,
+    damage is uniform between the minimum and maximum, a blocking hero takes
+    half (rounded up), and a monster tries to heal after taking a hit and after
+    each of its attacks. The same seed always gives the same results.
+
+    :param hero: Stats of the attacking hero
+    :param monster: Stats of the monster it fights
+    :param fights: Number of independent fights
+    :param seed: Seed for the NumPy generator, fresh entropy if None
+    :param max_turns: Rounds after which a fight counts as unfinished
+    :param chunk_size: Fights simulated together, to bound memory
+    """
+    rng = np.random.default_rng(seed)
+    chunks = [
+        _simulate_chunk(rng, hero, monster, min(chunk_size, fights - start), max_turns)
+        for start in range(0, fights, chunk_size)
+    ]
+    if len(chunks) == 1:
+        return chunks[0]
+    return FightResults(*(np.concatenate(arrays) for arrays in zip(*chunks)))
+
+
+def simulate_fights_scalar(
+    hero: CombatantStats,
+    monster: CombatantStats,
+    fights: int,
+    seed: Optional[int] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> FightResults:
+    """
+    Reference implementation: play each fight with real Hero and Monster objects.
+
+    Orders of magnitude slower than simulate_fights, it is there to check it
+    against the game's own rules. The characters roll with the combat stream of
+    a session made for the run from seed; the game's own session is restored
+    afterwards.
+    """
+    hero_won, finished, turns, hero_hps, monster_hps = [], [], [], [], []
+    with session(seed):
+        for _ in range(fights):
+            player = Hero(
+                hero.name,
+                hero.max_hp,
+                hero.min_damage,
+                hero.max_damage,
+                base_hit_chance=hero.hit_chance,
+                block_chance=hero.block_chance,
+            )
+            player.current_hp = hero.hp
+            enemy = Monster(
+                monster.name,
+                monster.max_hp,
+                monster.min_damage,
+                monster.max_damage,
+                base_hit_chance=monster.hit_chance,
+                heal_chance=monster.heal_chance,
+                min_heal=monster.min_heal,
+                max_heal=monster.max_heal,
+            )
+            enemy.current_hp = monster.hp
+            won, ended, turn = False, False, max_turns
+            for round_number in range(1, max_turns + 1):
+                player.attempt_attack(enemy)
+                if not enemy.is_alive:
+                    won, ended, turn = True, True, round_number
+                    break
+                enemy.attempt_attack(player)
+                if not player.is_alive:
+                    ended, turn = True, round_number
+                    break
+            hero_won.append(won)
+            finished.append(ended)
+            turns.append(turn)
+            hero_hps.append(player.current_hp)
+            monster_hps.append(enemy.current_hp)
+    return FightResults(
+        np.array(hero_won, dtype=bool),
+        np.array(finished, dtype=bool),
+        np.array(turns, dtype=np.int64),
+        np.array(hero_hps, dtype=np.int64),
+        np.array(monster_hps, dtype=np.int64),
+    )
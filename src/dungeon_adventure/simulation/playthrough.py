@@ -0,0 +1,423 @@
+import heapq
+import itertools
+import logging
+import os
+import pickle
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from dungeon_adventure.controllers.player_action_controller import (
+    PlayerActionController,
+)
+from dungeon_adventure.data.content import (
+    MONSTER_DB_PATH,
+    monster_database,
+    seed_monsters,
+)
+from dungeon_adventure.enums.game_state import GameState
+from dungeon_adventure.enums.item_types import ItemType, PotionType
+from dungeon_adventure.enums.room_types import Direction, RoomType
+from dungeon_adventure.game_model import GameModel
+from dungeon_adventure.models.characters.hero import Hero
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.models.characters.monster_templates import (
+    MonsterTemplateRegistry,
+)
+from dungeon_adventure.models.dungeon.dungeon import Dungeon
+from dungeon_adventure.models.dungeon.room import Room
+from dungeon_adventure.models.player.player import Player
+from dungeon_adventure.services.dungeon_generator import (
+    ENTRANCE_ROOM_NAME,
+    DungeonGenerator,
+)
+from dungeon_adventure.services.rng import RandomStreams, session
+from dungeon_adventure.utils.R import Resources as Res
+from dungeon_adventure.views.console.map_visualizer import MapVisualizer
+from dungeon_adventure.views.view import View
+
+# Runs given to a worker at a time; big enough to amortize building the dungeon
+DEFAULT_BATCH_SIZE = 50
+
+# Heal between fights below this fraction of max HP, if a potion is at hand
+HEAL_BELOW = 0.5
+
+
+class PlaythroughResult(NamedTuple):
+    """How one simulated game went."""
+
+    dungeon_seed: int
+    run: int
+    won: bool
+    # Room the hero died in, None if the hero survived
+    death_room: Optional[str]
+    # Moves made before the game ended or the step limit was hit
+    steps: int
+    fights: int
+    # HP lost to pits, after blocking
+    pit_damage: int
+    # Pillar names in the order they were picked up
+    pillar_order: Tuple[str, ...]
+
+
+class SeedReport(NamedTuple):
+    """Results of every run of one dungeon seed."""
+
+    dungeon_seed: int
+    runs: int
+    wins: int
+    deaths: int
+    deaths_by_room: Dict[str, int]
+    mean_pit_damage: float
+    mean_steps: float
+    pillar_orders: Dict[Tuple[str, ...], int]
+
+    @property
+    def completion_rate(self) -> float:
+        return self.wins / self.runs if self.runs else 0.0
+
+    @property
+    def death_rate(self) -> float:
+        return self.deaths / self.runs if self.runs else 0.0
+
+    @classmethod
+    def from_results(
+        cls, dungeon_seed: int, results: Sequence[PlaythroughResult]
+    ) -> "SeedReport":
+        runs = len(results)
+        deaths = Counter(r.death_room for r in results if r.death_room is not None)
+        return cls(
+            dungeon_seed,
+            runs,
+            sum(r.won for r in results),
+            sum(deaths.values()),
+            dict(deaths.most_common()),
+            sum(r.pit_damage for r in results) / runs if runs else 0.0,
+            sum(r.steps for r in results) / runs if runs else 0.0,
+            dict(Counter(r.pillar_order for r in results).most_common()),
+        )
+
+
+class SilentView(View):
+    """View that shows nothing and answers combat prompts for a policy."""
+
+    def __init__(self, policy: "ExplorerPolicy"):
+        self.policy = policy
+
+    def display_available_actions(self, game_model):
+        pass
+
+    def get_user_input(self, prompt: str) -> str:
+        return ""
+
+    def display_title_screen(self):
+        pass
+
+    def get_player_creation_input(self):
+        return {}
+
+    def display_message(self, message: str):
+        pass
+
+    def display_room_entrance(self, room):
+        pass
+
+    def display_room_contents(self, room):
+        pass
+
+    def display_combat_start(self):
+        pass
+
+    def display_empty_room(self):
+        pass
+
+    def display_inventory(self, inventory):
+        pass
+
+    def display_map(self, current_room, map_visualizer):
+        pass
+
+    def display_pit_damage(self, damage: int):
+        pass
+
+    def display_game_over(self):
+        pass
+
+    def display_combat_status(self, player, monsters):
+        pass
+
+    def get_combat_action(self):
+        return "attack"
+
+    def get_combat_target(self, monsters):
+        return self.policy.choose_target(monsters)
+
+    def display_xp_gained(self, xp_amount: int):
+        pass
+
+
+class ExplorerPolicy:
+    """
+    Heuristic player: explore the nearest unvisited room, pick up everything
+    that fits beside the pillars still to be found, heal between fights, and
+    head for the exit once all pillars are held.
+
+    The policy only knows rooms it has visited, their open doors and what
+    they turned out to be, like a player would. Paths avoid known pits unless
+    there is no other way.
+    """
+
+    def __init__(self):
+        self.visited: Dict[Room, None] = {}
+        # Doors still to take, each with the room it is in
+        self._path: List[Tuple[Direction, Room]] = []
+        self._heading_out = False
+
+    def visit(self, room: Room) -> None:
+        self.visited[room] = None
+
+    def choose_target(self, monsters: List[Monster]) -> Monster:
+        """The monster closest to dying."""
+        return min(monsters, key=lambda monster: monster.current_hp)
+
+    def should_heal(self, hero: Hero) -> bool:
+        return hero.current_hp < hero.max_hp * HEAL_BELOW
+
+    def next_move(self, room: Room, heading_out: bool) -> Optional[Direction]:
+        """
+        The next door to take, None if there is nowhere left to go.
+
+        :param heading_out: Whether the pillars are collected, so the exit is
+            the goal; until it is found, exploring goes on
+        """
+        if (
+            not self._path
+            or self._path[0][1] is not room
+            or heading_out is not self._heading_out
+        ):
+            self._heading_out = heading_out
+            self._path = self._plan(room, heading_out)
+        return self._path.pop(0)[0] if self._path else None
+
+    def _plan(self, start: Room, heading_out: bool) -> List[Tuple[Direction, Room]]:
+        """Cheapest path to the exit or the nearest unvisited room."""
+        pit_cost = 1 + Res.GameValues.PIT_DAMAGE
+        tie = itertools.count()
+        costs = {start: 0}
+        previous: Dict[Room, Tuple[Direction, Room]] = {}
+        queue = [(0, next(tie), start)]
+        while queue:
+            cost, _, room = heapq.heappop(queue)
+            if cost > costs[room]:
+                continue
+            if room is not start and (
+                room not in self.visited
+                or (heading_out and room.room_type is RoomType.EXIT)
+            ):
+                # Walk back to the first step
+                path = []
+                while room is not start:
+                    direction, parent = previous[room]
+                    path.append((direction, parent))
+                    room = parent
+                path.reverse()
+                return path
+            if room not in self.visited and room is not start:
+                continue
+            for direction, neighbour in room.get_open_gates():
+                step = pit_cost if neighbour.room_type is RoomType.PIT else 1
+                if neighbour not in self.visited:
+                    # Unvisited rooms look the same until entered
+                    step = 1
+                if cost + step < costs.get(neighbour, cost + step + 1):
+                    costs[neighbour] = cost + step
+                    previous[neighbour] = (direction, room)
+                    heapq.heappush(queue, (cost + step, next(tie), neighbour))
+        return []
+
+
+def _pick_up_items(
+    controller: PlayerActionController,
+    room: Room,
+    pillar_order: List[str],
+    pillars_left: Dict[str, float],
+) -> None:
+    """
+    Pick up what fits from a room, pillars first. Other items only take the
+    weight left over after the pillars still lying in the dungeon, whose
+    weights pillars_left holds by name and loses as they are picked up.
+    """
+    inventory = controller.player.inventory
+    for item in sorted(room.items, key=lambda i: i.item_type is not ItemType.PILLAR):
+        is_pillar = item.item_type is ItemType.PILLAR
+        limit = inventory.weight_limit
+        if not is_pillar:
+            limit -= sum(pillars_left.values())
+        if inventory.get_total_weight() + item.weight > limit:
+            continue
+        if controller.pick_up_item(item) and is_pillar:
+            pillar_order.append(item.name)
+            pillars_left.pop(item.name, None)
+
+
+def _heal_if_needed(player: Player, policy: ExplorerPolicy) -> None:
+    while policy.should_heal(player.hero):
+        potion = next(
+            (
+                item
+                for item, _ in player.inventory.get_items_by_type(ItemType.POTION)
+                if getattr(item, "potion_type", None) is PotionType.HEALING
+            ),
+            None,
+        )
+        if potion is None:
+            return
+        player.use_item(potion)
+
+
+def play_dungeon(
+    dungeon: Dungeon,
+    dungeon_seed: int = 0,
+    run: int = 0,
+    max_steps: Optional[int] = None,
+) -> PlaythroughResult:
+    """
+    Play one game in a dungeon with an ExplorerPolicy, headless and without
+    input, through PlayerActionController and CombatController.
+
+    Combat rolls come from the session of RandomStreams(dungeon_seed).spawn(run),
+    so a (seed, run) pair always plays out the same. The dungeon is changed
+    by the game; pass a fresh copy for each run.
+
+    :param max_steps: Moves after which the run is given up, 4 per room if None
+    """
+    if max_steps is None:
+        max_steps = 4 * len(dungeon.rooms)
+    player = Player("Simulated Hero")
+    player.current_room = dungeon.get_room(ENTRANCE_ROOM_NAME)
+    game_model = GameModel(player, dungeon)
+    game_model.game_state = GameState.EXPLORING
+    policy = ExplorerPolicy()
+    controller = PlayerActionController(
+        game_model, MapVisualizer(dungeon), SilentView(policy)
+    )
+    controller.initialize_map()
+
+    steps = fights = pit_damage = 0
+    pillar_order: List[str] = []
+    pillars_left = {
+        item.name: item.weight
+        for dungeon_room in dungeon.rooms.values()
+        for item in dungeon_room.items
+        if item.item_type is ItemType.PILLAR
+    }
+    with session(RandomStreams(dungeon_seed).spawn(run).seed):
+        room = controller.current_room
+        policy.visit(room)
+        _pick_up_items(controller, room, pillar_order, pillars_left)
+        while not game_model.is_game_over() and steps < max_steps:
+            _heal_if_needed(player, policy)
+            direction = policy.next_move(room, player.has_all_pillars())
+            if direction is None:
+                break
+            hp = player.hero.current_hp
+            controller.move_player(direction)
+            steps += 1
+            room = controller.current_room
+            policy.visit(room)
+            if room.room_type is RoomType.PIT:
+                pit_damage += hp - player.hero.current_hp
+            if game_model.is_game_over():
+                break
+            if room.has_monsters:
+                fights += 1
+                controller.combat_handler.initiate_combat()
+                if not player.hero.is_alive:
+                    break
+            _pick_up_items(controller, room, pillar_order, pillars_left)
+
+    alive = player.hero.is_alive
+    return PlaythroughResult(
+        dungeon_seed,
+        run,
+        alive and game_model.is_game_over(),
+        None if alive else controller.current_room.name,
+        steps,
+        fights,
+        pit_damage,
+        tuple(pillar_order),
+    )
+
+
+def _use_monster_database(path: str) -> None:
+    """Point this process's monster templates at a seeded database."""
+    seed_monsters(monster_database(path))
+    MonsterTemplateRegistry._default = MonsterTemplateRegistry(path)
+
+
+def _play_batch(
+    dungeon_seed: int, runs: Sequence[int], dungeon_options: dict
+) -> List[PlaythroughResult]:
+    dungeon = DungeonGenerator.generate_procedural(seed=dungeon_seed, **dungeon_options)
+    # Unpickling a copy is cheaper than generating the dungeon again
+    blueprint = pickle.dumps(dungeon)
+    return [play_dungeon(pickle.loads(blueprint), dungeon_seed, run) for run in runs]
+
+
+def _worker_init(monster_db_path: str) -> None:
+    # Workers play thousands of games; per-roll log records would dominate
+    logging.disable(logging.INFO)
+    _use_monster_database(monster_db_path)
+
+
+def simulate_playthroughs(
+    seeds: Iterable[int],
+    runs_per_seed: int = 100,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    monster_db_path: str = MONSTER_DB_PATH,
+    **dungeon_options,
+) -> Dict[int, SeedReport]:
+    """
+    Play runs_per_seed complete games in the dungeon of each seed.
+
+    Runs are spread over a ProcessPoolExecutor in batches of batch_size. The
+    results only depend on the seeds and run numbers, not on the number of
+    workers or how batches are scheduled.
+
+    :param seeds: Dungeon seeds for DungeonGenerator.generate_procedural
+    :param workers: Worker processes, every core if None; 1 plays in this process
+    :param monster_db_path: Monster database, seeded with the default monsters
+        if they are missing
+    :param dungeon_options: Passed on to generate_procedural, e.g. width=20
+    :return: A report per seed, in the order the seeds were given
+    """
+    seeds = list(seeds)
+    dungeon_options.setdefault("width", 10)
+    dungeon_options.setdefault("height", 10)
+    batches = [
+        (seed, range(start, min(start + batch_size, runs_per_seed)))
+        for seed in seeds
+        for start in range(0, runs_per_seed, batch_size)
+    ]
+    results: Dict[int, List[PlaythroughResult]] = {seed: [] for seed in seeds}
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        previous = MonsterTemplateRegistry._default
+        _use_monster_database(monster_db_path)
+        try:
+            for seed, runs in batches:
+                results[seed].extend(_play_batch(seed, runs, dungeon_options))
+        finally:
+            MonsterTemplateRegistry._default = previous
+    else:
+        with ProcessPoolExecutor(
+            workers, initializer=_worker_init, initargs=(monster_db_path,)
+        ) as executor:
+            futures = [
+                (seed, executor.submit(_play_batch, seed, runs, dungeon_options))
+                for seed, runs in batches
+            ]
+            for seed, future in futures:
+                results[seed].extend(future.result())
+    return {seed: SeedReport.from_results(seed, results[seed]) for seed in seeds}
@@ -0,0 +1,42 @@
+from typing import NamedTuple
+
+from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
+
+
+class CombatantStats(NamedTuple):
+    """
+    Everything the combat rules read from one side of a fight.
+
+    Heroes block (Hero._mitigate_damage) and monsters heal (Monster.attempt_heal),
+    so a hero has no heal chance and a monster no block chance.
+    """
+
+    name: str
+    max_hp: int
+    hp: int
+    min_damage: int
+    max_damage: int
+    hit_chance: int
+    block_chance: int = 0
+    heal_chance: int = 0
+    min_heal: int = 0
+    max_heal: int = 0
+
+    @classmethod
+    def from_character(cls, character: DungeonCharacter) -> "CombatantStats":
+        """
+        Capture a hero or monster as it is now, including its current HP and
+        its weapon and other stat modifiers.
+        """
+        return cls(
+            character.name,
+            character.max_hp,
+            character.current_hp,
+            character.effective_stats.min_damage,
+            character.effective_stats.max_damage,
+            character.effective_stats.hit_chance,
+            getattr(character, "block_chance", 0),
+            getattr(character, "heal_chance", 0),
+            getattr(character, "min_heal", 0),
+            getattr(character, "max_heal", 0),
+        )
@@ -0,0 +1,21 @@
+import gc
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector for a bulk allocation.
+
+    Building large room graphs allocates several containers per room and none of
+    them are garbage, so the collector would only rescan the growing graph over
+    and over. The previous collector state is restored on exit.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
@@ -1,9 +1,15 @@
-from typing import Dict, List, Set, Tuple
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
 
 from dungeon_adventure.enums.room_types import Direction
 from dungeon_adventure.models.dungeon.dungeon import Dungeon
 from dungeon_adventure.models.dungeon.room import Room
 from dungeon_adventure.utils import Resources
+from dungeon_adventure.utils.gc_utils import paused_gc
+
+_COORDINATE_CHANGES: Dict[Direction, Tuple[int, int]] = {
+    direction: direction.get_coordinate_change() for direction in Direction
+}
 
 
 class MapVisualizer:
@@ -12,8 +18,43 @@ class MapVisualizer:
         # Make a dictionary like this [[room coordinates], [room]] to store the coordinates of our rooms
         # as key and the room itself for the value.
         self.grid: Dict[Tuple[int, int], Room] = {}
-        # Set of already explored rooms, using coordinates (x, y)
-        self.explored_rooms: Set[Tuple[int, int]] = set()
+        # Reverse of grid so finding a room's coordinates doesn't scan the map
+        self.room_coordinates: Dict[Room, Tuple[int, int]] = {}
+        # (coordinates, room on the map, room that also claimed the cell)
+        self.collisions: List[Tuple[Tuple[int, int], Room, Room]] = []
+        # Rendered map rows between generate_map calls, covering the bounding
+        # box of the visible rooms
+        self._rows: List[str] = []
+        self._min_x: Optional[int] = None
+        self._max_x: Optional[int] = None
+        self._min_y: Optional[int] = None
+        self._max_y: Optional[int] = None
+        self._dirty_rows: Set[int] = set()
+        self._marker_row: Optional[int] = None
+
+    def __setstate__(self, state):
+        # Saves made before FogOfWar kept the revealed cells in a set
+        explored_rooms = state.pop("explored_rooms", ())
+        self.__dict__.update(state)
+        self.__dict__.setdefault("collisions", [])
+        # Saves made before the reverse index existed only carry the grid
+        if "room_coordinates" not in state:
+            self.room_coordinates = {room: xy for xy, room in self.grid.items()}
+        for coords in explored_rooms:
+            if coords in self.grid:
+                self.grid[coords].is_visible = True
+        if "_rows" not in state:
+            self.invalidate()
+
+    @property
+    def explored_rooms(self) -> Set[Tuple[int, int]]:
+        """Coordinates of the rooms shown on the map."""
+        fog = self.dungeon.fog
+        return {
+            coords
+            for room, coords in self.room_coordinates.items()
+            if fog.is_visible(room.fog_index)
+        }
 
     def initialize(self):
         """Initialize the map visualizer after the dungeon has been set up."""
@@ -24,74 +65,170 @@ class MapVisualizer:
         if start_room is None:
             print("Warning: Dungeon has not been initialized yet. Map will be empty.")
             return
-        self._assign_room_coordinates(start_room, 0, 0, set())
+        with paused_gc():
+            self._assign_room_coordinates(start_room)
+        if self.collisions:
+            print(
+                f"Warning: {len(self.collisions)} rooms overlap other rooms on the "
+                "map and were left off it."
+            )
 
-    def _assign_room_coordinates(
-        self, current_room: Room, x: int, y: int, visited: set
-    ):
-        if current_room in visited:
-            return
-        visited.add(current_room)
-        self.grid[(x, y)] = current_room
-        for direction, connected_room in current_room.get_open_gates():
-            if connected_room:
-                dx, dy = direction.get_coordinate_change()
-                new_x, new_y = x + dx, y + dy
-                self._assign_room_coordinates(connected_room, new_x, new_y, visited)
+    def _assign_room_coordinates(self, start_room: Room) -> None:
+        """
+        Lay the rooms out on the map with a breadth-first walk from start_room.
+
+        Every room and door is visited once, so the pass is linear and does not
+        recurse. A room that lands on a cell another room already holds is
+        recorded in collisions and left off the map, but the walk continues
+        through it so the rooms behind it still get placed.
+        """
+        visited = {start_room}
+        queue = deque([(start_room, 0, 0)])
+        while queue:
+            room, x, y = queue.popleft()
+            coords = (x, y)
+            occupant = self.grid.get(coords)
+            if occupant is None:
+                self._place_room(room, coords)
+            else:
+                self.collisions.append((coords, occupant, room))
+            for direction, connected_room in room.get_open_gates():
+                if connected_room not in visited:
+                    visited.add(connected_room)
+                    dx, dy = _COORDINATE_CHANGES[direction]
+                    queue.append((connected_room, x + dx, y + dy))
+
+    def _place_room(self, room: Room, coords: Tuple[int, int]) -> None:
+        """Put a room on the map, keeping grid and room_coordinates in sync."""
+        self.grid[coords] = room
+        self.room_coordinates[room] = coords
 
     def update_explored_rooms(self, current_room: Room):
-
-        current_coords = next(
-            (coords for coords, room in self.grid.items() if room == current_room), None
-        )
+        current_coords = self.room_coordinates.get(current_room)
         if current_coords is None:
             print(
                 "Warning: Current room not found in the map. Can't update explored rooms."
             )
             return
-        self.explored_rooms.add(current_coords)
+        self._mark_explored(current_coords)
+        x, y = current_coords
         for direction in Direction:
             if current_room.connections[direction]:
-                x, y = current_coords
-                dx, dy = direction.get_coordinate_change()
-                new_coords = (x + dx, y + dy)
-                self.explored_rooms.add(new_coords)
+                dx, dy = _COORDINATE_CHANGES[direction]
+                self._mark_explored((x + dx, y + dy))
+
+    def _mark_explored(self, coords: Tuple[int, int]) -> None:
+        room = self.grid.get(coords)
+        if room is None:
+            return
+        self.dungeon.fog.set_visible(room.fog_index)
+        if not self._is_drawn(coords):
+            self._extend_bounds(coords)
+            self._dirty_rows.add(coords[1])
+
+    def _is_drawn(self, coords: Tuple[int, int]) -> bool:
+        """Whether the cached rows already show a room at coords."""
+        x, y = coords
+        if self._min_x is None or not (
+            self._min_x <= x <= self._max_x and self._min_y <= y <= self._max_y
+        ):
+            return False
+        row = self._rows[y - self._min_y]
+        return row[(x - self._min_x) * len(Resources.Map.EMPTY_SPACE)] == "["
+
+    def _extend_bounds(self, coords: Tuple[int, int]) -> None:
+        """Grow the cached map to cover coords, padding the rows already rendered."""
+        x, y = coords
+        empty = Resources.Map.EMPTY_SPACE
+        if self._min_x is None:
+            self._min_x = self._max_x = x
+            self._min_y = self._max_y = y
+            self._rows = [empty]
+            return
+        if x < self._min_x:
+            padding = empty * (self._min_x - x)
+            self._rows = [padding + row for row in self._rows]
+            self._min_x = x
+        elif x > self._max_x:
+            padding = empty * (x - self._max_x)
+            self._rows = [row + padding for row in self._rows]
+            self._max_x = x
+        blank_row = empty * (self._max_x - self._min_x + 1)
+        if y < self._min_y:
+            self._rows[:0] = [blank_row] * (self._min_y - y)
+            self._min_y = y
+        elif y > self._max_y:
+            self._rows.extend([blank_row] * (y - self._max_y))
+            self._max_y = y
+
+    def _render_row(self, y: int, current_room: Room) -> str:
+        fog = self.dungeon.fog
+        room_line = []
+        for x in range(self._min_x, self._max_x + 1):
+            room = self.grid.get((x, y))
+            if room is not None and fog.is_visible(room.fog_index):
+                if room == current_room:
+                    room_char = Resources.Map.CURRENT_ROOM_MARKER
+                elif room.is_explored:
+                    room_char = Resources.Map.EXPLORED_ROOM_MARKER
+                else:
+                    room_char = Resources.Map.UNEXPLORED_ROOM_MARKER
+                room_line.append(f"[{room_char}]")
+            else:
+                room_line.append(Resources.Map.EMPTY_SPACE)
+        return "".join(room_line)
+
+    def invalidate(self) -> None:
+        """
+        Drop the rendered rows so the next generate_map redraws the whole map.
+
+        Needed after changing a room's is_visible or is_explored flag from
+        outside of update_explored_rooms, e.g. after loading the dungeon's fog
+        of war.
+        """
+        self._min_x = self._max_x = self._min_y = self._max_y = None
+        self._rows = []
+        self._marker_row = None
+        self._dirty_rows = set()
+        for coords in self.explored_rooms:
+            self._extend_bounds(coords)
+            self._dirty_rows.add(coords[1])
 
     def generate_map(self, current_room: Room) -> List[str]:
+        """
+        Render the explored part of the map.
+
+        Rendered rows are cached between calls, so only rows with newly explored
+        rooms and the rows the current room marker left or entered are rebuilt.
+
+        :param current_room: The room to mark as the player's position
+        :return: The map as a list of lines
+        """
         if not self.grid:
             return ["Map is not available yet."]
 
         self.update_explored_rooms(current_room)
 
-        # There's probably ways to make all this way more efficient and consist
-        visible_rooms = self.explored_rooms
-
-        if not visible_rooms:
+        if self._min_x is None:
             return ["No rooms have been explored yet."]
 
-        min_x = min(x for x, _ in visible_rooms)
-        max_x = max(x for x, _ in visible_rooms)
-        min_y = min(y for _, y in visible_rooms)
-        max_y = max(y for _, y in visible_rooms)
-
-        map_lines = []
-        for y in range(min_y, max_y + 1):
-            room_line = []
-            for x in range(min_x, max_x + 1):
-                if (x, y) in visible_rooms:
-                    room = self.grid[(x, y)]
-                    if room == current_room:
-                        room_char = Resources.Map.CURRENT_ROOM_MARKER
-                    elif room.is_explored:
-                        room_char = Resources.Map.EXPLORED_ROOM_MARKER
-                    else:
-                        room_char = Resources.Map.UNEXPLORED_ROOM_MARKER
-                    room_line.append(f"[{room_char}]")
-                else:
-                    room_line.append(Resources.Map.EMPTY_SPACE)
-            map_lines.append("".join(room_line))
-
-        return map_lines
+        current_coords = self.room_coordinates.get(current_room)
+        marker_row = current_coords[1] if current_coords else None
+        if marker_row != self._marker_row:
+            if self._marker_row is not None:
+                self._dirty_rows.add(self._marker_row)
+            if marker_row is not None:
+                self._dirty_rows.add(marker_row)
+            self._marker_row = marker_row
+        elif marker_row is not None:
+            # The marker may have moved within the same row
+            self._dirty_rows.add(marker_row)
+
+        for y in self._dirty_rows:
+            self._rows[y - self._min_y] = self._render_row(y, current_room)
+        self._dirty_rows.clear()
+
+        return list(self._rows)
 
     def display_map(self, current_room: Room):
         map_lines = self.generate_map(current_room)
@@ -2,6 +2,7 @@ import pygame
 from typing import List, Optional, Tuple
 
 from dungeon_adventure.models.items import Item, Weapon
+from dungeon_adventure.views.pygame.game.resource_manager import TextCache
 
 
 class EnhancedInventoryDisplay:
@@ -24,9 +25,10 @@ class EnhancedInventoryDisplay:
         }
 
         # Fonts
+        self.text_cache = TextCache.default()
         self.fonts = {
-            "button": pygame.font.Font(None, 10 * self.scale_factor),
-            "info": pygame.font.Font(None, 8 * self.scale_factor),
+            "button": self.text_cache.font(10 * self.scale_factor),
+            "info": self.text_cache.font(8 * self.scale_factor),
         }
 
         # Panels
@@ -112,8 +114,11 @@ class EnhancedInventoryDisplay:
                 pygame.draw.rect(
                     surface, self.colors["text"], button, self.scale_factor
                 )
-                text = self.fonts["button"].render(
-                    f"{item.name} ({quantity})", True, self.colors["text"]
+                text = self.text_cache.render(
+                    self.fonts["button"],
+                    f"{item.name} ({quantity})",
+                    True,
+                    self.colors["text"],
                 )
                 text_rect = text.get_rect(center=button.center)
                 surface.blit(text, text_rect)
@@ -141,7 +146,9 @@ class EnhancedInventoryDisplay:
 
         y = rect.top
         for line in lines:
-            text_surface = self.fonts["info"].render(line, True, self.colors["text"])
+            text_surface = self.text_cache.render(
+                self.fonts["info"], line, True, self.colors["text"]
+            )
             surface.blit(text_surface, (rect.left, y))
             y += self.fonts["info"].get_linesize()
 
@@ -250,8 +257,8 @@ class EnhancedInventoryDisplay:
             )
             pygame.draw.rect(surface, color, button)
             pygame.draw.rect(surface, self.colors["text"], button, self.scale_factor)
-            text = self.fonts["button"].render(
-                action.capitalize(), True, self.colors["text"]
+            text = self.text_cache.render(
+                self.fonts["button"], action.capitalize(), True, self.colors["text"]
             )
             text_rect = text.get_rect(center=button.center)
             surface.blit(text, text_rect)
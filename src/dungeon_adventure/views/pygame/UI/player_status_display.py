@@ -1,5 +1,7 @@
 import pygame
 
+from dungeon_adventure.views.pygame.game.resource_manager import TextCache
+
 
 class PlayerStatusDisplay:
     def __init__(self, screen_width: int, screen_height: int, scale_factor: int = 3):
@@ -13,9 +15,10 @@ class PlayerStatusDisplay:
             "text": (255, 255, 255),  # White
             "hp_bar": (199, 44, 44),  # Red for HP bar
         }
+        self.text_cache = TextCache.default()
         self.fonts = {
-            "status": pygame.font.Font(None, 16 * scale_factor),
-            "hp": pygame.font.Font(None, 14 * scale_factor),
+            "status": self.text_cache.font(16 * scale_factor),
+            "hp": self.text_cache.font(14 * scale_factor),
         }
 
     def draw(self, surface: pygame.Surface, player):
@@ -24,8 +27,8 @@ class PlayerStatusDisplay:
         pygame.draw.rect(surface, self.colors["border"], self.display_rect, 2)
 
         # Draw player name and status
-        name_surface = self.fonts["status"].render(
-            player.name, True, self.colors["text"]
+        name_surface = self.text_cache.render(
+            self.fonts["status"], player.name, True, self.colors["text"]
         )
         surface.blit(name_surface, (self.display_rect.x + 10, self.display_rect.y + 10))
 
@@ -39,7 +42,9 @@ class PlayerStatusDisplay:
 
         # Draw HP text
         hp_text = f"HP: {player.hero.current_hp}/{player.hero.max_hp}"
-        hp_surface = self.fonts["hp"].render(hp_text, True, self.colors["text"])
+        hp_surface = self.text_cache.render(
+            self.fonts["hp"], hp_text, True, self.colors["text"]
+        )
         hp_text_pos = (self.display_rect.x + 15, self.display_rect.y + 80)
         surface.blit(hp_surface, hp_text_pos)
 
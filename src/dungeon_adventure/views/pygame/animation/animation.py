@@ -2,10 +2,19 @@ from typing import List
 
 import pygame
 
+from dungeon_adventure.views.pygame.game.resource_manager import AssetManager
+
 
 class Animation:
-    def __init__(self, name: str, frame_paths: List[str], frame_duration: int):
+    def __init__(
+        self,
+        name: str,
+        frame_paths: List[str],
+        frame_duration: int,
+        flip_x: bool = False,
+    ):
         self.name: str = name
+        self.flip_x: bool = flip_x
         self.frames: List[pygame.Surface] = self.load_frames(frame_paths)
         self.frame_duration: int = frame_duration
         self.current_frame: int = 0
@@ -16,7 +25,10 @@ class Animation:
         # images and loads them into a list as the pygame's Surface property.
         # So we get a bunch of surfaces derived from files back.
         # We can then load the surfaces into our 'frames' list.
-        return [pygame.image.load(path).convert_alpha() for path in frame_paths]
+        # Frames come from the shared AssetManager, so animations using the
+        # same images (like idle left and right) load them only once.
+        assets = AssetManager.default()
+        return [assets.image(path, flip_x=self.flip_x) for path in frame_paths]
 
     def update(self, dt: int) -> None:
         if len(self.frames) > 1:  # Only update if there's at least one frame,
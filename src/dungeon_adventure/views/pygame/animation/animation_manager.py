@@ -16,9 +16,13 @@ class AnimationManager:
         self.current_animation: Union[Animation, None] = None
 
     def add_animation(
-        self, name: str, frame_paths: List[str], frame_duration: int
+        self,
+        name: str,
+        frame_paths: List[str],
+        frame_duration: int,
+        flip_x: bool = False,
     ) -> None:
-        self.animations[name] = Animation(name, frame_paths, frame_duration)
+        self.animations[name] = Animation(name, frame_paths, frame_duration, flip_x)
 
     def play(self, name: str) -> None:
         # If the requested animation is in our list of animations
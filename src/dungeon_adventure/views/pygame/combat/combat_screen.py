@@ -6,6 +6,8 @@ import pygame.font
 from enum import Enum, auto
 
 from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.models.combat.horde import HORDE_THRESHOLD, summarize
+from dungeon_adventure.views.pygame.game.resource_manager import TextCache
 
 
 class CombatAction(Enum):
@@ -36,7 +38,7 @@ class Button:
         pygame.draw.rect(surface, color, scaled_rect)
         pygame.draw.rect(surface, (0, 0, 0), scaled_rect, scale_factor)
 
-        text_surf = font.render(self.text, True, (0, 0, 0))
+        text_surf = TextCache.default().render(font, self.text, True, (0, 0, 0))
         text_rect = text_surf.get_rect(center=scaled_rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -90,10 +92,13 @@ class CombatScreen:
         self.monster_selection_buttons = []
         self.main_buttons = None
 
-        self.hero_title_font = pygame.font.SysFont(
-            None, 20 * self.scale_factor, bold=True
+        self.text_cache = TextCache.default()
+        self.hero_title_font = self.text_cache.font(
+            20 * self.scale_factor, bold=True, sysfont=True
+        )
+        self.monster_font = self.text_cache.font(
+            12 * self.scale_factor, bold=True, sysfont=True
         )
-        self.monster_font = pygame.font.SysFont(None, 12 * self.scale_factor, bold=True)
         self.stat_bars = {"HP": 0, "Mana": 0, "XP": 0}
         self.stat_bar_visible = {"HP": False, "Mana": False, "XP": False}
         self.stat_bar_colors = {
@@ -116,9 +121,12 @@ class CombatScreen:
         self.logger.debug(f"CombatScreen initialized with message: '{self.message}'")
 
     def initialize(self):
-        pygame.font.init()
-        self.font = pygame.font.SysFont(None, 14 * self.scale_factor, bold=True)
-        self.title_font = pygame.font.SysFont(None, 16 * self.scale_factor, bold=True)
+        self.font = self.text_cache.font(
+            14 * self.scale_factor, bold=True, sysfont=True
+        )
+        self.title_font = self.text_cache.font(
+            16 * self.scale_factor, bold=True, sysfont=True
+        )
         self.main_buttons = [
             Button(75, 134, 83, 22, "attack", CombatAction.ATTACK),
             Button(75, 167, 83, 21, "flee", CombatAction.FLEE),
@@ -128,7 +136,9 @@ class CombatScreen:
 
     def create_monster_selection_buttons(self):
         self.monster_selection_buttons = [
-            Button(75, 134 + i * 33, 83, 22, monster["name"], f"ATTACK_{i}")
+            Button(
+                75, 134 + i * 33, 83, 22, monster["name"], f"ATTACK_{monster['target']}"
+            )
             for i, monster in enumerate(self.monster_bars)
         ]
         self.logger.debug(
@@ -154,7 +164,7 @@ class CombatScreen:
     def draw_text(self, surface, text, x, y, color, center=False, font=None):
         if font is None:
             font = self.font
-        text_surface = font.render(text, True, color)
+        text_surface = self.text_cache.render(font, text, True, color)
         text_rect = text_surface.get_rect()
         if center:
             text_rect.center = (self.scale(x), self.scale(y))
@@ -234,19 +244,35 @@ class CombatScreen:
             self.scale(1),
         )
 
-    def display_monster_stats(self, monsters: List, callback: Callable):
-        self.monster_bars = []  # Clear existing monster bars
-        self.monster_bar_animation = []
+    def monster_rows(self, monsters: List) -> List[dict]:
+        """
+        One bar per monster, or for a horde one bar per monster type with the
+        type's combined HP. "target" is the index in monsters a bar attacks.
+        """
+        if len(monsters) >= HORDE_THRESHOLD:
+            return [
+                {
+                    "name": f"{group.name} x{group.count}",
+                    "hp_ratio": group.hp_ratio,
+                    "target": group.first,
+                }
+                for group in summarize(monsters)
+            ]
+        rows = []
         for i, monster in enumerate(monsters):  # Remove the [:2] slice
             try:
                 if monster.max_hp != 0:
                     hp_ratio = monster.current_hp / monster.max_hp
                 else:
                     hp_ratio = 0  # or handle accordingly
-                self.monster_bars.append({"name": monster.name, "hp_ratio": hp_ratio})
-                self.monster_bar_animation.append(None)
+                rows.append({"name": monster.name, "hp_ratio": hp_ratio, "target": i})
             except (ValueError, AttributeError, ZeroDivisionError) as e:
                 self.logger.error(f"Error calculating hp ratio for monster {i}: {e}")
+        return rows
+
+    def display_monster_stats(self, monsters: List, callback: Callable):
+        self.monster_bars = self.monster_rows(monsters)
+        self.monster_bar_animation = [None] * len(self.monster_bars)
 
         if callback is None:
             self.logger.error("Callback passed to display_monster_stats is None")
@@ -275,10 +301,15 @@ class CombatScreen:
     def update_monster_stats(
         self, monsters: List[Monster], callback: Optional[Callable] = None
     ):
-        for i, monster in enumerate(monsters):
-            if i < len(self.monster_bars):  # Ensure we don't go out of bounds
-                new_hp_ratio = monster.current_hp / monster.max_hp
-                self.animate_monster_bar(i, new_hp_ratio)
+        rows = self.monster_rows(monsters)
+        if len(rows) != len(self.monster_bars):
+            # A monster type was wiped out, show the remaining ones as they are
+            self.monster_bars = rows
+            self.monster_bar_animation = [None] * len(rows)
+        for i, row in enumerate(rows[: len(self.monster_bars)]):
+            self.monster_bars[i]["name"] = row["name"]
+            self.monster_bars[i]["target"] = row["target"]
+            self.animate_monster_bar(i, row["hp_ratio"])
 
         # If there are no animations to run, call the callback immediately
         if all(anim is None for anim in self.monster_bar_animation):
@@ -9,6 +9,8 @@ from dungeon_adventure.enums.combat_state import CombatState
 from dungeon_adventure.enums.game_state import GameState
 from dungeon_adventure.models.characters.hero import Hero
 from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.models.combat.horde import Horde
+from dungeon_adventure.models.combat.initiative import InitiativeScheduler
 from dungeon_adventure.views.pygame.combat.combat_screen import (
     CombatAction,
     CombatScreen,
@@ -26,16 +28,24 @@ class States(Enum):
 
 
 class CombatManager:
-    def __init__(self, game_world: GameWorld):
+    def __init__(self, game_world: GameWorld, timeline: bool = False):
+        """
+        :param timeline: Take turns from the scheduler's speed timeline, so
+            between two player turns every monster whose gauge fills acts,
+            faster ones more than once. By default every monster acts once.
+        """
         self.waiting_for_animation = None
         self.enable_input_receiving: bool = False
         self.logger: logging.Logger = logging.getLogger("dungeon_adventure.combat")
         self.game_world: GameWorld = game_world
         self.view: Optional[CombatScreen] = None
         self.player: "CompositePlayer" = game_world.composite_player
+        # Everyone in the encounter, dead or alive, so bar indexes stay put
         self.monsters: List[Monster] = []
+        self.horde = Horde()
         self.combat_state: CombatState = CombatState.WAITING
-        self.turn_order: List[Hero | Monster] = []
+        self.scheduler = InitiativeScheduler()
+        self.timeline = timeline
         self.message_animation_complete = False
         self.combat_finished = None
 
@@ -96,6 +106,7 @@ class CombatManager:
         self.logger.info("CURRENT STATE: " + str(self.state))
         self.logger.info("Setting up combat")
         self.monsters = self.game_world.current_room.room.monsters
+        self.horde = Horde(self.monsters)
         self.determine_turn_order()
         self.display_combat_info()
         # Wait for animation to complete before allowing the transition
@@ -109,10 +120,17 @@ class CombatManager:
     def determine_turn_order(self) -> None:
         self.logger.info("CURRENT STATE: " + str(self.state))
         self.logger.info("Determining turn order")
-        self.turn_order = [self.player.hero] + self.monsters
-        self.turn_order.sort(key=lambda x: x.attack_speed, reverse=True)
+        self.scheduler = InitiativeScheduler()
+        # The player starts the fight, so the hero acts first on the timeline too
+        self.scheduler.add(self.player.hero, ready=True)
+        for monster in self.monsters:
+            self.scheduler.add(monster)
         self.logger.debug(f"Turn order: {[char.name for char in self.turn_order]}")
 
+    @property
+    def turn_order(self) -> List[Hero | Monster]:
+        return self.scheduler.order()
+
     def display_combat_info(self) -> None:
         self.logger.info("CURRENT STATE: " + str(self.state))
         self.logger.info("Displaying turn order")
@@ -181,7 +199,12 @@ class CombatManager:
         if 0 <= monster_index < len(self.monsters):
             target = self.monsters[monster_index]
             self.logger.info(f"Player attacking {target.name}")
+            if self.timeline:
+                # The player's turn only starts when the hero is next
+                self.scheduler.next_actor()
             attack_amount = self.player.hero.attempt_attack(target)
+            if not self.horde.refresh(target):
+                self.scheduler.discard(target)
 
             self.waiting_for_animation = True
             if attack_amount == 0:
@@ -223,7 +246,7 @@ class CombatManager:
         if self.player.hero.current_hp <= 0:
             self.logger.info("Player has been defeated. Ending combat.")
             self.trigger("end_combat")
-        elif all(monster.current_hp <= 0 for monster in self.monsters):
+        elif not self.horde:
             self.logger.info("All monsters defeated. Ending combat.")
             self.game_world.end_combat()
             self.game_world.current_room.room.monsters = []
@@ -272,6 +295,12 @@ class CombatManager:
         self.process_monster_attacks()
 
     def process_monster_attacks(self):
+        if self.timeline:
+            self.process_next_timeline_attack()
+            return
+        if self.horde.is_horde:
+            self.process_horde_volley()
+            return
         self.current_monster_index = 0
         self.process_next_monster_attack()
 
@@ -281,27 +310,50 @@ class CombatManager:
         if self.current_monster_index < len(self.monsters):
             monster = self.monsters[self.current_monster_index]
             if monster.current_hp > 0:
-                attack_amount = monster.attempt_attack(self.player.hero)
-                if attack_amount == 0:
-                    self.logger.info(
-                        f"{monster.name} missed attack on {self.player.hero.name}"
-                    )
-                    self.view.set_message(
-                        f"{monster.name} missed!", self.on_monster_attack_complete
-                    )
-                else:
-                    self.logger.info(
-                        f"{monster.name} attacked {self.player.hero.name} for {attack_amount} damage"
-                    )
-                    self.view.set_message(
-                        f"{monster.name} hit you for {attack_amount} damage!",
-                        self.on_monster_attack_complete,
-                    )
+                self.monster_attack(monster, self.on_monster_attack_complete)
             else:
                 self.on_monster_attack_complete()
         else:
             self.on_all_monster_attacks_complete()
 
+    def process_next_timeline_attack(self):
+        if self.state == States.COMBAT_END:
+            return
+        # Monsters act until the hero is next on the timeline, or falls
+        hero = self.player.hero
+        if hero.current_hp <= 0 or self.scheduler.peek() is hero:
+            self.on_all_monster_attacks_complete()
+            return
+        monster = self.scheduler.next_actor()
+        self.monster_attack(monster, self.process_next_timeline_attack)
+
+    def monster_attack(self, monster: Monster, on_complete) -> None:
+        attack_amount = monster.attempt_attack(self.player.hero)
+        self.horde.refresh(monster)  # It may have healed
+        if attack_amount == 0:
+            self.logger.info(f"{monster.name} missed attack on {self.player.hero.name}")
+            self.view.set_message(f"{monster.name} missed!", on_complete)
+        else:
+            self.logger.info(
+                f"{monster.name} attacked {self.player.hero.name} "
+                f"for {attack_amount} damage"
+            )
+            self.view.set_message(
+                f"{monster.name} hit you for {attack_amount} damage!", on_complete
+            )
+
+    def process_horde_volley(self):
+        volley = self.horde.volley(self.player.hero)
+        self.logger.info(
+            f"{volley.hits} of {volley.attacks} monsters hit "
+            f"{self.player.hero.name} for {volley.damage} damage"
+        )
+        self.view.set_message(
+            f"{volley.hits} of {volley.attacks} monsters hit you "
+            f"for {volley.damage} damage!",
+            self.on_all_monster_attacks_complete,
+        )
+
     def on_monster_attack_complete(self):
         self.current_monster_index += 1
         self.process_next_monster_attack()
@@ -317,6 +369,7 @@ class CombatManager:
         if self.state != States.WAITING:
             self.trigger("reset_combat")
         self.monsters = []
-        self.turn_order = []
+        self.horde.clear()
+        self.scheduler.clear()
         self.waiting_for_animation = False
         self.message_animation_complete = False
@@ -1,3 +1,4 @@
+import logging
 from typing import Optional
 
 import pygame
@@ -5,16 +6,29 @@ from pygame.surface import Surface
 from pygame.time import Clock
 
 from dungeon_adventure.config import RESOURCES_DIR
+from dungeon_adventure.views.pygame.game.resource_manager import AssetManager
+
+BACKGROUND_PATH = f"{RESOURCES_DIR}/default_background.png"
 
 
 class GameScreen:
-    def __init__(self, width: int = 480, height: int = 270, scale_factor: int = 3):
+    def __init__(
+        self,
+        width: int = 480,
+        height: int = 270,
+        scale_factor: int = 3,
+        sdl_scaling: bool = False,
+    ):
         """
         Initialize the game screen with given dimensions and scale factor.
 
         :param width: Base width of the game surface
         :param height: Base height of the game surface
         :param scale_factor: Scale factor for the window size
+        :param sdl_scaling: Open the window in pygame.SCALED mode, so SDL
+            upscales the game surface, on the GPU where it can. The screen is
+            then the size of the game surface, so overlays must be drawn at
+            the base resolution rather than the window's
         """
         pygame.init()
         pygame.display.set_caption("Dungeon Adventure")
@@ -24,18 +38,75 @@ class GameScreen:
         self._scale_factor: int = scale_factor
         self._scaled_width: int = self._width * self._scale_factor
         self._scaled_height: int = self._height * self._scale_factor
+        self._sdl_scaling: bool = sdl_scaling
+        self.logger = logging.getLogger(self.__class__.__name__)
 
         self._screen: Optional[Surface] = None
         self._game_surface: Optional[Surface] = None
+        # Destination of the software upscale, allocated once per resolution
+        self._scaled_surface: Optional[Surface] = None
+        # Whether the game surface can be scaled straight into the screen
+        self._scale_into_screen: bool = False
         self._clock: Optional[Clock] = None
+        # The background decoded and scaled to the game surface, built on the
+        # first draw and again only when the resolution changes
+        self._background: Optional[Surface] = None
 
     def initialize(self):
         pygame.display.set_caption("Dungeon Adventure")
-        self._screen = pygame.display.set_mode(
-            (self._scaled_width, self._scaled_height)
-        )
+        if self._sdl_scaling:
+            self._screen = self._set_scaled_mode()
+        if not self._sdl_scaling:
+            self._screen = pygame.display.set_mode(
+                (self._scaled_width, self._scaled_height)
+            )
         self._game_surface = Surface((self._width, self._height))
+        self._scaled_surface = None
+        # The screen is exactly scale_factor times the game surface, in the
+        # same pixel format, so no intermediate surface is needed
+        self._scale_into_screen = (
+            not self._sdl_scaling
+            and self._screen.get_size() == (self._scaled_width, self._scaled_height)
+            and self._screen.get_bitsize() == self._game_surface.get_bitsize()
+        )
         self._clock = pygame.time.Clock()
+        self._background = None
+
+    def _set_scaled_mode(self) -> Optional[Surface]:
+        size = (self._width, self._height)
+        try:
+            return pygame.display.set_mode(size, pygame.SCALED)
+        except pygame.error:
+            # SDL cannot switch an open window to SCALED, reopen the display
+            pygame.display.quit()
+            pygame.display.init()
+            pygame.display.set_caption("Dungeon Adventure")
+        try:
+            return pygame.display.set_mode(size, pygame.SCALED)
+        except pygame.error as e:
+            self.logger.warning(f"SCALED mode unavailable, scaling in software: {e}")
+            self._sdl_scaling = False
+            return None
+
+    def set_resolution(
+        self, width: int, height: int, scale_factor: Optional[int] = None
+    ) -> None:
+        """
+        Change the size of the game surface and window.
+
+        :param width: New base width of the game surface
+        :param height: New base height of the game surface
+        :param scale_factor: New scale factor, the current one if None
+        """
+        self._width = width
+        self._height = height
+        if scale_factor is not None:
+            self._scale_factor = scale_factor
+        self._scaled_width = self._width * self._scale_factor
+        self._scaled_height = self._height * self._scale_factor
+        if self._screen is not None:
+            self.initialize()
+        self._background = None
 
     @property
     def clock(self) -> Clock:
@@ -64,11 +135,21 @@ class GameScreen:
         """Return the main screen surface."""
         return self._screen
 
+    @property
+    def sdl_scaling(self) -> bool:
+        """Whether SDL upscales the screen, see __init__."""
+        return self._sdl_scaling
+
     def get_scaled_surface(self) -> Surface:
-        """Return a scaled version of the game surface to fit the window."""
-        return pygame.transform.scale(
-            self._game_surface, (self._scaled_width, self._scaled_height)
-        )
+        """
+        Return a scaled version of the game surface to fit the window.
+
+        The surface is reused by every call, so it only holds the latest frame.
+        """
+        size = (self._scaled_width, self._scaled_height)
+        if self._scaled_surface is None or self._scaled_surface.get_size() != size:
+            self._scaled_surface = Surface(size, 0, self._game_surface)
+        return pygame.transform.scale(self._game_surface, size, self._scaled_surface)
 
     def tick(self, fps: int) -> float:
         """
@@ -95,16 +176,60 @@ class GameScreen:
         """
         self._game_surface.fill(color)
 
+    def get_background(self) -> Surface:
+        """The background scaled to the game surface, decoded on first use."""
+        size = (self._width, self._height)
+        if self._background is None or self._background.get_size() != size:
+            self._background = AssetManager.default().image(BACKGROUND_PATH, size)
+        return self._background
+
     def draw_background(self):
-        background = pygame.image.load(
-            f"{RESOURCES_DIR}/default_background.png"
-        ).convert_alpha()
-        background = pygame.transform.scale(background, (self.width, self.height))
-        self._game_surface.blit(background, (0, 0))
+        self._game_surface.blit(self.get_background(), (0, 0))
 
     def blit_scaled(self) -> None:
-        """Draw the scaled game surface onto the main screen."""
-        self._screen.blit(self.get_scaled_surface(), (0, 0))
+        """
+        Draw the scaled game surface onto the main screen.
+
+        Allocates nothing per frame: the game surface is scaled straight into
+        the screen when it is an exact multiple, into a reused surface
+        otherwise, and blitted as is when SDL does the scaling.
+        """
+        if self._sdl_scaling or self._scale_factor == 1:
+            self._screen.blit(self._game_surface, (0, 0))
+        elif self._scale_into_screen:
+            pygame.transform.scale(
+                self._game_surface,
+                (self._scaled_width, self._scaled_height),
+                self._screen,
+            )
+        else:
+            self._screen.blit(self.get_scaled_surface(), (0, 0))
+
+    def blit_scaled_area(self, area: pygame.Rect) -> pygame.Rect:
+        """
+        Draw one area of the game surface, scaled, onto the main screen.
+
+        :param area: The area in game surface coordinates
+        :return: The area of the screen drawn on
+        """
+        area = area.clip(self._game_surface.get_rect())
+        if self._sdl_scaling or self._scale_factor == 1:
+            self._screen.blit(self._game_surface, area.topleft, area)
+            return area
+        k = self._scale_factor
+        window_area = pygame.Rect(area.x * k, area.y * k, area.w * k, area.h * k)
+        if not area:
+            return window_area
+        if self._scale_into_screen:
+            pygame.transform.scale(
+                self._game_surface.subsurface(area),
+                window_area.size,
+                self._screen.subsurface(window_area),
+            )
+        else:
+            scaled = self.get_scaled_surface()
+            self._screen.blit(scaled, window_area.topleft, window_area)
+        return window_area
 
     def blit_no_scale(self) -> None:
         """Draw the scaled game surface onto the main screen."""
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import pygame
 
@@ -18,6 +18,8 @@ class GameWorld:
         self.game_rooms = pygame.sprite.Group()
         self.room_dict: Dict[str, GameRoom] = {}
         self.current_room: Optional[GameRoom] = None
+        # Room shown as of the last dirty_rects call
+        self._drawn_room: Optional[GameRoom] = None
         self.composite_player = composite_player
         self.player_sprite = pygame.sprite.GroupSingle()
         self._game_model = game_model
@@ -41,7 +43,7 @@ class GameWorld:
     def initialize(self):
         self._create_game_rooms()
         self.current_room = self._get_starting_room()
-        self.current_room.room.is_visible = True
+        self.current_room.room.explore()
         self.composite_player.initialize()
         self.composite_player.py_player.rect.center = self.current_room.rect.center
         self.player_sprite.add(self.composite_player.py_player)
@@ -78,6 +80,18 @@ class GameWorld:
         # Draw the player
         self.player_sprite.draw(surface)
 
+    def dirty_rects(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Areas of the surface that changed since the last call: the whole
+        surface after a room change, else the player sprite's old and new
+        places. Empty when nothing moved.
+        """
+        player_rect = self.composite_player.py_player.dirty_rect()
+        if self.current_room is not self._drawn_room:
+            self._drawn_room = self.current_room
+            return [surface.get_rect()]
+        return [player_rect] if player_rect else []
+
     def draw_debug(self, surface: pygame.Surface) -> None:
         """
         Draw debug information for the game world.
@@ -99,8 +113,10 @@ class GameWorld:
 
     def handle_drop_item(self):
         # For simplicity, drop the last item in the inventory
-        if self.composite_player.inventory._items:
-            item_id, (item, quantity) = self.composite_player.inventory._items.popitem()
+        inventory_items = self.composite_player.inventory.get_all_items()
+        if inventory_items:
+            item, _ = inventory_items[-1]
+            self.composite_player.inventory.remove_item(item)
             self.current_room.room.add_item(item)
             print(f"Dropped {item.name}")
         else:
@@ -119,7 +135,7 @@ class GameWorld:
         self.logger.debug(
             f"Room transition: {self.current_room.room.name} -> {direction}"
         )
-        self.current_room.room.is_visible = True
+        self.current_room.room.explore()
         current_dungeon_room = self.current_room.room
         next_dungeon_room = current_dungeon_room.connections[direction]
         if next_dungeon_room:
@@ -155,12 +171,8 @@ class GameWorld:
 
     def _check_win_condition(self):
         if self.current_room.room.room_type is RoomType.EXIT:
-            inventory_items = self.composite_player.inventory.get_all_items()
-            pillar_types = set()
-
-            for item, _ in inventory_items:
-                if item.item_type == ItemType.PILLAR:
-                    pillar_types.add(item.pillar_type)
+            pillars = self.composite_player.inventory.get_items_by_type(ItemType.PILLAR)
+            pillar_types = {item.pillar_type for item, _ in pillars}
 
             if len(pillar_types) == len(PillarType):
                 self.logger.info(
@@ -203,5 +215,3 @@ class GameWorld:
         self.game_model.game_state = GameState.GAME_OVER
         if self.on_win_condition:
             self.on_win_condition()
-
-
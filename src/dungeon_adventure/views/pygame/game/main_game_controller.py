@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, Dict
+from typing import Callable, Dict, List
 
 import pygame
 
@@ -14,6 +14,11 @@ from dungeon_adventure.views.pygame.game.combat_manager import CombatManager
 from dungeon_adventure.views.pygame.game.game_screen import GameScreen
 from dungeon_adventure.views.pygame.game.game_world import GameWorld
 from dungeon_adventure.views.pygame.game.py_game_view import PyGameView
+from dungeon_adventure.views.pygame.game.resource_manager import (
+    AssetManager,
+    TextCache,
+    default_manifest,
+)
 from dungeon_adventure.views.pygame.services.debug_manager import DebugManager
 from dungeon_adventure.views.pygame.services.keybind_manager import KeyBindManager
 from dungeon_adventure.views.pygame.sprites.composite_player import CompositePlayer
@@ -27,6 +32,7 @@ class MainGameController:
         game_screen: GameScreen,
         pygame_view: PyGameView,
         debug_manager: DebugManager,
+        dirty_rects: bool = False,
     ):
         """
         Initialize the GameController with necessary components.
@@ -35,6 +41,8 @@ class MainGameController:
         :param game_screen: The game screen for rendering
         :param pygame_view: The GUI manager for handling UI elements
         :param debug_manager: The debug manager for debug-related functionality
+        :param dirty_rects: Redraw and update only the parts of the screen that
+            changed each frame, and nothing while the screen is idle
         """
         self.game_world: GameWorld = game_world
         self.game_screen: GameScreen = game_screen
@@ -42,6 +50,10 @@ class MainGameController:
         self.debug_manager: DebugManager = debug_manager
         self.key_bind_manager: KeyBindManager = KeyBindManager()
         self.debug_mode = False
+        self.dirty_rects = dirty_rects
+        # Dirty rect mode: redraw everything on the next frame
+        self._full_redraw = True
+        self._drawn_render_key = None
 
         self.logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         pygame.init()
@@ -85,7 +97,8 @@ class MainGameController:
             pygame.K_h: lambda: self.pygame_view.toggle_visibility("controls"),
         }
 
-        self.font = pygame.font.Font(None, 18)
+        self.text_cache = TextCache.default()
+        self.font = self.text_cache.font(18)
         self.win_message = None
 
     def initiate_combat(self):
@@ -120,6 +133,8 @@ class MainGameController:
         pygame.init()
         self.logger.debug("Initializing game components", stacklevel=2)
         self.game_screen.initialize()
+        # Decode the images every room and the hero need before the first frame
+        AssetManager.default().preload(default_manifest())
         self.pygame_view.initialize()
         self.game_world.initialize()
 
@@ -136,14 +151,19 @@ class MainGameController:
             if self.game_world.game_model.game_state != GameState.GAME_OVER:
                 self.update(time_delta)
 
-            self.draw()
-            pygame.display.flip()
+            if self.dirty_rects:
+                self.render_dirty()
+            else:
+                self.draw()
+                pygame.display.flip()
 
         self.logger.info("Game loop ended")
         pygame.quit()
 
     def handle_events(self) -> bool:
         for event in pygame.event.get():
+            # Input can change anything on screen
+            self._full_redraw = True
             if event.type == pygame.QUIT:
                 pygame.mixer.music.stop()
                 self.logger.info("Quit event received")
@@ -215,11 +235,17 @@ class MainGameController:
 
     def update(self, dt: float) -> None:
         self.game_world.update(dt)
-        self.pygame_view.update(
-            self.game_world.current_room,
-            self.game_world.room_dict,
-            self.game_world.composite_player.player,
-        )
+        # In dirty rect mode the UI is only rebuilt when it may show something new
+        if (
+            not self.dirty_rects
+            or self._full_redraw
+            or self._render_key() != self._drawn_render_key
+        ):
+            self.pygame_view.update(
+                self.game_world.current_room,
+                self.game_world.room_dict,
+                self.game_world.composite_player.player,
+            )
         self.debug_manager.update_fps(self.game_screen.clock)
         if self.game_world.game_model.game_state == GameState.IN_COMBAT:
             self.combat_manager.update(dt)
@@ -232,7 +258,9 @@ class MainGameController:
         ):
             self.game_screen.get_game_surface().fill((0, 0, 0))  # Clear screen
             for i, line in enumerate(self.win_message):
-                text_surface = self.font.render(line, True, (255, 255, 255))
+                text_surface = self.text_cache.render(
+                    self.font, line, True, (255, 255, 255)
+                )
                 text_rect = text_surface.get_rect(
                     center=(
                         self.game_screen.width // 2,
@@ -240,19 +268,77 @@ class MainGameController:
                     )
                 )
                 self.game_screen.get_game_surface().blit(text_surface, text_rect)
+            self.game_screen.blit_scaled()
         else:
             self.game_screen.draw_background()
             self._draw_game_world()
             self._draw_debug_info()
             self.game_screen.blit_scaled()
-            if (
-                self.game_world.game_model.game_state == GameState.IN_COMBAT
-                and not self.debug_mode
-            ):
-                self._draw_combat_screen()
-            self._draw_gui()
-        if self.game_world.game_model.game_state == GameState.GAME_OVER:
-            self.game_screen.blit_scaled()
+            # After a loss only the world is shown, without overlays
+            if self.game_world.game_model.game_state != GameState.GAME_OVER:
+                if (
+                    self.game_world.game_model.game_state == GameState.IN_COMBAT
+                    and not self.debug_mode
+                ):
+                    self._draw_combat_screen()
+                self._draw_gui()
+
+    def render_dirty(self) -> List[pygame.Rect]:
+        """
+        Draw the frame in dirty rect mode and push it to the display.
+
+        The whole frame is drawn after input, when the UI shows something new
+        (see PyGameView.render_key), and every frame in combat and debug mode,
+        which animate. Otherwise only the areas the game world reports as
+        changed are drawn again, with pygame.display.update. An idle screen
+        draws nothing.
+
+        :return: The areas of the screen updated
+        """
+        game_state = self.game_world.game_model.game_state
+        world_rects = self.game_world.dirty_rects(self.game_screen.get_game_surface())
+        render_key = self._render_key()
+        if (
+            self._full_redraw
+            or render_key != self._drawn_render_key
+            or game_state == GameState.IN_COMBAT
+            or self.debug_mode
+            or self.debug_manager.debug_mode
+        ):
+            self._full_redraw = False
+            self._drawn_render_key = render_key
+            self.draw()
+            pygame.display.flip()
+            return [self.screen.get_rect()]
+        if game_state == GameState.GAME_OVER:
+            return []
+        updated = [self._redraw_area(area) for area in world_rects]
+        if updated:
+            pygame.display.update(updated)
+        return updated
+
+    def _render_key(self) -> tuple:
+        return (
+            self.game_world.game_model.game_state,
+            self.win_message,
+            self.pygame_view.render_key(
+                self.game_world.current_room,
+                self.game_world.composite_player.player,
+            ),
+        )
+
+    def _redraw_area(self, area: pygame.Rect) -> pygame.Rect:
+        """Draw one area of the game surface again, then the GUI over it."""
+        game_surface = self.game_screen.get_game_surface()
+        game_surface.set_clip(area)
+        self.game_screen.draw_background()
+        self._draw_game_world()
+        game_surface.set_clip(None)
+        screen_area = self.game_screen.blit_scaled_area(area)
+        self.screen.set_clip(screen_area)
+        self._draw_gui()
+        self.screen.set_clip(None)
+        return screen_area
 
     def _draw_combat_screen(self) -> None:
         self.combat_screen.draw(self.screen)
@@ -85,6 +85,29 @@ class PyGameView:
         self.room_items_display.update(current_room.room)
         self.player_status_display.update(player)
 
+    def render_key(self, current_room: GameRoom, player: Player) -> tuple:
+        """
+        The state draw() shows, to tell whether the UI needs drawing again.
+        Changes made through input events are not included; those redraw
+        everything anyway.
+        """
+        return (
+            self._minimap_visible,
+            self._inventory_visible,
+            self._room_items_visible,
+            self._controls_visible,
+            self._player_message_visible,
+            self._player_stats_visible,
+            self.player_message_display.message,
+            self.minimap.vision_potion_active,
+            current_room,
+            len(current_room.room.items),
+            player.hero.current_hp,
+            player.hero.max_hp,
+            player.inventory.stack_count,
+            player.inventory.get_total_weight(),
+        )
+
     def draw(self, screen: pygame.Surface, player: Player) -> None:
         """
         Draw all UI components to the screen.
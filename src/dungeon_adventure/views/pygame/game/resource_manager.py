@@ -1,15 +1,275 @@
+import glob
+import logging
+import os
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
 import pygame
 
-from dungeon_adventure.config import RESOURCES_DIR
+from dungeon_adventure.config import FONT_PATH, RESOURCES_DIR
+
+# Bytes of decoded surfaces kept once they are no longer the most recently used
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+# Bytes of rendered text kept, a few screens' worth of labels
+DEFAULT_TEXT_BUDGET_BYTES = 4 * 1024 * 1024
+
+HERO_WALK_DIR = os.path.join(RESOURCES_DIR, "hero_animations", "hero_walk")
+HERO_IDLE_PATH = os.path.join(HERO_WALK_DIR, "hero_idle.png")
+HERO_WALK_PATHS = [
+    os.path.join(HERO_WALK_DIR, f"hero_walk_{i}.png") for i in range(1, 8)
+]
+ICON_SIZE = (30, 30)
+
+
+class AssetKey(NamedTuple):
+    """An image file and the transform applied to it after loading."""
+
+    path: str
+    scale: Optional[Tuple[int, int]] = None
+    flip_x: bool = False
+    flip_y: bool = False
+
+    @property
+    def is_transformed(self) -> bool:
+        return self.scale is not None or self.flip_x or self.flip_y
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Memory held by a surface's pixels."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def default_manifest() -> List[AssetKey]:
+    """Images the game draws from the first frame: rooms, minimap icons, hero."""
+    manifest = [
+        AssetKey(path)
+        for path in sorted(
+            glob.glob(os.path.join(RESOURCES_DIR, "room_images", "*.png"))
+        )
+    ]
+    manifest += [
+        AssetKey(os.path.join(RESOURCES_DIR, "icons", icon), ICON_SIZE)
+        for icon in ("chest.png", "pillar.png", "banner.png", "banner_green.png")
+    ]
+    for path in [HERO_IDLE_PATH] + HERO_WALK_PATHS:
+        manifest += [AssetKey(path), AssetKey(path, flip_x=True)]
+    return manifest
+
+
+class AssetManager:
+    """
+    Decoded images shared by everything that draws them.
+
+    A surface is loaded once per file and transform: rooms with the same doors
+    share one surface, as do the idle frames of both facings. Transformed
+    surfaces are made from the cached plain one, so a file is decoded once
+    whatever sizes are asked for. Surfaces are shared, so callers must not
+    draw on them; copy one first to change it.
+
+    The least recently used surfaces are dropped once the cache holds more
+    than budget_bytes of pixels. A dropped surface stays valid for whoever
+    still holds it and is loaded again the next time it is asked for.
+    """
+
+    _default: Optional["AssetManager"] = None
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._surfaces: "OrderedDict[AssetKey, pygame.Surface]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def default(cls) -> "AssetManager":
+        """The asset manager shared by the game."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def __contains__(self, key) -> bool:
+        return AssetKey(*key) in self._surfaces
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def image(
+        self,
+        path: str,
+        scale: Optional[Tuple[int, int]] = None,
+        flip_x: bool = False,
+        flip_y: bool = False,
+    ) -> pygame.Surface:
+        """
+        The image at path, scaled to scale then flipped, loaded on first use.
+
+        Needs a display mode to be set, like Surface.convert_alpha.
+        """
+        return self.get(AssetKey(path, tuple(scale) if scale else None, flip_x, flip_y))
+
+    def get(self, key: AssetKey) -> pygame.Surface:
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        if key.is_transformed:
+            surface = self.get(AssetKey(key.path))
+            if key.scale is not None:
+                surface = pygame.transform.scale(surface, key.scale)
+            if key.flip_x or key.flip_y:
+                surface = pygame.transform.flip(surface, key.flip_x, key.flip_y)
+        else:
+            surface = pygame.image.load(key.path).convert_alpha()
+        self._surfaces[key] = surface
+        self._total_bytes += surface_bytes(surface)
+        self._evict()
+        return surface
+
+    def preload(self, manifest: Iterable[AssetKey]) -> int:
+        """
+        Load every asset in the manifest, e.g. at startup.
+
+        :return: Number of assets that were not cached yet
+        """
+        loaded = 0
+        for key in manifest:
+            key = AssetKey(*key)
+            loaded += key not in self._surfaces
+            self.get(key)
+        self.logger.debug(
+            f"Preloaded {loaded} assets, {self._total_bytes // 1024} KiB cached"
+        )
+        return loaded
+
+    def _evict(self) -> None:
+        # Keep the newest surface even if it alone is over the budget
+        while self._total_bytes > self.budget_bytes and len(self._surfaces) > 1:
+            _, surface = self._surfaces.popitem(last=False)
+            self._total_bytes -= surface_bytes(surface)
+
+    def clear(self) -> None:
+        """Drop every cached surface, e.g. after the display mode changed."""
+        self._surfaces.clear()
+        self._total_bytes = 0
+
+
+class FontKey(NamedTuple):
+    """
+    A font file and size. name is a path, a file in the fonts resource
+    directory, or None for pygame's default font.
+    """
+
+    name: Optional[str]
+    size: int
+    bold: bool = False
+    sysfont: bool = False
+
+
+class TextKey(NamedTuple):
+    font: pygame.font.Font
+    text: str
+    antialias: bool
+    color: Tuple[int, int, int, int]
+
+
+class TextCache:
+    """
+    Fonts and rendered text shared by every UI component.
+
+    A font is opened once per file, size and style and kept until pygame
+    quits. Rendered text is cached by font, text, antialias and color, so a
+    label is only rasterized again when its text changes. Like AssetManager,
+    the rendered surfaces are shared and must not be drawn on, and the least
+    recently used are dropped once they hold more than budget_bytes.
+    """
+
+    _default: Optional["TextCache"] = None
+
+    def __init__(self, budget_bytes: int = DEFAULT_TEXT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self._surfaces: "OrderedDict[TextKey, pygame.Surface]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def default(cls) -> "TextCache":
+        """The text cache shared by the game."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
 
+    def font(
+        self,
+        size: int,
+        name: Optional[str] = None,
+        bold: bool = False,
+        sysfont: bool = False,
+    ) -> pygame.font.Font:
+        """
+        The font at size, opened on first use.
 
-def load_background():
-    background = pygame.image.load(
-        f"{RESOURCES_DIR}/default_background.png"
-    ).convert_alpha()
-    return pygame.transform.scale(background, (480, 270))
+        :param size: Font size in pixels
+        :param name: Font file, None for pygame's default font
+        :param bold: Embolden the font
+        :param sysfont: Open name with pygame.font.SysFont
+        """
+        key = FontKey(name, size, bold, sysfont)
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if not self._fonts:
+            # Fonts are unusable once pygame quits, open them again after
+            pygame.register_quit(self.clear)
+        if sysfont:
+            font = pygame.font.SysFont(name, size, bold=bold)
+        else:
+            if name is not None and not os.path.exists(name):
+                name = os.path.join(FONT_PATH, name)
+            font = pygame.font.Font(name, size)
+            font.bold = bold
+        self._fonts[key] = font
+        return font
 
+    def render(
+        self, font: pygame.font.Font, text: str, antialias: bool, color
+    ) -> pygame.Surface:
+        """Font.render, rasterizing text only the first time it is drawn."""
+        key = TextKey(font, text, antialias, tuple(pygame.Color(color)))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        self._total_bytes += surface_bytes(surface)
+        # Keep the newest surface even if it alone is over the budget
+        while self._total_bytes > self.budget_bytes and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self._total_bytes -= surface_bytes(evicted)
+        return surface
 
-class ResourceManager:
-    def __init__(self):
-        self.background = load_background()
+    def clear(self) -> None:
+        """Drop every font and rendered surface."""
+        self._fonts.clear()
+        self._surfaces.clear()
+        self._total_bytes = 0
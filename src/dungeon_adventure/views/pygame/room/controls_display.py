@@ -1,5 +1,7 @@
 import pygame
 
+from dungeon_adventure.views.pygame.game.resource_manager import TextCache
+
 
 class ControlsDisplay:
     def __init__(self, screen_width: int, screen_height: int):
@@ -11,7 +13,8 @@ class ControlsDisplay:
             self.controls_width + 20,
             self.controls_height + 100,
         )
-        self.font = pygame.font.Font(None, 24)
+        self.text_cache = TextCache.default()
+        self.font = self.text_cache.font(24)
         self.keybindings = [
             ("WASD", "Movement"),
             ("I", "Inventory"),
@@ -29,15 +32,19 @@ class ControlsDisplay:
         pygame.draw.rect(surface, (200, 200, 200), self.controls_rect, 2)
 
         # Draw title
-        title_surface = self.font.render("Controls", True, (255, 255, 255))
+        title_surface = self.text_cache.render(
+            self.font, "Controls", True, (255, 255, 255)
+        )
         surface.blit(
             title_surface, (self.controls_rect.x + 70, self.controls_rect.y + 10)
         )
 
         # Draw keybindings
         for i, (key, value) in enumerate(self.keybindings):
-            key_surface = self.font.render(key, True, (255, 255, 255))
-            value_surface = self.font.render(value, True, (255, 255, 255))
+            key_surface = self.text_cache.render(self.font, key, True, (255, 255, 255))
+            value_surface = self.text_cache.render(
+                self.font, value, True, (255, 255, 255)
+            )
             y_pos = self.controls_rect.y + 50 + i * 30
             surface.blit(key_surface, (self.controls_rect.x + 20, y_pos))
             surface.blit(value_surface, (self.controls_rect.x + 100, y_pos))
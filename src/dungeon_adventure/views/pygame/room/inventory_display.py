@@ -6,6 +6,7 @@ from dungeon_adventure.models.inventory.inventory import Inventory
 from dungeon_adventure.models.items.item import Item
 from dungeon_adventure.models.items.weapon import Weapon
 from dungeon_adventure.models.items.potion import Potion
+from dungeon_adventure.views.pygame.game.resource_manager import TextCache
 
 
 class InventoryDisplay:
@@ -16,7 +17,8 @@ class InventoryDisplay:
         self.is_visible = False
         self.inventory: Optional[Inventory] = None
         self.hovered_index = -1
-        self.font = pygame.font.Font(None, 24)
+        self.text_cache = TextCache.default()
+        self.font = self.text_cache.font(24)
 
         # Initialize display properties
         self.display_width = int(self.screen_width * 0.6)
@@ -96,12 +98,16 @@ class InventoryDisplay:
 
             # Draw item name and quantity
             item_text = f"{item.name} (x{quantity})"
-            item_name = self.font.render(item_text, True, (255, 255, 255))
+            item_name = self.text_cache.render(
+                self.font, item_text, True, (255, 255, 255)
+            )
             surface.blit(item_name, (item_x + 5, item_y + 5))
 
         # Draw total weight
         weight_text = f"Total Weight: {self.inventory.get_total_weight():.1f}/{self.inventory.weight_limit:.1f}"
-        weight_surface = self.font.render(weight_text, True, (255, 255, 255))
+        weight_surface = self.text_cache.render(
+            self.font, weight_text, True, (255, 255, 255)
+        )
         surface.blit(
             weight_surface,
             (self.display_x + 5, self.display_y + self.display_height - 30),
@@ -118,7 +124,8 @@ class ItemDetailsPopup:
         self.scale_factor = scale_factor
         self.is_visible = False
         self.item: Optional[Item] = None
-        self.font = pygame.font.Font(None, 24)
+        self.text_cache = TextCache.default()
+        self.font = self.text_cache.font(24)
 
         # Initialize popup properties
         self.popup_width = int(self.screen_width * 0.3)
@@ -189,7 +196,7 @@ class ItemDetailsPopup:
             y_offset += line_height
 
     def _draw_text(self, surface: pygame.Surface, text: str, y_offset: int):
-        text_surface = self.font.render(text, True, (255, 255, 255))
+        text_surface = self.text_cache.render(self.font, text, True, (255, 255, 255))
         surface.blit(text_surface, (self.popup_x + 10, self.popup_y + y_offset))
 
     def _wrap_text(self, text: str, max_width: int) -> List[str]:
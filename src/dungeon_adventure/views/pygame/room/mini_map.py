@@ -6,6 +6,10 @@ import pygame
 from dungeon_adventure.config import RESOURCES_DIR
 from dungeon_adventure.enums.item_types import ItemType
 from dungeon_adventure.enums.room_types import Direction, RoomType
+from dungeon_adventure.views.pygame.game.resource_manager import (
+    ICON_SIZE,
+    AssetManager,
+)
 from dungeon_adventure.views.pygame.room.game_room import GameRoom
 
 
@@ -19,32 +23,18 @@ class MiniMap:
         self.minimap_rect = pygame.Rect(
             screen_width - self.minimap_size[0] - 10, 10, *self.minimap_size
         )
-        self.room_images: Dict[str, pygame.Surface] = {}
-        # Load and scale icon images
-        icon_size = (30, 30)
-        self.chest_icon = pygame.transform.scale(
-            pygame.image.load(
-                os.path.join(RESOURCES_DIR, "icons", "chest.png")
-            ).convert_alpha(),
-            icon_size,
+        assets = AssetManager.default()
+        self.chest_icon = assets.image(
+            os.path.join(RESOURCES_DIR, "icons", "chest.png"), ICON_SIZE
         )
-        self.pillar_icon = pygame.transform.scale(
-            pygame.image.load(
-                os.path.join(RESOURCES_DIR, "icons", "pillar.png")
-            ).convert_alpha(),
-            icon_size,
+        self.pillar_icon = assets.image(
+            os.path.join(RESOURCES_DIR, "icons", "pillar.png"), ICON_SIZE
         )
-        self.exit_icon = pygame.transform.scale(
-            pygame.image.load(
-                os.path.join(RESOURCES_DIR, "icons", "banner.png")
-            ).convert_alpha(),
-            icon_size,
+        self.exit_icon = assets.image(
+            os.path.join(RESOURCES_DIR, "icons", "banner.png"), ICON_SIZE
         )
-        self.entrance_icon = pygame.transform.scale(
-            pygame.image.load(
-                os.path.join(RESOURCES_DIR, "icons", "banner_green.png")
-            ).convert_alpha(),
-            icon_size,
+        self.entrance_icon = assets.image(
+            os.path.join(RESOURCES_DIR, "icons", "banner_green.png"), ICON_SIZE
         )
         self.vision_potion_active = False
 
@@ -103,12 +93,8 @@ class MiniMap:
     def _draw_room(
         self, room: GameRoom, position: Tuple[int, int], is_current: bool = False
     ):
-        if room.room.name not in self.room_images:
-            self.room_images[room.room.name] = pygame.transform.scale(
-                room.image, self.room_size
-            )
-
-        room_image = self.room_images[room.room.name]
+        # Shared by every room with the same doors
+        room_image = AssetManager.default().image(room.image_path, self.room_size)
         rect = room_image.get_rect(center=position)
         self.minimap_surface.blit(room_image, rect)
 
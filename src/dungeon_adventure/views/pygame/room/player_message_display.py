@@ -1,5 +1,7 @@
 import pygame
 
+from dungeon_adventure.views.pygame.game.resource_manager import TextCache
+
 
 class PlayerMessageDisplay:
     def __init__(self, screen_width: int, screen_height: int):
@@ -19,9 +21,7 @@ class PlayerMessageDisplay:
 
     def _ensure_font_initialized(self):
         if self.font is None:
-            if not pygame.font.get_init():
-                pygame.font.init()
-            self.font = pygame.font.Font(None, 30)
+            self.font = TextCache.default().font(30)
 
     # def get_current_message(self):
     #     # if self.current_room is None:
@@ -39,6 +39,8 @@ class PlayerMessageDisplay:
         self._ensure_font_initialized()
 
         if hasattr(self, "message"):
-            text_surface = self.font.render(self.message, True, (255, 255, 255))
+            text_surface = TextCache.default().render(
+                self.font, self.message, True, (255, 255, 255)
+            )
             text_rect = text_surface.get_rect(center=self.controls_rect.center)
             surface.blit(text_surface, text_rect)
@@ -3,9 +3,9 @@ from typing import List, Optional, Tuple
 
 import pygame
 
-from dungeon_adventure.config import FONT_PATH
 from dungeon_adventure.models.dungeon.room import Room
 from dungeon_adventure.models.items import Item
+from dungeon_adventure.views.pygame.game.resource_manager import TextCache
 
 
 class RoomItemsDisplay:
@@ -35,11 +35,12 @@ class RoomItemsDisplay:
         self.display_pos = self.calc_display_pos(scale_factor)
         self.display_rect = self.create_main_display_rect()
 
-        self.title_font: pygame.font.Font = pygame.font.Font(
-            FONT_PATH + "Foldit-Medium.ttf", self.TITLE_FONT_SIZE
+        self.text_cache: TextCache = TextCache.default()
+        self.title_font: pygame.font.Font = self.text_cache.font(
+            self.TITLE_FONT_SIZE, "Foldit-Medium.ttf"
         )
-        self.list_font: pygame.font.Font = pygame.font.Font(
-            FONT_PATH + "barlow.ttf", self.LIST_FONT_SIZE
+        self.list_font: pygame.font.Font = self.text_cache.font(
+            self.LIST_FONT_SIZE, "barlow.ttf"
         )
         self.item_height: int = self.ITEM_HEIGHT_FACTOR * scale_factor
         self.items: List[Item] = []
@@ -86,8 +87,8 @@ class RoomItemsDisplay:
         pygame.draw.rect(surface, (200, 200, 200), self.display_rect, 2)
 
         # title
-        title_surface: pygame.Surface = self.title_font.render(
-            "Room Items", True, self.TEXT_COLOR
+        title_surface: pygame.Surface = self.text_cache.render(
+            self.title_font, "Room Items", True, self.TEXT_COLOR
         )
 
         text_rect = title_surface.get_rect()
@@ -114,8 +115,8 @@ class RoomItemsDisplay:
 
             surface.blit(item_background, item_background_rect)
 
-            item_text_surface: pygame.Surface = self.list_font.render(
-                item.name.upper(), True, self.TEXT_COLOR
+            item_text_surface: pygame.Surface = self.text_cache.render(
+                self.list_font, item.name.upper(), True, self.TEXT_COLOR
             )
 
             surface.blit(
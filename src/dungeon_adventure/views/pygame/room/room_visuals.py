@@ -1,5 +1,6 @@
 import pygame
 from dungeon_adventure.enums.room_types import Direction
+from dungeon_adventure.views.pygame.game.resource_manager import AssetManager
 
 
 class RoomVisuals:
@@ -40,7 +41,8 @@ class RoomVisuals:
         self.extended_floor_color = (0, 0, 255)  # Blue
 
     def initialize(self):
-        self.image = pygame.image.load(self.image_path).convert_alpha()
+        # Shared with every room that has the same doors
+        self.image = AssetManager.default().image(self.image_path)
         self.rect = self.image.get_rect()
         self._walkable_floor_hitbox = pygame.Rect(
             *self.FLOOR_RECT_POSITION, *self.DEFAULT_FLOOR_DIMENSIONS
@@ -1,6 +1,7 @@
 import pygame
 
 from dungeon_adventure.views.pygame.game.game_world import GameWorld
+from dungeon_adventure.views.pygame.game.resource_manager import TextCache
 
 
 class DebugManager:
@@ -23,7 +24,7 @@ class DebugManager:
         if not self.debug_mode:
             return
 
-        font = pygame.font.Font(None, 15)
+        font = TextCache.default().font(15)
         y_offset = 10
         line_height = 20
 
@@ -53,5 +54,7 @@ class DebugManager:
         )
 
         for i, info in enumerate(debug_info):
+            # Rendered directly: positions and timings change every frame and
+            # would push stable labels out of the text cache
             debug_surface = font.render(info, True, (255, 255, 255))
             surface.blit(debug_surface, (10, y_offset + i * line_height))
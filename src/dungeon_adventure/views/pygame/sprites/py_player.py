@@ -1,7 +1,10 @@
 import pygame
-import os
-from dungeon_adventure.config import RESOURCES_DIR
 from dungeon_adventure.views.pygame.animation.animation_manager import AnimationManager
+from dungeon_adventure.views.pygame.game.resource_manager import (
+    HERO_IDLE_PATH,
+    HERO_WALK_PATHS,
+    TextCache,
+)
 from dungeon_adventure.views.pygame.room.game_room import GameRoom
 
 
@@ -15,6 +18,9 @@ class PyPlayer(pygame.sprite.Sprite):
         self.foot_height = 5
         self.facing_right = True
         self.debug_info = ""
+        # Rect and image as of the last dirty_rect call
+        self._drawn_rect = None
+        self._drawn_image = None
 
     def initialize(self):
         self.load_animations()
@@ -24,20 +30,30 @@ class PyPlayer(pygame.sprite.Sprite):
             raise ValueError("Player image is None. Check animation loading.")
         self.rect = self.image.get_rect()
 
-    def load_animations(self):
-        base_path = os.path.join(RESOURCES_DIR, "hero_animations", "hero_walk")
-        idle_path = os.path.join(base_path, "hero_idle.png")
+    def dirty_rect(self):
+        """
+        The area to redraw since the last call: where the sprite was and where
+        it is now, None if it has neither moved nor changed frame.
+        """
+        if self._drawn_image is self.image and self._drawn_rect == self.rect:
+            return None
+        previous = self._drawn_rect
+        self._drawn_rect = self.rect.copy()
+        self._drawn_image = self.image
+        return self._drawn_rect if previous is None else previous.union(self.rect)
 
-        # Load idle animations
-        self.animation_manager.add_animation("idle_right", [idle_path], 1000)
-        self.animation_manager.add_animation("idle_left", [idle_path], 1000)
+    def load_animations(self):
+        # Load idle animations; left facing frames are flipped once, on load
+        self.animation_manager.add_animation("idle_right", [HERO_IDLE_PATH], 1000)
+        self.animation_manager.add_animation(
+            "idle_left", [HERO_IDLE_PATH], 1000, flip_x=True
+        )
 
         # Load walk animations
-        walk_paths = [
-            os.path.join(base_path, f"hero_walk_{i}.png") for i in range(1, 8)
-        ]
-        self.animation_manager.add_animation("walk_right", walk_paths, 1000 // 12)
-        self.animation_manager.add_animation("walk_left", walk_paths, 1000 // 12)
+        self.animation_manager.add_animation("walk_right", HERO_WALK_PATHS, 1000 // 12)
+        self.animation_manager.add_animation(
+            "walk_left", HERO_WALK_PATHS, 1000 // 12, flip_x=True
+        )
 
     def update(self, dt, current_room: GameRoom):
         dt_ms = int(dt * 1000)
@@ -72,9 +88,6 @@ class PyPlayer(pygame.sprite.Sprite):
             raise ValueError(
                 "Player image is None after update. Check animation update logic."
             )
-        if not self.facing_right:
-            self.image = pygame.transform.flip(self.image, True, False)
-
         if self.rect is None:
             self.rect = self.image.get_rect()
         else:
@@ -149,6 +162,7 @@ class PyPlayer(pygame.sprite.Sprite):
 
     def draw_debug_info(self, surface: pygame.Surface) -> None:
         if self.rect is not None:
-            font = pygame.font.Font(None, 14)
+            # Changes every frame, so it is not worth a place in the text cache
+            font = TextCache.default().font(14)
             debug_surface = font.render(self.debug_info, True, (255, 255, 255))
             surface.blit(debug_surface, (self.rect.x, self.rect.y - 30))
@@ -1,4 +1,5 @@
 import logging
+import os
 
 import pygame
 
@@ -9,6 +10,7 @@ from dungeon_adventure.game_model import GameModel, GameModelError
 from dungeon_adventure.logging_config import setup_logging
 from dungeon_adventure.models.player.player import Player
 from dungeon_adventure.services.dungeon_generator import DungeonGenerator
+from dungeon_adventure.services.rng import seed_session, streams
 from dungeon_adventure.views.console.console_view import ConsoleView
 from dungeon_adventure.views.console.map_visualizer import MapVisualizer
 from dungeon_adventure.views.pygame.game.game_screen import GameScreen
@@ -38,6 +40,10 @@ def main():
     setup_logging()
     logger = logging.getLogger(__name__)
     logger.info(f"Starting Dungeon Adventure | Pygame version: {pygame.version.ver}")
+    # Set to replay a game
+    if os.environ.get("DUNGEON_ADVENTURE_SEED"):
+        seed_session(int(os.environ["DUNGEON_ADVENTURE_SEED"]))
+    logger.info(f"Random seed: {streams().seed}")
     game_model = setup_game_model()
     if game_model:
         py_player = PyPlayer()
@@ -54,7 +60,12 @@ def main():
             game_screen.width, game_screen.height, game_screen.scale_factor
         )
         main_game_controller = MainGameController(
-            game_world, game_screen, pygame_view, debug_manager
+            game_world,
+            game_screen,
+            pygame_view,
+            debug_manager,
+            # Set to only redraw what changed, e.g. on low-end machines
+            dirty_rects=bool(os.environ.get("DUNGEON_ADVENTURE_DIRTY_RECTS")),
         )
         main_game_controller.run()
 
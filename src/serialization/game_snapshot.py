@@ -55,6 +55,9 @@ def load_game(file_path: str) -> GameSnapshot:
 
 
 def save_game(game_state: GameSnapshot, file_name: str) -> None:
+    # Saving is a save point for the inventory's write-behind queue too
+    if game_state.player is not None:
+        game_state.player.inventory.flush()
     with open(file_name, "wb") as file:
         pickle.dump(game_state, file)
         print(f"Game saved to {file_name}")
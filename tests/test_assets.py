@@ -0,0 +1,130 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from dungeon_adventure.views.pygame.animation.animation import Animation  # noqa: E402
+from dungeon_adventure.views.pygame.game.resource_manager import (  # noqa: E402
+    AssetKey,
+    AssetManager,
+    TextCache,
+    surface_bytes,
+)
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.display.set_mode((16, 16))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i, size in enumerate([(8, 8), (16, 8), (4, 4)]):
+        path = str(tmp_path / f"image_{i}.png")
+        pygame.image.save(pygame.Surface(size), path)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def image_load():
+    with patch.object(pygame.image, "load", wraps=pygame.image.load) as load:
+        yield load
+
+
+def test_same_path_and_transform_share_a_surface(images, image_load):
+    assets = AssetManager()
+    assert assets.image(images[0]) is assets.image(images[0])
+    scaled = assets.image(images[0], (4, 2))
+    assert scaled.get_size() == (4, 2)
+    assert assets.image(images[0], [4, 2]) is scaled
+    assert assets.image(images[0], flip_x=True) is not assets.image(images[0])
+    # Every transform is made from the one decoded image
+    assert image_load.call_count == 1
+
+
+def test_least_recently_used_surfaces_are_evicted_by_bytes(images):
+    budget = sum(surface_bytes(pygame.Surface(size)) for size in [(8, 8), (4, 4)])
+    assets = AssetManager(budget_bytes=budget)
+    first = assets.image(images[0])
+    assets.image(images[2])
+    assets.image(images[0])
+    assets.image(images[1])
+    assert AssetKey(images[2]) not in assets
+    assert assets.total_bytes <= budget or len(assets) == 1
+    # Evicted surfaces stay usable and are loaded again when asked for
+    assert first.get_size() == (8, 8)
+    assert assets.image(images[2]).get_size() == (4, 4)
+
+
+def test_preload_counts_new_assets(images, image_load):
+    assets = AssetManager()
+    manifest = [AssetKey(images[0]), AssetKey(images[0], flip_x=True), (images[1],)]
+    assert assets.preload(manifest) == 3
+    assert assets.preload(manifest) == 0
+    assert image_load.call_count == 2
+    assert assets.hits >= 3
+
+
+def test_animations_share_frames(images, image_load):
+    with patch.object(AssetManager, "_default", AssetManager()):
+        right = Animation("idle_right", [images[0]], 1000)
+        left = Animation("idle_left", [images[0]], 1000, flip_x=True)
+        again = Animation("idle_right", [images[0]], 1000)
+    assert right.frames[0] is again.frames[0]
+    assert left.frames[0] is not right.frames[0]
+    assert image_load.call_count == 1
+
+
+def test_fonts_are_opened_once_per_size_and_style():
+    text_cache = TextCache()
+    font = text_cache.font(14)
+    assert text_cache.font(14) is font
+    assert text_cache.font(16) is not font
+    assert text_cache.font(14, bold=True) is not font
+    assert text_cache.font(14, bold=True).bold
+
+
+def test_text_is_only_rasterized_when_it_changes():
+    text_cache = TextCache()
+    font = text_cache.font(14)
+    first = text_cache.render(font, "HP: 100/100", True, (255, 255, 255))
+    assert text_cache.render(font, "HP: 100/100", True, "#FFFFFF") is first
+    assert text_cache.render(font, "HP: 90/100", True, (255, 255, 255)) is not first
+    text_cache.render(font, "HP: 90/100", True, (0, 0, 0))
+    # Rasterized once per text and color
+    assert (text_cache.hits, text_cache.misses) == (1, 3)
+
+
+def test_least_recently_rendered_text_is_evicted_by_bytes():
+    text_cache = TextCache()
+    font = text_cache.font(14)
+    sizes = {text: surface_bytes(font.render(text, True, "white")) for text in "abc"}
+    # One byte short of holding all three
+    text_cache.budget_bytes = sum(sizes.values()) - 1
+    first = text_cache.render(font, "a", True, "white")
+    text_cache.render(font, "b", True, "white")
+    text_cache.render(font, "a", True, "white")
+    text_cache.render(font, "c", True, "white")
+    assert len(text_cache) == 2
+    assert text_cache.render(font, "a", True, "white") is first
+    assert text_cache.misses == 3
+    assert text_cache.total_bytes <= text_cache.budget_bytes
+
+
+def test_fonts_are_reopened_after_pygame_quits():
+    text_cache = TextCache()
+    font = text_cache.font(14)
+    text_cache.render(font, "a", True, "white")
+    pygame.quit()
+    pygame.init()
+    assert len(text_cache) == 0
+    assert text_cache.font(14) is not font
+    text_cache.render(text_cache.font(14), "a", True, "white")
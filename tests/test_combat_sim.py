@@ -0,0 +1,111 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dungeon_adventure.models.characters.hero import Hero  # noqa: E402
+from dungeon_adventure.models.characters.monster import Monster  # noqa: E402
+from dungeon_adventure.simulation import (  # noqa: E402
+    CombatantStats,
+    simulate_fights,
+    simulate_fights_scalar,
+)
+
+WARRIOR = CombatantStats("Warrior", 125, 125, 35, 60, 80, block_chance=20)
+OGRE = CombatantStats(
+    "Ogre", 175, 175, 30, 60, 60, heal_chance=10, min_heal=30, max_heal=60
+)
+
+
+def both_engines(hero, monster, fights=200, max_turns=50):
+    return (
+        simulate_fights(hero, monster, fights, seed=3, max_turns=max_turns),
+        simulate_fights_scalar(hero, monster, fights, seed=3, max_turns=max_turns),
+    )
+
+
+def test_stats_from_characters():
+    hero = Hero("Thief", 75, 20, 40, 6, 80, 40)
+    hero.current_hp = 50
+    hero.add_stat_modifier("hit_chance", 5)
+    hero.add_stat_modifier("max_damage", 3)
+    assert CombatantStats.from_character(hero) == CombatantStats(
+        "Thief", 75, 50, 20, 43, 85, block_chance=40
+    )
+    monster = Monster("Ogre", 175, 30, 60, 2, 60, 10, 30, 60, 50)
+    assert CombatantStats.from_character(monster) == OGRE
+
+
+def test_same_seed_same_results():
+    first = simulate_fights(WARRIOR, OGRE, 5000, seed=7)
+    second = simulate_fights(WARRIOR, OGRE, 5000, seed=7, chunk_size=5000)
+    for a, b in zip(first, second):
+        np.testing.assert_array_equal(a, b)
+    other = simulate_fights(WARRIOR, OGRE, 5000, seed=8)
+    assert not np.array_equal(first.turns, other.turns)
+
+
+def test_chunks_are_concatenated():
+    results = simulate_fights(WARRIOR, OGRE, 2500, seed=1, chunk_size=1000)
+    assert results.fights == 2500
+    assert results.finished.all()
+
+
+def test_certain_rolls_match_exactly():
+    hero = CombatantStats("Hero", 100, 100, 10, 10, 100)
+    monster = CombatantStats("Monster", 30, 30, 8, 8, 100)
+    for results in both_engines(hero, monster):
+        assert results.hero_won.all()
+        assert (results.turns == 3).all()
+        assert (results.hero_hp == 84).all()
+
+
+def test_block_halves_damage_rounding_up():
+    hero = CombatantStats("Hero", 100, 100, 1, 1, 100, block_chance=100)
+    monster = CombatantStats("Monster", 3, 3, 9, 9, 100)
+    for results in both_engines(hero, monster):
+        # Two monster attacks of 9 land as 5 each
+        assert (results.hero_hp == 90).all()
+        assert (results.turns == 3).all()
+
+
+def test_monster_heals_after_a_killing_blow():
+    # Every hit kills, but the heal after taking damage brings the monster back
+    hero = CombatantStats("Hero", 100, 100, 10, 10, 100)
+    monster = CombatantStats(
+        "Monster", 10, 10, 0, 0, 0, heal_chance=100, min_heal=5, max_heal=5
+    )
+    for results in both_engines(hero, monster):
+        assert not results.finished.any()
+        assert results.stalemate_rate == 1.0
+        assert (results.turns == 50).all()
+        assert (results.monster_hp == 10).all()
+
+
+def test_statistics_match_the_game_rules():
+    vectorized = simulate_fights(WARRIOR, OGRE, 200_000, seed=1)
+    scalar = simulate_fights_scalar(WARRIOR, OGRE, 4000, seed=1)
+    assert vectorized.win_rate == pytest.approx(scalar.win_rate, abs=0.04)
+    expected, actual = scalar.summary(), vectorized.summary()
+    assert actual["mean_turns_to_kill"] == pytest.approx(
+        expected["mean_turns_to_kill"], abs=0.3
+    )
+    assert actual["mean_hp_remaining"] == pytest.approx(
+        expected["mean_hp_remaining"], rel=0.1
+    )
+
+
+def test_distributions_sum_to_win_rate():
+    results = simulate_fights(WARRIOR, OGRE, 10_000, seed=2)
+    assert results.turns_to_kill().sum() == pytest.approx(results.win_rate)
+    assert results.hp_remaining().sum() == pytest.approx(results.win_rate)
+    assert results.turns_to_kill()[0] == 0
+
+
+def test_scalar_engine_restores_random_state():
+    import random
+
+    random.seed(5)
+    expected = random.random()
+    random.seed(5)
+    simulate_fights_scalar(WARRIOR, OGRE, 10, seed=1)
+    assert random.random() == expected
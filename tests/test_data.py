@@ -0,0 +1,78 @@
+import logging
+
+import pytest
+
+from dungeon_adventure.data import close_all, content_load, get_database, load_timings
+from dungeon_adventure.data.content import (
+    HERO_SEED,
+    MONSTER_MIGRATIONS,
+    find_hero_rows,
+    find_monster_row,
+    hero_database,
+    load_monster_rows,
+    monster_database,
+    seed_heroes,
+    seed_monsters,
+)
+
+
+@pytest.fixture(autouse=True)
+def close_databases():
+    yield
+    close_all()
+
+
+def test_one_connection_per_file(tmp_path):
+    path = str(tmp_path / "game.db")
+    assert get_database(path) is get_database(path)
+    assert get_database(path) is not get_database(str(tmp_path / "other.db"))
+
+
+def test_file_databases_use_wal(tmp_path):
+    database = get_database(str(tmp_path / "game.db"))
+    assert database.query_one("PRAGMA journal_mode") == ("wal",)
+
+
+def test_forked_process_gets_its_own_connection(tmp_path):
+    path = str(tmp_path / "game.db")
+    parent = get_database(path)
+    parent.pid = -1
+    assert get_database(path) is not parent
+
+
+def test_migrations_run_once_in_order(tmp_path):
+    path = str(tmp_path / "monsters.db")
+    assert monster_database(path).schema_version == len(MONSTER_MIGRATIONS)
+    close_all()
+    database = get_database(path)
+    assert database.migrate(MONSTER_MIGRATIONS) == len(MONSTER_MIGRATIONS)
+    indexes = database.query_all("PRAGMA index_list(monster_factory_new)")
+    assert [index[1] for index in indexes] == ["monster_factory_new_name"]
+
+
+def test_seeding_is_idempotent(tmp_path):
+    path = str(tmp_path / "monsters.db")
+    assert seed_monsters(monster_database(path)) == 3
+    assert seed_monsters(monster_database(path)) == 0
+    assert [row[0] for row in load_monster_rows(path)] == [
+        "Skeleton",
+        "Gremlin",
+        "Ogre",
+    ]
+    assert find_monster_row("Ogre", path)[:2] == (3, "Ogre")
+    assert find_monster_row("Dragon", path) is None
+
+
+def test_hero_rows(tmp_path):
+    path = str(tmp_path / "heroes.db")
+    seed_heroes(hero_database(path))
+    assert find_hero_rows("Thief", path) == [HERO_SEED[2]]
+
+
+def test_content_load_records_timings(caplog):
+    with content_load("fast things"):
+        pass
+    with caplog.at_level(logging.WARNING), content_load("slow things", budget=-1):
+        pass
+    assert load_timings["fast things"] >= 0
+    assert "over the" in caplog.text and "slow things" in caplog.text
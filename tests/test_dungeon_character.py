@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
 
@@ -77,6 +78,47 @@ class TestDungeonCharacter(unittest.TestCase):
         self.character.add_stat_modifier("hit_chance", 10)
         self.assertEqual(self.character.get_total_hit_chance(), 90)
 
+    def test_stat_modifiers_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.character.stat_modifiers["hit_chance"] = 100
+
+    def test_effective_stats_follow_modifiers(self):
+        self.assertEqual(self.character.effective_stats, (10, 20, 80))
+        self.character.add_stat_modifier("min_damage", 4)
+        self.character.add_stat_modifier("max_damage", 6)
+        self.assertEqual(self.character.effective_stats, (14, 26, 80))
+        self.character.base_max_damage = 30
+        self.assertEqual(self.character.effective_stats.max_damage, 36)
+        self.character.remove_stat_modifier("max_damage")
+        self.assertEqual(self.character.effective_stats, (14, 30, 80))
+
+    def test_effective_stats_are_cached(self):
+        stats = self.character.effective_stats
+        self.assertIs(self.character.effective_stats, stats)
+        self.character.add_stat_modifier("hit_chance", 5)
+        self.assertIsNot(self.character.effective_stats, stats)
+
+    def test_effective_damage_is_never_negative(self):
+        self.character.add_stat_modifier("min_damage", -50)
+        self.character.add_stat_modifier("max_damage", -50)
+        self.assertEqual(self.character.effective_stats[:2], (0, 0))
+
+    def test_damage_rolls_include_modifiers(self):
+        self.character.add_stat_modifier("min_damage", 100)
+        self.character.add_stat_modifier("max_damage", 100)
+        for _ in range(20):
+            self.assertTrue(110 <= self.character._calculate_damage() <= 120)
+
+    def test_pickle_keeps_modifiers(self):
+        self.character.add_stat_modifier("hit_chance", 7)
+        self.character.effective_stats
+        loaded = pickle.loads(pickle.dumps(self.character))
+        self.assertEqual(loaded.stat_modifiers, {"hit_chance": 7})
+        self.assertEqual(loaded.get_total_hit_chance(), 87)
+        loaded.add_stat_modifier("hit_chance", 1)
+        self.assertEqual(loaded.stat_modifiers["hit_chance"], 8)
+        self.assertEqual(loaded.get_total_hit_chance(), 88)
+
     def test_simulate_attack_roll(self):
         roll, would_hit = self.character.simulate_attack_roll()
         self.assertTrue(1 <= roll <= 20)
@@ -0,0 +1,104 @@
+import pytest
+
+from dungeon_adventure.enums.item_types import ItemType, PillarType
+from dungeon_adventure.enums.room_types import RoomType
+from dungeon_adventure.models.characters.monster_templates import (
+    MonsterTemplateRegistry,
+    SpawnTable,
+)
+from dungeon_adventure.services.dungeon_generator import (
+    ENTRANCE_ROOM_NAME,
+    DungeonGenerator,
+)
+
+
+@pytest.fixture
+def procedural_dungeon():
+    return DungeonGenerator.generate_procedural(20, 15, seed=7, monster_chance=0)
+
+
+def layout(dungeon):
+    return {
+        name: sorted(
+            (direction.name, other.name) for direction, other in room.get_open_gates()
+        )
+        for name, room in dungeon.rooms.items()
+    }
+
+
+def test_procedural_room_count(procedural_dungeon):
+    assert len(procedural_dungeon.rooms) == int(20 * 15 * 0.6)
+
+
+def test_procedural_same_seed_same_layout(procedural_dungeon):
+    again = DungeonGenerator.generate_procedural(20, 15, seed=7, monster_chance=0)
+    assert layout(again) == layout(procedural_dungeon)
+
+
+def test_procedural_different_seed_different_layout(procedural_dungeon):
+    other = DungeonGenerator.generate_procedural(20, 15, seed=8, monster_chance=0)
+    assert layout(other) != layout(procedural_dungeon)
+
+
+def test_procedural_every_room_reachable(procedural_dungeon):
+    entrance = procedural_dungeon.get_room(ENTRANCE_ROOM_NAME)
+    seen = {entrance.name}
+    stack = [entrance]
+    while stack:
+        for _, other in stack.pop().get_open_gates():
+            if other.name not in seen:
+                seen.add(other.name)
+                stack.append(other)
+    assert seen == set(procedural_dungeon.rooms)
+
+
+def test_procedural_entrance_and_exit(procedural_dungeon):
+    rooms = procedural_dungeon.get_rooms()
+    assert (
+        procedural_dungeon.get_room(ENTRANCE_ROOM_NAME).room_type == RoomType.ENTRANCE
+    )
+    exits = [room for room in rooms if room.room_type == RoomType.EXIT]
+    assert len(exits) == 1
+    assert exits[0].name.endswith("Exit Chamber")
+
+
+def test_procedural_places_all_pillars_outside_pits(procedural_dungeon):
+    pillar_rooms = {}
+    for room in procedural_dungeon.get_rooms():
+        for item in room.items:
+            if item.item_type == ItemType.PILLAR:
+                pillar_rooms[item.pillar_type] = room
+    assert set(pillar_rooms) == set(PillarType)
+    assert len({room.name for room in pillar_rooms.values()}) == len(PillarType)
+    assert all(room.room_type == RoomType.NORMAL for room in pillar_rooms.values())
+
+
+def test_procedural_doors_match_grid_neighbours(procedural_dungeon):
+    for room in procedural_dungeon.get_rooms():
+        for direction, other in room.get_open_gates():
+            assert other.connections[room.opposite(direction)] is room
+
+
+@pytest.mark.parametrize("width, height, density", [(0, 5, 0.5), (5, 5, 0), (2, 2, 1)])
+def test_procedural_rejects_bad_arguments(width, height, density):
+    with pytest.raises(ValueError):
+        DungeonGenerator.generate_procedural(width, height, seed=1, density=density)
+
+
+def test_procedural_spawns_from_spawn_table(tmp_path, monkeypatch):
+    registry = MonsterTemplateRegistry(str(tmp_path / "monsters.db"))
+    monkeypatch.setattr(MonsterTemplateRegistry, "_default", registry)
+    dungeons = [
+        DungeonGenerator.generate_procedural(
+            20, 15, seed=3, monster_chance=0.5, spawn_table=SpawnTable({"Ogre": 1})
+        )
+        for _ in range(2)
+    ]
+    counts = [
+        [len(room.monsters) for room in dungeon.get_rooms()] for dungeon in dungeons
+    ]
+    assert counts[0] == counts[1]
+    assert sum(counts[0]) > 0
+    assert {
+        monster.name for room in dungeons[0].get_rooms() for monster in room.monsters
+    } == {"Ogre"}
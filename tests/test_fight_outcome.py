@@ -0,0 +1,92 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dungeon_adventure.models.characters.hero import Hero  # noqa: E402
+from dungeon_adventure.models.characters.monster import Monster  # noqa: E402
+from dungeon_adventure.simulation import (  # noqa: E402
+    CombatantStats,
+    damage_per_attack,
+    expected_outcome,
+    fight_outcome,
+    simulate_fights,
+)
+
+WARRIOR = CombatantStats("Warrior", 125, 125, 35, 60, 80, block_chance=20)
+OGRE = CombatantStats(
+    "Ogre", 175, 175, 30, 60, 60, heal_chance=10, min_heal=30, max_heal=60
+)
+
+
+def test_damage_per_attack():
+    pmf = damage_per_attack(OGRE, WARRIOR)
+    assert pmf.sum() == pytest.approx(1.0)
+    assert pmf[0] == pytest.approx(0.4)
+    # 30 is rolled or is a blocked 59 or 60
+    assert pmf[30] == pytest.approx(0.6 / 31 * (0.8 + 2 * 0.2))
+
+    blocked = damage_per_attack(
+        CombatantStats("Monster", 1, 1, 9, 9, 100),
+        CombatantStats("Hero", 1, 1, 1, 1, 0, block_chance=100),
+    )
+    assert blocked[5] == 1.0
+
+
+def test_certain_rolls():
+    hero = CombatantStats("Hero", 100, 100, 10, 10, 100)
+    monster = CombatantStats("Monster", 30, 30, 8, 8, 100)
+    outcome = fight_outcome(hero, monster)
+    assert outcome.win_probability == 1.0
+    assert outcome.turns_to_kill[3] == 1.0
+    assert outcome.hp_remaining[84] == 1.0
+    assert outcome.expected_turns_to_kill == 3.0
+
+
+def test_monster_heals_after_a_killing_blow():
+    hero = CombatantStats("Hero", 100, 100, 10, 10, 100)
+    monster = CombatantStats(
+        "Monster", 10, 10, 0, 0, 0, heal_chance=100, min_heal=5, max_heal=5
+    )
+    outcome = fight_outcome(hero, monster, max_turns=50)
+    assert outcome.stalemate_probability == pytest.approx(1.0)
+    assert outcome.win_probability == 0.0
+
+
+def test_probabilities_add_up():
+    outcome = fight_outcome(WARRIOR, OGRE)
+    total = (
+        outcome.win_probability
+        + outcome.loss_probability
+        + outcome.stalemate_probability
+    )
+    assert total == pytest.approx(1.0)
+    assert outcome.turns_to_kill.sum() == pytest.approx(outcome.win_probability)
+    assert outcome.hp_remaining.sum() == pytest.approx(outcome.win_probability)
+
+
+def test_matches_monte_carlo():
+    outcome = fight_outcome(WARRIOR, OGRE)
+    sampled = simulate_fights(WARRIOR, OGRE, 500_000, seed=4)
+    assert outcome.win_probability == pytest.approx(sampled.win_rate, abs=0.005)
+    assert outcome.expected_turns_to_kill == pytest.approx(
+        sampled.summary()["mean_turns_to_kill"], abs=0.02
+    )
+    turns = sampled.turns_to_kill()
+    np.testing.assert_allclose(outcome.turns_to_kill[: turns.size], turns, atol=0.005)
+
+
+def test_results_are_cached_by_stats():
+    first = fight_outcome(WARRIOR, OGRE)
+    renamed = fight_outcome(WARRIOR._replace(name="Other"), OGRE)
+    assert renamed is first
+    assert fight_outcome(WARRIOR._replace(hp=60), OGRE) is not first
+    with pytest.raises(ValueError):
+        first.turns_to_kill[1] = 1.0
+
+
+def test_expected_outcome_reads_characters():
+    hero = Hero("Warrior", 125, 35, 60, 4, 80, 20)
+    monster = Monster("Ogre", 175, 30, 60, 2, 60, 10, 30, 60, 50)
+    assert expected_outcome(hero, monster) is fight_outcome(WARRIOR, OGRE)
+    hero.current_hp = 10
+    assert expected_outcome(hero, monster).win_probability < 0.1
@@ -0,0 +1,103 @@
+import pickle
+import random
+
+import pytest
+
+from dungeon_adventure.models.dungeon.dungeon import Dungeon
+from dungeon_adventure.models.dungeon.fog_of_war import (
+    FogOfWar,
+    decode_runs,
+    encode_runs,
+)
+from dungeon_adventure.models.dungeon.grid_dungeon import GridDungeon
+from dungeon_adventure.models.dungeon.room import Room
+
+
+def test_explore_reveals_and_counts():
+    fog = FogOfWar(20)
+    fog.set_explored(3)
+    fog.set_explored(3)
+    fog.set_visible(17)
+    assert fog.is_explored(3) and fog.is_visible(3)
+    assert not fog.is_explored(17) and fog.is_visible(17)
+    assert (fog.explored_count, fog.visible_count) == (1, 2)
+    fog.clear(3)
+    assert (fog.explored_count, fog.visible_count) == (0, 1)
+    assert list(fog.visible_indices()) == [17]
+
+
+@pytest.mark.parametrize("size", [0, 1, 7, 8, 9, 1000])
+def test_runs_round_trip(size):
+    rng = random.Random(size)
+    bits = bytearray(rng.getrandbits(8) for _ in range((size + 7) // 8))
+    # Long runs of both values exercise the whole-byte paths
+    bits[len(bits) // 4 : len(bits) // 2] = b"\xff" * (len(bits) // 2 - len(bits) // 4)
+    if size % 8:
+        bits[-1] &= (1 << (size % 8)) - 1
+    assert decode_runs(encode_runs(bits, size), size) == bits
+
+
+def test_decode_runs_rejects_wrong_size():
+    with pytest.raises(ValueError):
+        decode_runs(encode_runs(bytearray(2), 16), 8)
+
+
+def test_pickle_is_run_length_encoded():
+    fog = FogOfWar(1_000_000)
+    for index in range(500):
+        fog.set_explored(index)
+    restored = pickle.loads(pickle.dumps(fog))
+    assert len(pickle.dumps(fog)) < 200
+    assert (restored.explored_count, restored.visible_count) == (500, 500)
+    assert restored.is_explored(499) and not restored.is_explored(500)
+
+
+def test_union():
+    first, second = FogOfWar(10), FogOfWar(30)
+    first.set_explored(2)
+    second.set_explored(2)
+    second.set_visible(25)
+    merged = first | second
+    assert merged.size == 30
+    assert (merged.explored_count, merged.visible_count) == (1, 2)
+
+
+def test_dungeon_rooms_share_one_map():
+    dungeon = Dungeon()
+    rooms = [dungeon.add_room(f"Room {index}") for index in range(4)]
+    rooms[0].explore()
+    rooms[1].is_visible = True
+    assert dungeon.fog.explored_count == 1
+    assert dungeon.fog.visible_count == 2
+    assert dungeon.percent_explored() == 25.0
+    dungeon.remove_room("Room 0")
+    assert dungeon.percent_explored() == 0.0
+
+
+def test_detached_room_keeps_flags_when_added():
+    room = Room("Loose")
+    room.explore()
+    fog = FogOfWar()
+    room.attach_fog(fog, 5)
+    assert room.is_explored and fog.is_explored(5)
+
+
+def test_grid_rooms_use_cell_index():
+    dungeon = GridDungeon(4, 4)
+    room = dungeon.add_room("Corner", 3, 2)
+    room.explore()
+    assert room.fog_index == 11
+    assert dungeon.fog.is_explored(11)
+
+
+def test_old_saves_move_flags_into_fog():
+    dungeon = Dungeon()
+    room = dungeon.add_room("Old")
+    state = {k: v for k, v in room.__dict__.items() if k not in ("_fog", "_fog_index")}
+    state.update(is_explored=True, _is_visible=True)
+    legacy_room = Room.__new__(Room)
+    legacy_room.__setstate__(state)
+    legacy_dungeon = Dungeon.__new__(Dungeon)
+    legacy_dungeon.__setstate__({"rooms": {"Old": legacy_room}})
+    assert legacy_room.is_explored
+    assert legacy_dungeon.fog.explored_count == 1
@@ -0,0 +1,101 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from dungeon_adventure.views.pygame.game.game_screen import GameScreen  # noqa: E402
+from dungeon_adventure.views.pygame.game.resource_manager import (  # noqa: E402
+    AssetManager,
+)
+from dungeon_adventure.views.pygame.sprites.py_player import PyPlayer  # noqa: E402
+
+
+@pytest.fixture
+def screen():
+    screen = GameScreen(48, 27, 2)
+    screen.initialize()
+    yield screen
+    pygame.quit()
+
+
+@pytest.fixture
+def image_load():
+    with (
+        patch.object(AssetManager, "_default", AssetManager()),
+        patch.object(
+            pygame.image, "load", side_effect=lambda path: pygame.Surface((8, 8))
+        ) as load,
+    ):
+        yield load
+
+
+def test_background_is_decoded_once(screen, image_load):
+    for _ in range(3):
+        screen.draw_background()
+    assert image_load.call_count == 1
+    assert screen.get_background().get_size() == (48, 27)
+
+
+def test_background_is_rebuilt_when_the_resolution_changes(screen, image_load):
+    screen.draw_background()
+    screen.set_resolution(64, 36)
+    screen.draw_background()
+    # Scaled again from the image decoded the first time
+    assert image_load.call_count == 1
+    assert screen.get_background().get_size() == (64, 36)
+    assert screen.get_screen().get_size() == (128, 72)
+
+
+def test_blit_scaled_fills_the_window(screen):
+    screen.get_game_surface().fill((200, 40, 10))
+    screen.blit_scaled()
+    assert screen.get_screen().get_at((95, 53))[:3] == (200, 40, 10)
+
+
+def test_scaled_surface_is_reused(screen):
+    first = screen.get_scaled_surface()
+    assert screen.get_scaled_surface() is first
+    assert first.get_size() == (96, 54)
+
+
+def test_sdl_scaling_draws_at_the_base_resolution():
+    screen = GameScreen(48, 27, 2, sdl_scaling=True)
+    screen.initialize()
+    try:
+        if screen.sdl_scaling:
+            assert screen.get_screen().get_size() == (48, 27)
+        else:
+            # Fell back to scaling in software
+            assert screen.get_screen().get_size() == (96, 54)
+        screen.blit_scaled()
+    finally:
+        pygame.quit()
+
+
+def test_blit_scaled_area_only_draws_that_area(screen):
+    screen.get_game_surface().fill((200, 40, 10))
+    drawn = screen.blit_scaled_area(pygame.Rect(10, 5, 4, 3))
+    assert drawn == pygame.Rect(20, 10, 8, 6)
+    assert screen.get_screen().get_at((20, 10))[:3] == (200, 40, 10)
+    assert screen.get_screen().get_at((27, 15))[:3] == (200, 40, 10)
+    assert screen.get_screen().get_at((28, 16))[:3] == (0, 0, 0)
+    # Clipped to the game surface
+    assert screen.blit_scaled_area(pygame.Rect(40, 20, 20, 20)).size == (16, 14)
+
+
+def test_player_dirty_rect_covers_the_old_and_new_place():
+    player = PyPlayer()
+    player.image = pygame.Surface((4, 6))
+    player.rect = player.image.get_rect(topleft=(10, 10))
+    assert player.dirty_rect() == pygame.Rect(10, 10, 4, 6)
+    assert player.dirty_rect() is None
+    player.rect.x += 3
+    assert player.dirty_rect() == pygame.Rect(10, 10, 7, 6)
+    assert player.dirty_rect() is None
+    # A new animation frame in the same place
+    player.image = pygame.Surface((4, 6))
+    assert player.dirty_rect() == pygame.Rect(13, 10, 4, 6)
@@ -0,0 +1,95 @@
+import pytest
+
+from dungeon_adventure.enums.room_types import Direction
+from dungeon_adventure.models.dungeon.dungeon import DungeonError
+from dungeon_adventure.models.dungeon.grid_dungeon import (
+    DOOR_EAST,
+    DOOR_WEST,
+    GridDungeon,
+)
+from dungeon_adventure.services.dungeon_generator import DungeonGenerator
+
+
+@pytest.fixture
+def grid():
+    dungeon = GridDungeon(3, 3)
+    dungeon.add_room("A", 0, 0)
+    dungeon.add_room("B", 1, 0)
+    dungeon.add_room("C", 1, 1)
+    return dungeon
+
+
+def test_grid_connect_rooms(grid):
+    assert grid.connect_rooms("A", Direction.EAST, "B")
+    room_a, room_b = grid.get_room("A"), grid.get_room("B")
+    assert room_a.connections[Direction.EAST] is room_b
+    assert room_b.connections[Direction.WEST] is room_a
+    assert room_a.connections[Direction.NORTH] is None
+    assert grid.door_mask(0, 0) == DOOR_EAST
+    assert grid.door_mask(1, 0) == DOOR_WEST
+
+
+def test_grid_room_has_no_connections_dict(grid):
+    room_a = grid.get_room("A")
+    assert "connections" not in vars(room_a)
+    assert room_a.connections is room_a.connections
+    room_a.connections[Direction.EAST] = grid.get_room("B")
+    assert grid.get_room("B").connections[Direction.WEST] is room_a
+
+
+def test_grid_connect_twice_fails(grid):
+    assert grid.connect_rooms("A", Direction.EAST, "B")
+    assert not grid.connect_rooms("B", Direction.WEST, "A")
+
+
+def test_grid_connect_requires_neighbour(grid):
+    with pytest.raises(DungeonError):
+        grid.connect_rooms("A", Direction.SOUTH, "C")
+
+
+def test_grid_open_gates(grid):
+    grid.connect_rooms("A", Direction.EAST, "B")
+    grid.connect_rooms("B", Direction.SOUTH, "C")
+    room_b = grid.get_room("B")
+    assert set(room_b.get_open_gates()) == {
+        (Direction.WEST, grid.get_room("A")),
+        (Direction.SOUTH, grid.get_room("C")),
+    }
+
+
+def test_grid_room_coordinates(grid):
+    assert grid.get_room("C").coordinates == (1, 1)
+    assert grid.room_at(1, 1) is grid.get_room("C")
+    assert grid.room_at(2, 2) is None
+    assert grid.room_at(-1, 0) is None
+
+
+def test_grid_rejects_taken_cell(grid):
+    with pytest.raises(DungeonError):
+        grid.add_room("D", 0, 0)
+
+
+def test_grid_remove_room_closes_doors(grid):
+    grid.connect_rooms("A", Direction.EAST, "B")
+    grid.remove_room("B")
+    assert grid.get_room("A").connections[Direction.EAST] is None
+    assert grid.room_at(1, 0) is None
+    assert not grid.room_exists("B")
+
+
+def test_grid_add_and_connect_room(grid):
+    room_d = grid.add_and_connect_room("D", "C", Direction.EAST)
+    assert room_d.coordinates == (2, 1)
+    assert grid.get_room("C").connections[Direction.EAST] is room_d
+
+
+def test_procedural_grid_matches_plain_layout():
+    plain = DungeonGenerator.generate_procedural(12, 12, seed=3, monster_chance=0)
+    grid = DungeonGenerator.generate_procedural(
+        12, 12, seed=3, monster_chance=0, grid=True
+    )
+    assert isinstance(grid, GridDungeon)
+    for name, room in plain.rooms.items():
+        expected = {(d, other.name) for d, other in room.get_open_gates()}
+        actual = {(d, other.name) for d, other in grid.get_room(name).get_open_gates()}
+        assert actual == expected
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
 from dungeon_adventure.services.item_factory import ItemFactory
+from dungeon_adventure.services.rng import RandomStream
 from src.dungeon_adventure.enums.item_types import WeaponType
 from src.dungeon_adventure.models.characters.hero import Hero
 
@@ -27,13 +28,13 @@ class TestHero(unittest.TestCase):
         self.assertEqual(self.hero.xp_to_next_level, 100)
         self.assertIsNone(self.hero.equipped_weapon)
 
-    @patch("random.randint")
+    @patch.object(RandomStream, "randint")
     def test_mitigate_damage_block(self, mock_randint):
         mock_randint.return_value = 10  # Ensure block
         mitigated = self.hero._mitigate_damage(100)
         self.assertEqual(mitigated, 50)
 
-    @patch("random.randint")
+    @patch.object(RandomStream, "randint")
     def test_mitigate_damage_no_block(self, mock_randint):
         mock_randint.return_value = 100  # Ensure no block
         mitigated = self.hero._mitigate_damage(100)
@@ -59,6 +60,13 @@ class TestHero(unittest.TestCase):
         self.assertEqual(self.hero.stat_modifiers.get("max_damage", 3), 4)
         # bow increases from min damage by 2 for max
 
+    def test_weapon_modifiers_raise_damage(self):
+        weapon = self.item_factory.create_weapon("Sword", WeaponType.SWORD, 1, 10, 5)
+        self.hero.equip_weapon(weapon)
+        self.assertEqual(self.hero.effective_stats.min_damage, 10 + weapon.min_damage)
+        self.assertEqual(self.hero.effective_stats.max_damage, 20 + weapon.max_damage)
+        self.assertIn(f"Damage: {10 + weapon.min_damage}-", str(self.hero))
+
     def test_gain_xp_no_level_up(self):
         self.hero.gain_xp(50)
         self.assertEqual(self.hero.xp, 50)
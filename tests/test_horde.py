@@ -0,0 +1,124 @@
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from dungeon_adventure.controllers.combat_controller import CombatController
+from dungeon_adventure.enums.combat_state import CombatState
+from dungeon_adventure.exceptions.combat import CharacterNotInCombatError
+from dungeon_adventure.models.characters.hero import Hero
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.models.combat.horde import (
+    HORDE_THRESHOLD,
+    Horde,
+    summarize,
+)
+from dungeon_adventure.models.player.player import Player
+
+
+def make_monsters(n, name="Skeleton", **stats):
+    stats = {"max_hp": 30, "heal_chance": 0, **stats}
+    return [Monster(name=name, **stats) for _ in range(n)]
+
+
+@pytest.fixture
+def hero():
+    return Hero(max_hp=10_000, block_chance=0)
+
+
+def test_remove_moves_the_last_monster_into_the_gap():
+    monsters = make_monsters(5)
+    horde = Horde(monsters)
+    horde.remove(monsters[1])
+    assert horde.alive == [monsters[0], monsters[4], monsters[2], monsters[3]]
+    horde.remove(monsters[3])
+    horde.remove(monsters[4])
+    assert set(horde) == {monsters[0], monsters[2]}
+    assert monsters[4] not in horde
+    with pytest.raises(CharacterNotInCombatError):
+        horde.remove(monsters[4])
+
+
+def test_refresh_removes_the_dead():
+    monsters = make_monsters(3)
+    horde = Horde(monsters)
+    monsters[0].hurt(10)
+    assert horde.refresh(monsters[0])
+    monsters[0].hurt(100)
+    assert not horde.refresh(monsters[0])
+    assert len(horde) == 2
+    # Dead monsters never join
+    assert len(Horde(monsters)) == 2
+
+
+def test_volley_rolls_every_attack(hero):
+    horde = Horde(
+        make_monsters(30, base_hit_chance=100, base_min_damage=2, base_max_damage=2)
+        + make_monsters(20, name="Ogre", base_hit_chance=0)
+    )
+    volley = horde.volley(hero, random.Random(1))
+    assert volley == (50, 30, 60, 0)
+    assert hero.current_hp == 10_000 - 60
+
+
+def test_volley_hit_rate_matches_hit_chance(hero):
+    horde = Horde(make_monsters(2000, base_hit_chance=70))
+    volley = horde.volley(hero, random.Random(7))
+    assert volley.hits == pytest.approx(1400, abs=80)
+
+
+def test_volley_stops_hitting_a_dead_target():
+    hero = Hero(max_hp=10, block_chance=0)
+    horde = Horde(
+        make_monsters(50, base_hit_chance=100, base_min_damage=3, base_max_damage=3)
+    )
+    volley = horde.volley(hero, random.Random(1))
+    assert not hero.is_alive
+    assert (volley.hits, volley.damage) == (4, 10)
+
+
+def test_volley_heals_only_wounded_monsters(hero):
+    monsters = make_monsters(
+        20, base_hit_chance=0, heal_chance=100, min_heal=5, max_heal=5
+    )
+    monsters[3].hurt(8)
+    horde = Horde(monsters)
+    assert horde.volley(hero, random.Random(1)).healed == 5
+    assert horde.volley(hero, random.Random(1)).healed == 3
+    assert monsters[3].current_hp == monsters[3].max_hp
+    assert horde.volley(hero, random.Random(1)).healed == 0
+
+
+def test_take_hits_blocks_each_hit_and_stops_at_death():
+    hero = Hero(max_hp=100, block_chance=100)
+    assert hero.take_hits([10, 11]) == 2
+    assert hero.current_hp == 100 - 5 - 6
+    assert hero.take_hits([200, 200, 200]) == 1
+    assert hero.current_hp == 0
+
+
+def test_summarize_groups_alive_monsters_by_name():
+    monsters = make_monsters(3) + make_monsters(2, name="Ogre", max_hp=100)
+    monsters[0].hurt(100)
+    monsters[1].hurt(15)
+    skeletons, ogres = summarize(monsters)
+    assert (skeletons.name, skeletons.count, skeletons.first) == ("Skeleton", 2, 1)
+    assert skeletons.hp_ratio == pytest.approx(45 / 60)
+    assert (ogres.count, ogres.hp, ogres.first) == (2, 200, 3)
+
+
+def test_controller_fights_large_encounters_as_a_horde():
+    player = Player("Test Player")
+    controller = CombatController(Mock(player=player), Mock())
+    monsters = make_monsters(HORDE_THRESHOLD * 10, base_hit_chance=50)
+    controller.monsters = monsters
+    controller.combat_state = CombatState.MONSTER_TURN
+    controller.monster_turn()
+    assert controller.view.display_message.call_count == 1
+    assert controller.combat_state == CombatState.PLAYER_TURN
+
+    target = monsters[0]
+    target.hurt(1000)
+    controller.check_combat_end(target)
+    assert target not in controller.monsters
+    assert len(controller.monsters) == len(monsters) - 1
@@ -0,0 +1,124 @@
+from collections import Counter
+from unittest.mock import Mock
+
+import pytest
+
+from dungeon_adventure.controllers.combat_controller import CombatController
+from dungeon_adventure.enums.combat_state import CombatState
+from dungeon_adventure.enums.game_state import GameState
+from dungeon_adventure.exceptions.combat import CharacterNotInCombatError
+from dungeon_adventure.models.characters.hero import Hero
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.models.combat.initiative import InitiativeScheduler
+from dungeon_adventure.models.player.player import Player
+
+
+def monster(name, speed):
+    return Monster(name=name, attack_speed=speed)
+
+
+@pytest.fixture
+def hero():
+    return Hero(attack_speed=5)
+
+
+def test_order_is_by_speed_then_joining_order(hero):
+    slow, fast, tied = monster("Ogre", 2), monster("Gremlin", 7), monster("Rat", 5)
+    scheduler = InitiativeScheduler([hero, slow, fast, tied])
+    assert scheduler.order() == [fast, hero, tied, slow]
+
+
+def test_add_and_remove_mid_fight(hero):
+    first, second = monster("A", 3), monster("B", 4)
+    scheduler = InitiativeScheduler([hero, first])
+    scheduler.add(second)
+    assert scheduler.order() == [hero, second, first]
+    scheduler.remove(first)
+    assert first not in scheduler
+    assert scheduler.order() == [hero, second]
+    assert len(scheduler) == 2
+    with pytest.raises(CharacterNotInCombatError):
+        scheduler.remove(first)
+    scheduler.discard(first)
+
+
+def test_rejects_non_characters():
+    with pytest.raises(CharacterNotInCombatError):
+        InitiativeScheduler().add("not a character")
+
+
+def test_faster_characters_act_more_often(hero):
+    slow = monster("Slow", 2)
+    fast = monster("Fast", 6)
+    scheduler = InitiativeScheduler([hero, slow, fast])
+    actions = Counter(scheduler.next_actor() for _ in range(130))
+    # Per time unit: 6 + 5 + 2 actions
+    assert actions[fast] == 60
+    assert actions[hero] == 50
+    assert actions[slow] == 20
+
+
+def test_simultaneous_actions_follow_initiative(hero):
+    double = monster("Double", 10)
+    scheduler = InitiativeScheduler([double, hero])
+    actors = [scheduler.next_actor() for _ in range(3)]
+    # Both act at time 1/5; the faster one goes first
+    assert actors == [double, double, hero]
+    assert scheduler.time == pytest.approx(0.2)
+
+
+def test_removed_characters_leave_the_timeline(hero):
+    others = [monster(f"M{i}", 5) for i in range(50)]
+    scheduler = InitiativeScheduler([hero, *others])
+    for other in others:
+        scheduler.remove(other)
+    assert {scheduler.next_actor() for _ in range(5)} == {hero}
+    assert scheduler.peek() is hero
+    scheduler.remove(hero)
+    with pytest.raises(CharacterNotInCombatError):
+        scheduler.next_actor()
+
+
+def test_late_joiners_wait_for_their_gauge(hero):
+    scheduler = InitiativeScheduler([hero])
+    scheduler.next_actor()
+    late = monster("Late", 5)
+    scheduler.add(late)
+    # Hero acts at 2/5, the newcomer at 1/5 + 1/5 as well, joining later
+    assert [scheduler.next_actor(), scheduler.next_actor()] == [hero, late]
+
+
+def test_ready_characters_act_first(hero):
+    fast = monster("Fast", 10)
+    scheduler = InitiativeScheduler()
+    scheduler.add(hero, ready=True)
+    scheduler.add(fast)
+    assert scheduler.next_actor() is hero
+    assert scheduler.order() == [fast, hero]
+
+
+def test_controller_timeline_gives_faster_monsters_more_turns():
+    player = Player("Test Player")
+    speed = player.hero.attack_speed
+    harmless = {"base_hit_chance": 0, "heal_chance": 0}
+    slow = Monster("Slow", attack_speed=speed, **harmless)
+    fast = Monster("Fast", attack_speed=2 * speed, **harmless)
+    game_model = Mock(player=player, game_state=GameState.IN_COMBAT)
+    controller = CombatController(game_model, Mock(), timeline=True)
+    controller.monsters = [slow, fast]
+    controller.determine_turn_order()
+
+    turns = []
+    controller.combat_state = controller.pass_turn(CombatState.PLAYER_TURN)
+    for _ in range(40):
+        if controller.combat_state == CombatState.PLAYER_TURN:
+            turns.append(player.hero)
+            controller.combat_state = controller.pass_turn(CombatState.MONSTER_TURN)
+        else:
+            turns.append(controller.acting_monster)
+            controller.monster_turn()
+    assert turns[0] is player.hero
+    counts = Counter(turns)
+    assert counts[fast] == pytest.approx(20, abs=1)
+    assert counts[slow] == pytest.approx(10, abs=1)
+    assert counts[player.hero] == pytest.approx(10, abs=1)
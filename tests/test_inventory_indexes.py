@@ -0,0 +1,130 @@
+import pickle
+
+import pytest
+
+from dungeon_adventure.data import close_all
+from dungeon_adventure.enums.item_types import (
+    ItemType,
+    PillarType,
+    PotionType,
+    WeaponType,
+)
+from dungeon_adventure.exceptions.player import InventoryFullError
+from dungeon_adventure.models.inventory.inventory import Inventory
+from dungeon_adventure.services.item_factory import ItemFactory
+
+
+@pytest.fixture(autouse=True)
+def close_databases():
+    yield
+    close_all()
+
+
+@pytest.fixture
+def item_factory():
+    return ItemFactory()
+
+
+@pytest.fixture
+def inventory():
+    return Inventory(weight_limit=100, flush_interval=None)
+
+
+@pytest.fixture
+def potion(item_factory):
+    return item_factory.create_potion("Healing Potion", PotionType.HEALING, 15, 1.5)
+
+
+@pytest.fixture
+def sword(item_factory):
+    return item_factory.create_weapon("Sword", WeaponType.SWORD, 20, 10, 100)
+
+
+@pytest.fixture
+def pillar(item_factory):
+    return item_factory.create_pillar(
+        PillarType.ABSTRACTION, "Pillar of Abstraction", "One of the four pillars"
+    )
+
+
+def scanned_weight(inventory):
+    return sum(item.weight * quantity for item, quantity in inventory.get_all_items())
+
+
+def test_total_weight_tracks_adds_and_removes(inventory, potion, sword):
+    for _ in range(3):
+        inventory.add_item(potion)
+    inventory.add_item(sword)
+    assert inventory.get_total_weight() == pytest.approx(scanned_weight(inventory))
+    inventory.remove_item(potion)
+    inventory.remove_item(sword)
+    assert inventory.get_total_weight() == pytest.approx(3.0)
+    inventory.remove_item(potion)
+    inventory.remove_item(potion)
+    assert inventory.get_total_weight() == 0.0
+
+
+def test_weight_limit_uses_running_total(item_factory):
+    inventory = Inventory(weight_limit=10, flush_interval=None)
+    rock = item_factory.create_weapon("Rock", WeaponType.AXE, 1, 4, 10)
+    inventory.add_item(rock)
+    inventory.add_item(rock)
+    with pytest.raises(InventoryFullError):
+        inventory.add_item(rock)
+    inventory.remove_item(rock)
+    inventory.add_item(rock)
+    assert inventory.get_item_quantity(rock.id) == 2
+
+
+def test_name_lookup_ignores_case(inventory, potion, sword):
+    inventory.add_item(potion)
+    inventory.add_item(sword)
+    assert inventory.get_item_by_name("healing POTION") is potion
+    assert inventory.get_item_by_name("SWORD") is sword
+    assert inventory.get_item_by_name("Shield") is None
+
+
+def test_name_lookup_returns_first_added_and_forgets_removed(
+    inventory, item_factory, potion
+):
+    other = item_factory.create_potion("Healing Potion", PotionType.HEALING, 30, 1)
+    inventory.add_item(potion)
+    inventory.add_item(other)
+    assert inventory.get_item_by_name("healing potion") is potion
+    inventory.remove_item(potion)
+    assert inventory.get_item_by_name("healing potion") is other
+    inventory.remove_item(other)
+    assert inventory.get_item_by_name("healing potion") is None
+
+
+def test_items_by_type(inventory, potion, sword, pillar):
+    inventory.add_item(potion)
+    inventory.add_item(potion)
+    inventory.add_item(sword)
+    inventory.add_item(pillar)
+    assert inventory.get_items_by_type(ItemType.POTION) == [(potion, 2)]
+    assert inventory.get_items_by_type(ItemType.PILLAR) == [(pillar, 1)]
+    assert inventory.get_items_by_type(ItemType.KEY) == []
+    assert inventory.has_item_type(ItemType.WEAPON)
+    inventory.remove_item(sword)
+    assert not inventory.has_item_type(ItemType.WEAPON)
+    assert inventory.get_items_by_type(ItemType.WEAPON) == []
+
+
+def test_indexes_survive_pickling(inventory, potion, sword, pillar):
+    for item in (potion, potion, sword, pillar):
+        inventory.add_item(item)
+    restored = pickle.loads(pickle.dumps(inventory))
+    assert restored.get_total_weight() == pytest.approx(inventory.get_total_weight())
+    assert restored.get_item_by_name("sword").id == sword.id
+    assert [item.id for item, _ in restored.get_items_by_type(ItemType.PILLAR)] == [
+        pillar.id
+    ]
+
+
+def test_legacy_state_rebuilds_indexes(potion, sword):
+    legacy = Inventory.__new__(Inventory)
+    legacy.__setstate__(({potion.id: (potion, 2), sword.id: (sword, 1)}, 50.0))
+    assert legacy.get_total_weight() == pytest.approx(13.0)
+    assert legacy.get_item_by_name("healing potion") is potion
+    assert legacy.get_items_by_type(ItemType.WEAPON) == [(sword, 1)]
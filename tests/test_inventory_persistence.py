@@ -0,0 +1,125 @@
+import pickle
+
+import pytest
+
+from dungeon_adventure.data import close_all, database
+from dungeon_adventure.enums.item_types import PotionType, WeaponType
+from dungeon_adventure.models.inventory import inventory_db
+from dungeon_adventure.models.inventory.inventory import Inventory
+from dungeon_adventure.services.item_factory import ItemFactory
+
+
+@pytest.fixture(autouse=True)
+def close_databases():
+    yield
+    close_all()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "inventory.db")
+
+
+@pytest.fixture
+def item_factory():
+    return ItemFactory()
+
+
+@pytest.fixture
+def potion(item_factory):
+    return item_factory.create_potion("Healing Potion", PotionType.HEALING, 15, 1)
+
+
+@pytest.fixture
+def sword(item_factory):
+    return item_factory.create_weapon("Sword", WeaponType.SWORD, 20, 10, 100)
+
+
+@pytest.fixture
+def connects(monkeypatch):
+    calls = []
+    real_connect = database.sqlite3.connect
+
+    def counting_connect(*args, **kwargs):
+        calls.append(args)
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr(database.sqlite3, "connect", counting_connect)
+    return calls
+
+
+def test_creating_inventories_opens_no_connection(db_path, connects, potion):
+    inventories = [Inventory(database_path=db_path) for _ in range(100)]
+    inventories[0].add_item(potion)
+    assert connects == []
+
+
+def test_writes_are_coalesced_until_flush(db_path, connects, potion, sword):
+    inventory = Inventory(weight_limit=500, database_path=db_path, flush_interval=None)
+    for _ in range(40):
+        inventory.add_item(potion)
+    inventory.add_item(sword)
+    inventory.remove_item(sword)
+    assert connects == []
+    assert inventory.flush() == 2
+    assert inventory._db.get_all_items() == [(potion.id, "Healing Potion", 40)]
+    assert len(connects) == 1
+
+
+def test_failed_flush_keeps_writes_queued(db_path, potion, sword, monkeypatch):
+    inventory = Inventory(weight_limit=500, database_path=db_path, flush_interval=None)
+    inventory.add_item(potion)
+    inventory.add_item(sword)
+    real_transaction = database.Database.transaction
+
+    def locked(self):
+        raise database.sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(database.Database, "transaction", locked)
+    with pytest.raises(database.sqlite3.OperationalError):
+        inventory.flush()
+    assert inventory._db.pending_writes == 2
+    monkeypatch.setattr(database.Database, "transaction", real_transaction)
+    assert inventory.flush() == 2
+    assert sorted(row[1] for row in inventory._db.get_all_items()) == [
+        "Healing Potion",
+        "Sword",
+    ]
+
+
+def test_flushes_after_interval(db_path, potion, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(inventory_db.time, "monotonic", lambda: now[0])
+    inventory = Inventory(database_path=db_path, flush_interval=5)
+    inventory.add_item(potion)
+    assert inventory._db.pending_writes == 1
+    now[0] += 5
+    inventory.add_item(potion)
+    assert inventory._db.pending_writes == 0
+
+
+def test_inventories_do_not_share_rows(db_path, potion, sword):
+    first = Inventory(database_path=db_path, flush_interval=None)
+    second = Inventory(database_path=db_path, flush_interval=None)
+    first.add_item(potion)
+    second.add_item(sword)
+    first.flush()
+    second.flush()
+    assert [row[0] for row in first._db.get_all_items()] == [potion.id]
+
+
+def test_pickle_keeps_identity_and_requeues_items(db_path, potion):
+    inventory = Inventory(database_path=db_path, flush_interval=None)
+    inventory.add_item(potion)
+    inventory.flush()
+    restored = pickle.loads(pickle.dumps(inventory))
+    assert restored._db.inventory_id == inventory._db.inventory_id
+    assert restored._db.pending_writes == 1
+    assert restored.get_item_quantity(potion.id) == 1
+
+
+def test_loads_saves_without_persistence_state(potion):
+    inventory = Inventory.__new__(Inventory)
+    inventory.__setstate__(({potion.id: (potion, 2)}, 50.0))
+    assert inventory.get_item_quantity(potion.id) == 2
+    assert inventory._db.pending_writes == 1
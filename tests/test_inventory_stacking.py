@@ -0,0 +1,114 @@
+import pickle
+
+import pytest
+
+from dungeon_adventure.data import close_all
+from dungeon_adventure.enums.item_types import ItemType, PotionType, WeaponType
+from dungeon_adventure.exceptions.player import InventoryFullError, ItemNotFoundError
+from dungeon_adventure.models.inventory.inventory import Inventory
+from dungeon_adventure.services.item_factory import HEALING_POTION, ItemFactory
+
+
+@pytest.fixture(autouse=True)
+def close_databases():
+    yield
+    close_all()
+
+
+@pytest.fixture
+def item_factory():
+    return ItemFactory()
+
+
+@pytest.fixture
+def inventory():
+    return Inventory(weight_limit=100, flush_interval=None)
+
+
+@pytest.fixture
+def potions(item_factory):
+    return [item_factory.create(HEALING_POTION) for _ in range(10)]
+
+
+def test_items_with_one_definition_share_a_stack(inventory, potions):
+    for potion in potions:
+        inventory.add_item(potion)
+    assert inventory.get_all_items() == [(potions[0], 10)]
+    assert inventory.stack_count == 1
+    assert inventory.get_item_quantity(potions[0].id) == 10
+    assert inventory.get_item_by_id(potions[5].id) is None
+    assert inventory.get_total_weight() == pytest.approx(20)
+
+    inventory.remove_item(potions[7])
+    assert inventory.count(potions[3]) == 9
+    assert inventory.remove_item_by_id(potions[0].id) is potions[0]
+    assert inventory.count(potions[0]) == 8
+
+
+def test_items_with_state_stack_per_item(inventory, item_factory):
+    swords = [
+        item_factory.create_weapon("Sword", WeaponType.SWORD, 20, 5, 100)
+        for _ in range(2)
+    ]
+    swords[1].use(None)
+    for sword in swords:
+        inventory.add_item(sword)
+    assert inventory.get_all_items() == [(swords[0], 1), (swords[1], 1)]
+    assert swords[0].definition is swords[1].definition
+    inventory.remove_item(swords[1])
+    assert inventory.get_item_by_name("sword") is swords[0]
+    assert inventory.get_item_by_name("sword").durability == 100
+
+
+def test_bulk_add_and_remove(inventory, potions):
+    inventory.add_items(potions[0], 40)
+    inventory.add_items(potions[1], 5)
+    assert inventory.count(potions[0]) == 45
+    assert inventory.get_total_weight() == pytest.approx(90)
+
+    assert inventory.remove_items(potions[2], 44) is potions[0]
+    assert inventory.count(potions[0]) == 1
+    inventory.remove_items(potions[0], 1)
+    assert inventory.stack_count == 0
+    assert not inventory.has_item_type(ItemType.POTION)
+    assert inventory.get_item_by_name("healing potion") is None
+    assert inventory.get_total_weight() == 0.0
+
+
+def test_bulk_add_checks_the_weight_of_every_unit(inventory, potions):
+    inventory.add_items(potions[0], 49)
+    with pytest.raises(InventoryFullError):
+        inventory.add_items(potions[0], 2)
+    assert inventory.count(potions[0]) == 49
+
+
+def test_bulk_operations_reject_bad_quantities(inventory, item_factory, potions):
+    sword = item_factory.create_weapon("Sword", WeaponType.SWORD, 20, 5, 100)
+    with pytest.raises(ValueError):
+        inventory.add_items(sword, 2)
+    with pytest.raises(ValueError):
+        inventory.add_items(potions[0], 0)
+    inventory.add_items(potions[0], 3)
+    with pytest.raises(ItemNotFoundError):
+        inventory.remove_items(potions[0], 4)
+    with pytest.raises(ItemNotFoundError):
+        inventory.remove_item(sword)
+    assert inventory.count(potions[0]) == 3
+
+
+def test_pickling_keeps_stacks(inventory, potions):
+    inventory.add_items(potions[0], 6)
+    restored = pickle.loads(pickle.dumps(inventory))
+    assert restored.get_all_items()[0][1] == 6
+    restored.add_item(potions[4])
+    assert restored.count(potions[0]) == 7
+
+
+def test_legacy_saves_merge_into_stacks(item_factory):
+    first = item_factory.create_potion("Healing Potion", PotionType.HEALING, 15, 1)
+    second = item_factory.create_potion("Healing Potion", PotionType.HEALING, 15, 1)
+    inventory = Inventory.__new__(Inventory)
+    inventory.__setstate__(({first.id: (first, 1), second.id: (second, 2)}, 50.0))
+    assert inventory.get_all_items() == [(first, 3)]
+    assert inventory.get_total_weight() == pytest.approx(3)
+    assert inventory._db.get_all_items() == [(first.id, "Healing Potion", 3)]
@@ -0,0 +1,117 @@
+import pickle
+
+import pytest
+
+from dungeon_adventure.enums.item_types import (
+    ItemType,
+    PillarType,
+    PotionType,
+    WeaponType,
+)
+from dungeon_adventure.models.items import HealingPotion, ItemDefinition, Sword
+from dungeon_adventure.services.item_factory import HEALING_POTION, ItemFactory
+
+
+@pytest.fixture
+def item_factory():
+    return ItemFactory()
+
+
+class Patient:
+    def __init__(self):
+        self.healed = 0
+
+    def heal(self, amount):
+        self.healed += amount
+
+
+def test_equal_items_share_one_definition(item_factory):
+    first = item_factory.create_potion("Healing Potion", PotionType.HEALING, 300, 2)
+    second = item_factory.create_potion("Healing Potion", PotionType.HEALING, 300, 2)
+    assert first.id != second.id
+    assert first.definition is second.definition is HEALING_POTION
+    assert first.description is second.description
+
+
+def test_different_items_get_different_definitions(item_factory):
+    small = item_factory.create_potion("Healing Potion", PotionType.HEALING, 15, 2)
+    big = item_factory.create(HEALING_POTION)
+    sword = item_factory.create_weapon("Healing Potion", WeaponType.SWORD, 1, 2, 5)
+    assert small.definition is not big.definition
+    assert sword.definition is not big.definition
+    assert (small.heal_amount, big.heal_amount) == (15, 300)
+
+
+def test_items_store_only_id_and_state(item_factory):
+    potion = item_factory.create(HEALING_POTION)
+    sword = item_factory.create_weapon("Sword", WeaponType.SWORD, 20, 10, 100)
+    assert not hasattr(potion, "__dict__")
+    assert not hasattr(sword, "__dict__")
+
+
+def test_create_from_definition_matches_constructor(item_factory):
+    potion = item_factory.create(HEALING_POTION)
+    assert isinstance(potion, HealingPotion)
+    assert potion.name == "Healing Potion"
+    assert potion.weight == 2
+    assert potion.item_type is ItemType.POTION
+    assert potion.potion_type is PotionType.HEALING
+    patient = Patient()
+    assert potion.use(patient)
+    assert patient.healed == 300
+
+
+def test_durability_is_per_item(item_factory):
+    sword = item_factory.create_weapon("Sword", WeaponType.SWORD, 20, 10, 100)
+    copy = item_factory.clone(sword)
+    copy.use(None)
+    assert (sword.durability, copy.durability) == (100, 99)
+    assert copy.definition is sword.definition
+    assert copy.id != sword.id
+
+    fresh = item_factory.create(sword.definition, durability=7)
+    assert isinstance(fresh, Sword)
+    assert (fresh.min_damage, fresh.max_damage, fresh.durability) == (20, 22, 7)
+
+
+def test_utility_item_state(item_factory):
+    rope = item_factory.create_rope()
+    other = item_factory.clone(rope)
+    rope.use(None)
+    assert (rope.durability, other.durability) == (2, 3)
+    assert rope.use_type == "pit" and rope.auto_use
+
+
+def test_pickling_reinterns_definitions(item_factory):
+    sword = item_factory.create_weapon("Sword", WeaponType.SWORD, 20, 10, 100)
+    sword.use(None)
+    pillar = item_factory.create_pillar(PillarType.INHERITANCE, "Pillar", "Old")
+    restored_sword, restored_pillar = pickle.loads(pickle.dumps([sword, pillar]))
+    assert restored_sword.definition is sword.definition
+    assert restored_sword.durability == 99
+    assert restored_pillar.definition is pillar.definition
+    assert restored_pillar.pillar_type is PillarType.INHERITANCE
+
+
+def test_legacy_item_state_is_converted():
+    sword = Sword.__new__(Sword)
+    sword.__setstate__(
+        {
+            "_id": "ITEM_0001",
+            "_name": "Rusty Sword",
+            "_description": "A sharp sword",
+            "_weight": 7,
+            "_item_type": ItemType.WEAPON,
+            "_weapon_type": WeaponType.SWORD,
+            "_min_damage": 10,
+            "_max_damage": 12,
+            "_durability": 40,
+        }
+    )
+    assert sword.definition is Sword("ITEM_0002", "Rusty Sword", 10, 7, 100).definition
+    assert (sword.id, sword.durability, sword.max_damage) == ("ITEM_0001", 40, 12)
+
+
+def test_definition_equality_includes_item_class():
+    fields = ("Thing", "", 1.0, ItemType.POTION)
+    assert ItemDefinition(HealingPotion, *fields) != ItemDefinition(Sword, *fields)
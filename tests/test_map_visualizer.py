@@ -0,0 +1,125 @@
+import random
+
+import pytest
+
+from dungeon_adventure.enums.room_types import Direction
+from dungeon_adventure.models.dungeon.dungeon import Dungeon
+from dungeon_adventure.services.dungeon_generator import DungeonGenerator
+from dungeon_adventure.views.console.map_visualizer import MapVisualizer
+
+ENTRANCE = "Room 1 - Entrance Hall"
+
+
+@pytest.fixture
+def small_dungeon():
+    dungeon = Dungeon()
+    for name in (ENTRANCE, "North", "East", "Far East"):
+        dungeon.add_room(name)
+    dungeon.connect_rooms(ENTRANCE, Direction.NORTH, "North")
+    dungeon.connect_rooms(ENTRANCE, Direction.EAST, "East")
+    dungeon.connect_rooms("East", Direction.EAST, "Far East")
+    return dungeon
+
+
+@pytest.fixture
+def visualizer(small_dungeon):
+    map_visualizer = MapVisualizer(small_dungeon)
+    map_visualizer.initialize()
+    return map_visualizer
+
+
+def test_room_coordinates_mirror_grid(visualizer):
+    assert len(visualizer.room_coordinates) == len(visualizer.grid)
+    for coords, room in visualizer.grid.items():
+        assert visualizer.room_coordinates[room] == coords
+    assert visualizer.grid[(2, 0)].name == "Far East"
+
+
+def test_update_explored_rooms_marks_neighbours(visualizer, small_dungeon):
+    visualizer.update_explored_rooms(small_dungeon.get_room(ENTRANCE))
+    assert visualizer.explored_rooms == {(0, 0), (0, -1), (1, 0)}
+
+
+def test_update_explored_rooms_ignores_unknown_room(visualizer, small_dungeon):
+    stray = Dungeon().add_room("Stray")
+    visualizer.update_explored_rooms(stray)
+    assert visualizer.explored_rooms == set()
+
+
+def test_generate_map_marks_current_room(visualizer, small_dungeon):
+    lines = visualizer.generate_map(small_dungeon.get_room(ENTRANCE))
+    assert lines == ["[ ]   ", "[X][ ]"]
+
+
+def test_initialize_long_corridor_without_recursion():
+    dungeon = Dungeon()
+    previous = dungeon.add_room(ENTRANCE)
+    for index in range(5000):
+        room = dungeon.add_room(f"Corridor {index}")
+        previous.connect(Direction.EAST, room)
+        previous = room
+    map_visualizer = MapVisualizer(dungeon)
+    map_visualizer.initialize()
+    assert len(map_visualizer.grid) == 5001
+    assert map_visualizer.room_coordinates[previous] == (5000, 0)
+
+
+def test_initialize_records_collisions():
+    # Walking E, S, W, N from the entrance comes back to (0, 0) on a new room
+    dungeon = Dungeon()
+    names = [ENTRANCE, "B", "C", "D", "E"]
+    for name in names:
+        dungeon.add_room(name)
+    for (room1, room2), direction in zip(
+        zip(names, names[1:]),
+        (Direction.EAST, Direction.SOUTH, Direction.WEST, Direction.NORTH),
+    ):
+        dungeon.connect_rooms(room1, direction, room2)
+    map_visualizer = MapVisualizer(dungeon)
+    map_visualizer.initialize()
+    assert map_visualizer.grid[(0, 0)].name == ENTRANCE
+    assert [(coords, a.name, b.name) for coords, a, b in map_visualizer.collisions] == [
+        ((0, 0), ENTRANCE, "E")
+    ]
+    assert dungeon.get_room("E") not in map_visualizer.room_coordinates
+
+
+def full_render(map_visualizer, current_room):
+    """Reference renderer: redraw every row of the explored bounding box."""
+    xs = [x for x, _ in map_visualizer.explored_rooms]
+    ys = [y for _, y in map_visualizer.explored_rooms]
+    lines = []
+    for y in range(min(ys), max(ys) + 1):
+        line = ""
+        for x in range(min(xs), max(xs) + 1):
+            room = map_visualizer.grid.get((x, y))
+            if (x, y) not in map_visualizer.explored_rooms:
+                line += "   "
+            elif room == current_room:
+                line += "[X]"
+            elif room.is_explored:
+                line += "[O]"
+            else:
+                line += "[ ]"
+        lines.append(line)
+    return lines
+
+
+def test_incremental_map_matches_full_render():
+    dungeon = DungeonGenerator.generate_procedural(12, 12, seed=5, monster_chance=0)
+    map_visualizer = MapVisualizer(dungeon)
+    map_visualizer.initialize()
+    rng = random.Random(5)
+    room = dungeon.get_room(ENTRANCE)
+    for _ in range(200):
+        room.explore()
+        assert map_visualizer.generate_map(room) == full_render(map_visualizer, room)
+        _, room = rng.choice(room.get_open_gates())
+
+
+def test_invalidate_rebuilds_rows(visualizer, small_dungeon):
+    entrance = small_dungeon.get_room(ENTRANCE)
+    visualizer.generate_map(entrance)
+    small_dungeon.get_room("Far East").is_visible = True
+    visualizer.invalidate()
+    assert visualizer.generate_map(entrance) == ["[ ]      ", "[X][ ][ ]"]
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from dungeon_adventure.models.characters.dungeon_character import DungeonCharacter
+from dungeon_adventure.services.rng import RandomStream
 from src.dungeon_adventure.models.characters.monster import Monster
 from src.dungeon_adventure.models.items import Item
 
@@ -31,7 +32,7 @@ class TestMonster(unittest.TestCase):
         monster_with_loot = Monster(loot=[item])
         self.assertEqual(monster_with_loot.loot, [item])
 
-    @patch("random.randint")
+    @patch.object(RandomStream, "randint")
     def test_attempt_heal_successful(self, mock_randint):
         mock_randint.side_effect = [
             10,
@@ -42,7 +43,7 @@ class TestMonster(unittest.TestCase):
         self.assertEqual(heal_amount, 10)
         self.assertEqual(self.monster.current_hp, 60)
 
-    @patch("random.randint")
+    @patch.object(RandomStream, "randint")
     def test_attempt_heal_unsuccessful(self, mock_randint):
         mock_randint.return_value = 100  # Higher than heal_chance
         initial_hp = self.monster.current_hp
@@ -0,0 +1,122 @@
+import random
+import sqlite3
+from collections import Counter
+
+import pytest
+
+from dungeon_adventure.data import close_all, database
+from dungeon_adventure.data.content import MONSTER_MIGRATIONS
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.models.characters.monster_templates import (
+    MonsterTemplate,
+    MonsterTemplateRegistry,
+    SpawnTable,
+)
+
+ROWS = [
+    ("Skeleton", 100, 10, 20, 5, 70, 10, 5, 10, 50),
+    ("Gremlin", 70, 15, 30, 5, 80, 20, 10, 20, 100),
+    ("Ogre", 200, 30, 50, 3, 60, 10, 30, 50, 200),
+    ("Skeleton", 1, 1, 1, 1, 1, 1, 1, 1, 1),
+]
+
+
+@pytest.fixture
+def registry(tmp_path):
+    db_path = str(tmp_path / "monsters.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(MONSTER_MIGRATIONS[0])
+        conn.executemany(
+            "INSERT INTO monster_factory_new (name, max_hp, base_min_damage, "
+            "base_max_damage, attack_speed, base_hit_chance, heal_chance, "
+            "min_heal, max_heal, xp_reward) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ROWS,
+        )
+    conn.close()
+    yield MonsterTemplateRegistry(db_path)
+    close_all()
+
+
+def test_first_row_per_name_wins(registry):
+    assert registry.names == ["Skeleton", "Gremlin", "Ogre"]
+    assert registry.get("Skeleton") == MonsterTemplate(*ROWS[0])
+
+
+def test_create_builds_fresh_monsters(registry):
+    ogre = registry.create("Ogre")
+    other = registry.create("Ogre")
+    assert isinstance(ogre, Monster)
+    assert (ogre.max_hp, ogre.base_max_damage, ogre.xp_reward) == (200, 50, 200)
+    assert ogre is not other
+
+
+def test_unknown_monster_falls_back_to_defaults(registry):
+    monster = registry.create("Dragon")
+    assert monster.name == "Dragon"
+    assert monster.max_hp == 20
+
+
+def test_spawning_reads_the_database_once(registry, monkeypatch):
+    connects = []
+    real_connect = sqlite3.connect
+
+    def counting_connect(*args, **kwargs):
+        connects.append(args)
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr(database.sqlite3, "connect", counting_connect)
+    rng = random.Random(3)
+    monsters = [registry.create_random(rng) for _ in range(1000)]
+    assert len(connects) == 1
+    assert {monster.name for monster in monsters} == {"Skeleton", "Gremlin", "Ogre"}
+
+
+def test_reads_tables_without_id_column(tmp_path):
+    db_path = str(tmp_path / "old.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE monster_factory_new (name TEXT, max_hp INTEGER, "
+            "base_min_damage INTEGER, base_max_damage INTEGER, "
+            "attack_speed INTEGER, base_hit_chance INTEGER, heal_chance INTEGER, "
+            "min_heal INTEGER, max_heal INTEGER, xp_reward INTEGER)"
+        )
+        conn.execute(
+            "INSERT INTO monster_factory_new VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ROWS[1],
+        )
+    conn.close()
+    assert MonsterTemplateRegistry(db_path).get("Gremlin") == MonsterTemplate(*ROWS[1])
+    close_all()
+
+
+def test_spawn_table_follows_weights():
+    table = SpawnTable({"Skeleton": 6, "Gremlin": 3, "Ogre": 1, "Dragon": 0})
+    assert table.names == ["Skeleton", "Gremlin", "Ogre"]
+    counts = Counter(table.sample_many(100_000, random.Random(1)))
+    assert counts.keys() == {"Skeleton", "Gremlin", "Ogre"}
+    assert counts["Skeleton"] == pytest.approx(60_000, rel=0.02)
+    assert counts["Gremlin"] == pytest.approx(30_000, rel=0.03)
+    assert counts["Ogre"] == pytest.approx(10_000, rel=0.05)
+
+
+def test_spawn_table_single_draws_match_batches():
+    table = SpawnTable({"Skeleton": 2, "Ogre": 5})
+    rng = random.Random(9)
+    single = [table.sample(rng) for _ in range(1000)]
+    assert single == table.sample_many(1000, random.Random(9))
+
+
+@pytest.mark.parametrize("weights", [{}, {"Ogre": 0}, {"Ogre": 1, "Gremlin": -1}])
+def test_spawn_table_rejects_bad_weights(weights):
+    with pytest.raises(ValueError):
+        SpawnTable(weights)
+
+
+def test_spawn_batch(registry):
+    monsters = registry.spawn_batch(
+        50, SpawnTable({"Ogre": 1, "Dragon": 1}), random.Random(2)
+    )
+    assert len(monsters) == 50
+    assert {monster.name for monster in monsters} == {"Ogre", "Dragon"}
+    ogre = next(monster for monster in monsters if monster.name == "Ogre")
+    assert ogre.max_hp == 200
@@ -0,0 +1,138 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from dungeon_adventure.controllers.combat_controller import (  # noqa: E402
+    CombatController,
+)
+from dungeon_adventure.enums.room_types import Direction, RoomType  # noqa: E402
+from dungeon_adventure.game_model import GameModel  # noqa: E402
+from dungeon_adventure.models.characters.monster import Monster  # noqa: E402
+from dungeon_adventure.models.dungeon.dungeon import Dungeon  # noqa: E402
+from dungeon_adventure.models.items.pillar import (  # noqa: E402
+    AbstractionPillar,
+    EncapsulationPillar,
+    InheritancePillar,
+    PolymorphismPillar,
+)
+from dungeon_adventure.models.player.player import Player  # noqa: E402
+from dungeon_adventure.services.dungeon_generator import (  # noqa: E402
+    ENTRANCE_ROOM_NAME,
+)
+from dungeon_adventure.simulation import (  # noqa: E402
+    ExplorerPolicy,
+    PlaythroughResult,
+    SeedReport,
+    play_dungeon,
+    simulate_playthroughs,
+)
+from dungeon_adventure.simulation.playthrough import SilentView  # noqa: E402
+
+
+@pytest.fixture
+def monster_db(tmp_path):
+    return str(tmp_path / "monsters.db")
+
+
+def small_dungeon(monsters=()):
+    """Entrance, a pit to the east, the pillars beyond it and the exit north."""
+    dungeon = Dungeon()
+    dungeon.add_room(ENTRANCE_ROOM_NAME).room_type = RoomType.ENTRANCE
+    dungeon.add_and_connect_room("Pit", ENTRANCE_ROOM_NAME, Direction.EAST)
+    dungeon.get_room("Pit").room_type = RoomType.PIT
+    vault = dungeon.add_and_connect_room("Vault", "Pit", Direction.EAST)
+    vault.items.extend(
+        pillar(f"pillar-{i}")
+        for i, pillar in enumerate(
+            (
+                AbstractionPillar,
+                EncapsulationPillar,
+                InheritancePillar,
+                PolymorphismPillar,
+            )
+        )
+    )
+    vault.monsters.extend(monsters)
+    exit_room = dungeon.add_and_connect_room(
+        "Exit", ENTRANCE_ROOM_NAME, Direction.NORTH
+    )
+    exit_room.room_type = RoomType.EXIT
+    return dungeon
+
+
+def test_explorer_collects_the_pillars_and_wins():
+    result = play_dungeon(small_dungeon(), dungeon_seed=1)
+    assert result.won
+    assert result.death_room is None
+    assert result.pillar_order == (
+        "Abstraction Pillar",
+        "Encapsulation Pillar",
+        "Inheritance Pillar",
+        "Polymorphism Pillar",
+    )
+    # The exit is found first but needs the pillars: back to the entrance,
+    # through the pit to the vault, back through the pit and out
+    assert result.pit_damage > 0
+    assert result.steps == 7
+
+
+def test_fights_end_and_leave_the_room_empty():
+    dungeon = small_dungeon([Monster("Gremlin", max_hp=1, heal_chance=0)])
+    result = play_dungeon(dungeon)
+    assert result.fights == 1
+    assert result.won
+    assert dungeon.get_room("Vault").monsters == []
+
+
+def test_hero_killed_on_the_monster_turn_ends_the_game():
+    player = Player("Doomed")
+    player.hero.current_hp = 1
+    player.current_room = small_dungeon().get_room("Vault")
+    player.current_room.monsters.append(
+        Monster(
+            "Ogre",
+            max_hp=10_000,
+            base_min_damage=100,
+            base_max_damage=100,
+            base_hit_chance=100,
+            heal_chance=0,
+        )
+    )
+    game_model = GameModel(player, Dungeon())
+    CombatController(game_model, SilentView(ExplorerPolicy())).initiate_combat()
+    assert not player.hero.is_alive
+    assert game_model.is_game_over()
+
+
+def test_same_seeds_same_reports(monster_db):
+    first = simulate_playthroughs([3, 4], 6, workers=1, monster_db_path=monster_db)
+    second = simulate_playthroughs(
+        [3, 4], 6, workers=1, batch_size=4, monster_db_path=monster_db
+    )
+    assert first == second
+    assert list(first) == [3, 4]
+    assert first[3].runs == 6
+
+
+def test_potions_leave_room_for_the_pillars(monster_db):
+    # In these dungeons a hero who fills up on potions early has no room left
+    # for the last pillar and wanders until max_steps
+    reports = simulate_playthroughs(
+        [17, 23], 20, workers=1, monster_db_path=monster_db, width=20, height=15
+    )
+    for report in reports.values():
+        assert report.wins + report.deaths == report.runs
+
+
+def test_seed_report_counts_results():
+    results = [
+        PlaythroughResult(5, 0, True, None, 10, 2, 50, ("A", "B")),
+        PlaythroughResult(5, 1, False, "Room 2", 4, 1, 0, ("A",)),
+        PlaythroughResult(5, 2, False, "Room 2", 6, 1, 100, ()),
+    ]
+    report = SeedReport.from_results(5, results)
+    assert report.completion_rate == pytest.approx(1 / 3)
+    assert report.death_rate == pytest.approx(2 / 3)
+    assert report.deaths_by_room == {"Room 2": 2}
+    assert report.mean_pit_damage == 50
+    assert report.pillar_orders == {("A", "B"): 1, ("A",): 1, (): 1}
@@ -0,0 +1,94 @@
+import pickle
+
+import pytest
+
+from dungeon_adventure.models.characters.hero import Hero
+from dungeon_adventure.models.characters.monster import Monster
+from dungeon_adventure.services import rng
+from dungeon_adventure.services.dungeon_generator import DungeonGenerator
+from dungeon_adventure.services.rng import RandomStream, RandomStreams
+
+
+def draws(stream, n=5):
+    return [stream.random() for _ in range(n)]
+
+
+def test_same_seed_same_streams():
+    first, second = RandomStreams(42), RandomStreams(42)
+    assert draws(first.combat) == draws(second.combat)
+    assert draws(first.loot) == draws(second.loot)
+    assert draws(RandomStreams(43).combat) != draws(RandomStreams(42).combat)
+
+
+def test_streams_are_independent():
+    busy, quiet = RandomStreams(1), RandomStreams(1)
+    draws(busy.loot, 100)
+    draws(busy.stream("combat", 3), 100)
+    assert draws(busy.combat) == draws(quiet.combat)
+    assert draws(busy.combat) != draws(busy.generation)
+
+
+def test_spawned_streams_are_keyed_by_index():
+    stream = RandomStreams(5).combat
+    draws(stream, 10)
+    assert draws(stream.spawn(3)) == draws(RandomStream(5, "combat", 3))
+    assert draws(stream.spawn(3)) != draws(stream.spawn(4))
+    child = RandomStreams(5).spawn(2)
+    assert child.seed == RandomStreams(5).spawn(2).seed != RandomStreams(5).seed
+
+
+def test_batched_draws_stay_in_range():
+    stream = RandomStreams(9).combat
+    values = stream.randints(3, 7, 2000)
+    assert set(values) == {3, 4, 5, 6, 7}
+
+
+def test_numpy_batches_are_reproducible():
+    pytest.importorskip("numpy")
+    first = RandomStreams(9).loot.integers(1, 6, 500)
+    second = RandomStreams(9).loot.integers(1, 6, 500)
+    assert (first == second).all()
+    assert first.min() == 1 and first.max() == 6
+
+
+def test_streams_pickle_with_their_position():
+    stream = RandomStreams(11).combat
+    draws(stream)
+    copy = pickle.loads(pickle.dumps(stream))
+    assert copy.key == stream.key
+    assert draws(copy) == draws(stream)
+
+
+def fight(rounds=50):
+    hero, monster = Hero(), Monster(max_hp=10_000)
+    log = []
+    for _ in range(rounds):
+        log.append((hero.attempt_attack(monster), monster.attempt_attack(hero)))
+    return log, hero.current_hp, monster.current_hp
+
+
+def test_session_replays_combat_exactly():
+    with rng.session(123):
+        first = fight()
+    with rng.session(123):
+        second = fight()
+    assert first == second
+
+
+def test_session_restores_the_previous_one():
+    outer = rng.streams()
+    with rng.session(1) as inner:
+        assert rng.streams() is inner
+        assert rng.combat_stream() is inner.combat
+    assert rng.streams() is outer
+
+
+def test_generation_uses_the_session():
+    def layout():
+        dungeon = DungeonGenerator.generate_procedural(10, 10, monster_chance=0)
+        return sorted((name, room.room_type) for name, room in dungeon.rooms.items())
+
+    with rng.session(8):
+        first = layout()
+    with rng.session(8):
+        assert layout() == first